@@ -0,0 +1,164 @@
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+
+from movies.models import Movie
+from .models import OnboardingMovie
+from .onboarding_service import POOL_SIZE
+
+# 2단계 숨은 영화를 1단계 선택 결과에 맞춰 고르기 위한 특징(장르/연대/감독) 인덱스.
+# 온보딩 풀 전체의 특징을 비트마스크 배열로 미리 계산해 프로세스 메모리에 보관하고,
+# 캐시에 저장된 버전이 바뀌었거나 INDEX_MAX_AGE가 지났을 때 다시 만든다.
+# (버전 변경은 같은 캐시를 보는 프로세스에만 보이므로 프로세스별 캐시에서는 INDEX_MAX_AGE가 상한)
+FEATURE_VERSION_KEY = 'onboarding:features:version'
+INDEX_MAX_AGE = getattr(settings, 'ONBOARDING_CACHE_TIMEOUT', 300)
+DIVERSITY_WEIGHT = 0.5  # 아직 다루지 않은 특징을 포함하는 영화에 주는 가중치
+
+_index_lock = threading.Lock()
+_index = None
+
+
+class FeatureIndex:
+    def __init__(self, version, rows, genre_pairs, director_pairs):
+        self.version = version
+        self.built_at = time.monotonic()
+        self.positions = {}     # movie_id -> 배열 인덱스
+        self.movie_ids = []
+        self.masks = []         # 영화별 특징 비트마스크
+        self.payloads = []      # 응답에 그대로 쓰는 영화 정보
+        self.hidden = []        # 숨은 영화 배열 인덱스 (display_order 순)
+        self.bits = {}          # ('genre', 12) -> 비트 위치
+
+        for movie_type, movie in rows:
+            self.positions[movie.id] = len(self.movie_ids)
+            if movie_type == 'hidden':
+                self.hidden.append(len(self.movie_ids))
+            self.movie_ids.append(movie.id)
+            self.masks.append(self._bit('decade', movie.release_date.year // 10 * 10) if movie.release_date else 0)
+            self.payloads.append(
+                {
+                    'movie_id': movie.id,
+                    'title': movie.title,
+                    'poster_path': movie.poster_path,
+                    'release_date': movie.release_date,
+                    'overview': (
+                        movie.overview[:100] + '...' if movie.overview else ''
+                    ),
+                }
+            )
+
+        for kind, pairs in (('genre', genre_pairs), ('director', director_pairs)):
+            for movie_id, feature_id in pairs:
+                position = self.positions.get(movie_id)
+                if position is not None:
+                    self.masks[position] |= self._bit(kind, feature_id)
+
+    def _bit(self, kind, value):
+        return 1 << self.bits.setdefault((kind, value), len(self.bits))
+
+    def select_hidden(self, favorite_ids, limit=POOL_SIZE):
+        """
+        1단계 선택 영화의 특징 분포를 기준으로 숨은 영화 선택
+
+        - 선호 특징과 절반쯤 겹치는 영화일수록 사용자의 반응이 정보가 되므로 높은 점수
+        - 이미 고른 영화들이 다루지 않은 특징을 가진 영화에 추가 점수 (탐색 범위 분산)
+        """
+        favorites = [self.positions[i] for i in favorite_ids if i in self.positions]
+        if not favorites:
+            return [self.payloads[i] for i in self.hidden[:limit]]
+
+        # 특징별 선호 비율 (선택한 영화 중 해당 특징을 가진 비율)
+        weights = {}
+        for position in favorites:
+            mask = self.masks[position]
+            while mask:
+                low = mask & -mask
+                weights[low] = weights.get(low, 0) + 1
+                mask ^= low
+        total = len(favorites)
+
+        favorite_set = set(favorites)
+        candidates = []
+        for position in self.hidden:
+            if position in favorite_set:
+                continue
+            mask = self.masks[position]
+            count = mask.bit_count()
+            if not count:
+                continue
+            affinity = 0.0
+            remaining = mask
+            while remaining:
+                low = remaining & -remaining
+                affinity += weights.get(low, 0) / total
+                remaining ^= low
+            affinity /= count
+            candidates.append((position, mask, count, affinity * (1 - affinity)))
+
+        selected = []
+        covered = 0
+        while candidates and len(selected) < limit:
+            best, best_score = 0, -1.0
+            for i, (position, mask, count, split) in enumerate(candidates):
+                score = split + DIVERSITY_WEIGHT * (mask & ~covered).bit_count() / count
+                if score > best_score:
+                    best, best_score = i, score
+            position, mask, _, _ = candidates.pop(best)
+            covered |= mask
+            selected.append(self.payloads[position])
+        return selected
+
+
+def _current_version():
+    version = cache.get(FEATURE_VERSION_KEY)
+    if version is None:
+        cache.add(FEATURE_VERSION_KEY, uuid.uuid4().hex, None)
+        version = cache.get(FEATURE_VERSION_KEY)
+    return version
+
+
+def _build_index(version):
+    rows = [
+        (onboarding_movie.movie_type, onboarding_movie.movie)
+        for onboarding_movie in OnboardingMovie.objects.filter(is_active=True)
+        .select_related('movie')
+        .only(
+            'movie_type', 'movie__id', 'movie__title', 'movie__poster_path',
+            'movie__release_date', 'movie__overview',
+        )
+    ]
+    movie_ids = [movie.id for _, movie in rows]
+    genre_pairs = Movie.genres.through.objects.filter(
+        movie_id__in=movie_ids
+    ).values_list('movie_id', 'genre_id')
+    director_pairs = Movie.directors.through.objects.filter(
+        movie_id__in=movie_ids
+    ).values_list('movie_id', 'director_id')
+    return FeatureIndex(version, rows, genre_pairs, director_pairs)
+
+
+def _is_current(index, version):
+    return (
+        index is not None and index.version == version
+        and time.monotonic() - index.built_at < INDEX_MAX_AGE
+    )
+
+
+def get_feature_index():
+    global _index
+    version = _current_version()
+    index = _index
+    if not _is_current(index, version):
+        with _index_lock:
+            if not _is_current(_index, version):
+                _index = _build_index(version)
+            index = _index
+    return index
+
+
+def invalidate_feature_index():
+    """온보딩 풀이 바뀌면 버전을 바꿔 같은 캐시를 보는 프로세스가 인덱스를 다시 만들도록 함"""
+    cache.set(FEATURE_VERSION_KEY, uuid.uuid4().hex, None)
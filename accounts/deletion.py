@@ -0,0 +1,158 @@
+import threading
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.db.models.functions import Greatest
+
+from movies.models import Movie, Actor, Director, MovieReview, UserPreference, LikeActivity
+from posts.models import Post, Comment
+from posts.tags import recount_tags
+from .models import (
+    User, AccountDeletion, Follow, FeedEntry, Notification, OnboardingStep, UserMoviePreference,
+    UserGenreExclusion, GPTRecommendation, GPTRecommendedMovie,
+)
+
+# 탈퇴 계정 정리 설정
+PURGE_CHUNK_SIZE = getattr(settings, 'ACCOUNT_PURGE_CHUNK_SIZE', 500)
+PURGE_CHUNK_PAUSE = getattr(settings, 'ACCOUNT_PURGE_CHUNK_PAUSE', 0.05)  # 청크 사이 대기(초) - 다른 쓰기 요청에 락 양보
+
+# (단계 이름, 모델, 사용자 id -> 삭제 대상 조건)
+# 다른 행이 참조하는 행(다른 사용자의 좋아요/태그 연결 -> 대댓글 -> 댓글 -> 게시글)보다 참조하는 쪽을 먼저 지워
+# 청크 하나가 연쇄 삭제로 커지지 않도록 순서를 정한다.
+# 각 단계는 남은 행을 다시 조회해서 지우므로 중간에 멈췄다가 다시 실행해도 안전하다.
+PURGE_STAGES = [
+    ('comment_likes', Comment.like_users.through, lambda uid: Q(user_id=uid)),
+    ('post_likes', Post.like_users.through, lambda uid: Q(user_id=uid)),
+    ('movie_likes', Movie.liked_by.through, lambda uid: Q(user_id=uid)),
+    ('movie_reviewed', Movie.reviewed_by.through, lambda uid: Q(user_id=uid)),
+    ('actor_likes', Actor.liked_by.through, lambda uid: Q(user_id=uid)),
+    ('actor_reviewed', Actor.reviewed_by.through, lambda uid: Q(user_id=uid)),
+    ('director_likes', Director.liked_by.through, lambda uid: Q(user_id=uid)),
+    ('director_reviewed', Director.reviewed_by.through, lambda uid: Q(user_id=uid)),
+    ('like_activities', LikeActivity, lambda uid: Q(user_id=uid)),
+    ('feed_entries', FeedEntry, lambda uid: Q(owner_id=uid) | Q(author_id=uid)),
+    ('notifications', Notification, lambda uid: Q(recipient_id=uid) | Q(post__user_id=uid)),
+    # 내 게시글/댓글에 달린 다른 사람의 좋아요와 내 게시글의 태그 연결
+    ('own_post_likes', Post.like_users.through, lambda uid: Q(post__user_id=uid)),
+    ('own_comment_likes', Comment.like_users.through,
+     lambda uid: Q(comment__user_id=uid) | Q(comment__post__user_id=uid) | Q(comment__parent__user_id=uid)),
+    ('post_tags', Post.tags.through, lambda uid: Q(post__user_id=uid)),
+    # 내 게시글/댓글에 달린 다른 사람의 대댓글, 댓글부터 정리
+    ('post_replies', Comment, lambda uid: Q(post__user_id=uid, parent__isnull=False)),
+    ('comment_replies', Comment, lambda uid: Q(parent__user_id=uid)),
+    ('post_comments', Comment, lambda uid: Q(post__user_id=uid)),
+    ('replies', Comment, lambda uid: Q(user_id=uid, parent__isnull=False)),
+    ('comments', Comment, lambda uid: Q(user_id=uid)),
+    ('posts', Post, lambda uid: Q(user_id=uid)),
+    ('reviews', MovieReview, lambda uid: Q(user_id=uid)),
+    ('follows', Follow, lambda uid: Q(follower_id=uid) | Q(following_id=uid)),
+    ('movie_preferences', UserMoviePreference, lambda uid: Q(user_id=uid)),
+    ('genre_exclusions', UserGenreExclusion, lambda uid: Q(user_id=uid)),
+    ('recommended_movies', GPTRecommendedMovie, lambda uid: Q(recommendation__user_id=uid)),
+    ('recommendation', GPTRecommendation, lambda uid: Q(user_id=uid)),
+    ('onboarding_step', OnboardingStep, lambda uid: Q(user_id=uid)),
+    ('user_preference', UserPreference, lambda uid: Q(user_id=uid)),
+]
+STAGE_NAMES = [name for name, _, _ in PURGE_STAGES]
+
+
+# 좋아요 연결 행을 지울 때 같은 트랜잭션에서 줄일 좋아요 수 (연결 모델 -> (대상 모델, 대상 id 컬럼))
+LIKE_COUNTERS = {
+    Post.like_users.through: (Post, 'post_id'),
+    Comment.like_users.through: (Comment, 'comment_id'),
+}
+# 연결 행을 지운 뒤 같은 트랜잭션에서 다시 계산할 집계 (연결 모델 -> (대상 id 컬럼, 재계산 함수))
+RECOUNTS = {
+    Post.tags.through: ('tag_id', recount_tags),
+}
+
+
+def _decrement_likes(model, target_ids):
+    """대상별로 지운 좋아요 수만큼 like_count 감소 (내 게시글의 좋아요는 대상 하나에 여러 행)"""
+    by_amount = defaultdict(list)
+    for target_id, amount in Counter(target_ids).items():
+        by_amount[amount].append(target_id)
+    for amount, ids in by_amount.items():
+        model.objects.filter(pk__in=ids).update(like_count=Greatest(F('like_count') - amount, 0))
+
+
+def _delete_chunk(model, condition, chunk_size):
+    """조건에 맞는 행을 최대 chunk_size개만 한 트랜잭션에서 삭제 - 삭제한 행 수 반환"""
+    counter = LIKE_COUNTERS.get(model)
+    recount = RECOUNTS.get(model)
+    target = counter[1] if counter else recount[0] if recount else None
+    fields = ['pk', target] if target else ['pk']
+    with transaction.atomic():
+        rows = list(
+            model.objects.filter(condition)
+            .order_by('pk')
+            .values_list(*fields)[:chunk_size]
+        )
+        if not rows:
+            return 0
+        model.objects.filter(pk__in=[row[0] for row in rows]).delete()
+        if counter:
+            _decrement_likes(counter[0], [row[1] for row in rows])
+        if recount:
+            recount[1]({row[1] for row in rows})
+    return len(rows)
+
+
+def purge_account(job, chunk_size=PURGE_CHUNK_SIZE, pause=PURGE_CHUNK_PAUSE):
+    """
+    탈퇴 계정의 관련 데이터를 청크 단위로 삭제
+
+    job.stage에 기록된 단계부터 이어서 진행하며, 마지막에 사용자 행을 삭제한다.
+    (사용자 삭제 시 job 행도 CASCADE로 함께 삭제됨)
+    """
+    user_id = job.user_id
+    start = STAGE_NAMES.index(job.stage) if job.stage in STAGE_NAMES else 0
+
+    for name, model, condition in PURGE_STAGES[start:]:
+        if job.stage != name:
+            job.stage = name
+            job.save(update_fields=['stage', 'updated_at'])
+
+        while True:
+            deleted = _delete_chunk(model, condition(user_id), chunk_size)
+            if not deleted:
+                break
+            AccountDeletion.objects.filter(pk=job.pk).update(
+                deleted_rows=F('deleted_rows') + deleted
+            )
+            if pause:
+                time.sleep(pause)
+
+    # 남은 관계(토큰, 소셜 계정 등)는 적으므로 기본 삭제로 처리
+    User.objects.filter(id=user_id).delete()
+
+
+def _run_purge(user_id):
+    try:
+        job = AccountDeletion.objects.filter(user_id=user_id).first()
+        if job:
+            purge_account(job)
+    except Exception as e:
+        # 실패한 작업은 job 행이 남아 있으므로 purge_deleted_accounts 명령으로 재개
+        print(f"❌ 계정 정리 오류 (user_id={user_id}): {str(e)}")
+    finally:
+        connection.close()
+
+
+def request_account_deletion(user):
+    """
+    계정을 즉시 비활성화하고 관련 데이터 정리를 백그라운드로 예약
+    """
+    with transaction.atomic():
+        user.is_active = False
+        user.save(update_fields=['is_active'])
+        AccountDeletion.objects.get_or_create(user=user)
+
+    transaction.on_commit(
+        lambda: threading.Thread(
+            target=_run_purge, args=(user.id,), daemon=True
+        ).start()
+    )
@@ -0,0 +1,128 @@
+import zipfile
+
+from django.utils import timezone
+
+from cinemamemory.streaming import STREAM_CHUNK_SIZE, to_json_line
+from movies.models import Movie, Actor, Director, MovieReview, UserPreference, LikeActivity
+from posts.models import Post, Comment
+from .models import (
+    User, Follow, Notification, OnboardingStep, UserMoviePreference, UserGenreExclusion,
+    GPTRecommendation, GPTRecommendedMovie,
+)
+
+# 개인 데이터 내보내기
+# 테이블마다 values().iterator(chunk_size)로 읽어 한 줄씩 내보내므로
+# 행 수와 관계없이 메모리는 청크 하나 분량만 쓰고, 첫 바이트는 바로 나간다.
+# (이름, 사용자 -> values() 쿼리셋)
+EXPORT_TABLES = [
+    ('profile', lambda user: User.objects.filter(pk=user.pk).values(
+        'id', 'username', 'email', 'first_name', 'last_name', 'birth', 'profile_image',
+        'onboarding_completed', 'taste_analysis', 'date_joined', 'last_login',
+    )),
+    ('posts', lambda user: Post.objects.filter(user=user).order_by('id').values(
+        'id', 'title', 'content', 'created_at', 'updated_at',
+    )),
+    ('post_tags', lambda user: Post.tags.through.objects.filter(post__user=user).order_by('id').values(
+        'post_id', 'tag__name',
+    )),
+    ('comments', lambda user: Comment.objects.filter(user=user).order_by('id').values(
+        'id', 'post_id', 'parent_id', 'content', 'created_at', 'updated_at',
+    )),
+    ('movie_reviews', lambda user: MovieReview.objects.filter(user=user).order_by('id').values(
+        'id', 'movie_id', 'movie__title', 'content', 'rating', 'created_at', 'updated_at',
+    )),
+    ('liked_posts', lambda user: Post.like_users.through.objects.filter(user=user).order_by('id').values(
+        'post_id', 'post__title',
+    )),
+    ('liked_comments', lambda user: Comment.like_users.through.objects.filter(user=user).order_by('id').values(
+        'comment_id', 'comment__post_id',
+    )),
+    ('liked_movies', lambda user: Movie.liked_by.through.objects.filter(user=user).order_by('id').values(
+        'movie_id', 'movie__title',
+    )),
+    ('liked_actors', lambda user: Actor.liked_by.through.objects.filter(user=user).order_by('id').values(
+        'actor_id', 'actor__name',
+    )),
+    ('liked_directors', lambda user: Director.liked_by.through.objects.filter(user=user).order_by('id').values(
+        'director_id', 'director__name',
+    )),
+    ('like_activities', lambda user: LikeActivity.objects.filter(user=user).order_by('id').values(
+        'target_type', 'target_id', 'created_at',
+    )),
+    ('following', lambda user: Follow.objects.filter(follower=user).order_by('id').values(
+        'following_id', 'following__username', 'created_at',
+    )),
+    ('followers', lambda user: Follow.objects.filter(following=user).order_by('id').values(
+        'follower_id', 'follower__username', 'created_at',
+    )),
+    ('notifications', lambda user: Notification.objects.filter(recipient=user).order_by('id').values(
+        'verb', 'target_id', 'post_id', 'actor_ids', 'actor_count', 'is_read', 'created_at', 'updated_at',
+    )),
+    ('onboarding_step', lambda user: OnboardingStep.objects.filter(user=user).values(
+        'current_step', 'step_data', 'created_at', 'updated_at',
+    )),
+    ('movie_preferences', lambda user: UserMoviePreference.objects.filter(user=user).order_by('id').values(
+        'movie_id', 'movie__title', 'preference_type', 'created_at',
+    )),
+    ('genre_exclusions', lambda user: UserGenreExclusion.objects.filter(user=user).order_by('id').values(
+        'genre_id', 'genre__name', 'created_at',
+    )),
+    ('user_preference', lambda user: UserPreference.objects.filter(user=user).values(
+        'analysis_result', 'preferred_genres', 'preferred_decades', 'storytelling_preference',
+        'tone_preference', 'recommendation_keywords', 'is_analyzed', 'analyzed_at',
+    )),
+    ('recommendation', lambda user: GPTRecommendation.objects.filter(user=user).values(
+        'taste_summary', 'created_at', 'updated_at',
+    )),
+    ('recommended_movies', lambda user: GPTRecommendedMovie.objects.filter(
+        recommendation__user=user
+    ).order_by('recommendation_order').values(
+        'movie_id', 'movie__title', 'reason', 'recommendation_order', 'target_age',
+    )),
+]
+
+
+def _rows(user, chunk_size):
+    for name, queryset in EXPORT_TABLES:
+        for row in queryset(user).iterator(chunk_size=chunk_size):
+            yield name, row
+
+
+def export_records(user, chunk_size=STREAM_CHUNK_SIZE):
+    """{"table": 이름, "data": 행} 딕셔너리를 하나씩 (ndjson_response로 한 줄씩 내보냄)"""
+    yield {'table': 'export', 'data': {'exported_at': timezone.now()}}
+    for name, row in _rows(user, chunk_size):
+        yield {'table': name, 'data': row}
+
+
+class _StreamBuffer:
+    """zipfile이 쓰는 바이트를 모아 두었다가 꺼내 가는 쓰기 전용(탐색 불가) 버퍼"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def export_zip(user, chunk_size=STREAM_CHUNK_SIZE):
+    """테이블별 <이름>.ndjson 파일을 담은 zip - 탐색 불가 스트림으로 바로 압축해 내보냄"""
+    buffer = _StreamBuffer()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, queryset in EXPORT_TABLES:
+            with archive.open(f'{name}.ndjson', 'w', force_zip64=True) as entry:
+                for i, row in enumerate(queryset(user).iterator(chunk_size=chunk_size), 1):
+                    entry.write(to_json_line(row).encode('utf-8'))
+                    if i % chunk_size == 0:
+                        yield buffer.drain()
+            yield buffer.drain()
+    yield buffer.drain()
@@ -0,0 +1,318 @@
+import datetime
+import heapq
+import threading
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from movies.models import Movie, Actor, Director, MovieReview, LikeActivity
+from posts.models import Post
+from cinemamemory.pagination import InvalidCursor, parse_cursor_datetime
+from .models import User, Follow, FeedEntry
+
+# 팔로잉 피드 설정
+# 기본은 읽기 시점 병합(fan-out-on-read): 팔로잉한 사용자의 게시글/리뷰/좋아요를
+# 소스별 키셋 커서로 한 페이지씩 읽고 힙으로 시간순 병합한다.
+# 팔로워가 FANOUT_FOLLOWER_THRESHOLD 이상인 사용자는 활동을 작성 시점에
+# 팔로워별 FeedEntry로 펼쳐 두고(fan-out-on-write), 읽기 시점 쿼리에서는 펼치기 시작한 시각
+# (feed_fanout_since) 이후의 활동만 제외한다 - 그 이전 활동은 계속 원본 테이블에서 읽는다.
+FANOUT_FOLLOWER_THRESHOLD = getattr(settings, 'FEED_FANOUT_FOLLOWER_THRESHOLD', 10000)
+FANOUT_RELEASE_RATIO = 0.8  # 팔로워가 기준의 80% 아래로 줄면 다시 읽기 시점 병합으로 전환
+FANOUT_CHUNK_SIZE = 1000
+FANOUT_FLAG_KEY = 'feed:fanout:{}'
+FANOUT_FLAG_TIMEOUT = 60  # 작성자별 feed_fanout_since 캐시 (전환 시 즉시 갱신, 다른 프로세스는 최대 이 시간 늦음)
+
+SOURCE_MODELS = {
+    'post': Post,
+    'review': MovieReview,
+    'like': LikeActivity,
+}
+LIKE_TARGET_MODELS = {
+    'movie': Movie,
+    'actor': Actor,
+    'director': Director,
+}
+
+
+def _source_querysets(user):
+    followees = Follow.objects.filter(follower=user).values('following_id')
+    # 펼침 대상 작성자는 펼치기 전 활동만 (이후 활동은 inbox에 있음)
+    pulled = Q(user__in=followees) & (
+        Q(user__feed_fanout=False) | Q(created_at__lt=F('user__feed_fanout_since'))
+    )
+    return {
+        'post': Post.objects.filter(pulled).select_related('user'),
+        'review': MovieReview.objects.filter(pulled).select_related('user', 'movie'),
+        'like': LikeActivity.objects.filter(pulled).select_related('user'),
+        'inbox': FeedEntry.objects.filter(owner=user),
+    }
+
+
+def _before(queryset, position):
+    """(created_at, id) 내림차순 키셋 - position 보다 이전 행만"""
+    if position:
+        try:
+            created_at, pk = position
+            pk = int(pk)
+        except (TypeError, ValueError):
+            raise InvalidCursor('잘못된 피드 커서입니다.')
+        created_at = parse_cursor_datetime(created_at)
+        queryset = queryset.filter(
+            Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+        )
+    return queryset.order_by('-created_at', '-id')
+
+
+def _hydrate_inbox(entries):
+    """펼쳐 둔 항목을 원본 객체로 변환 - 소스별로 한 번씩 조회"""
+    ids = {}
+    for entry in entries:
+        ids.setdefault(entry.source, []).append(entry.object_id)
+    objects = {
+        'post': Post.objects.select_related('user').in_bulk(ids.get('post', [])),
+        'review': MovieReview.objects.select_related('user', 'movie').in_bulk(ids.get('review', [])),
+        'like': LikeActivity.objects.select_related('user').in_bulk(ids.get('like', [])),
+    }
+    return {
+        entry.id: (entry.source, objects[entry.source].get(entry.object_id))
+        for entry in entries
+    }
+
+
+def _like_targets(likes):
+    ids = {}
+    for like in likes:
+        ids.setdefault(like.target_type, []).append(like.target_id)
+    return {
+        target_type: model.objects.in_bulk(ids.get(target_type, []))
+        for target_type, model in LIKE_TARGET_MODELS.items()
+    }
+
+
+def _actor(user):
+    return {'id': user.id, 'username': user.username}
+
+
+def _serialize(source, obj, like_targets):
+    if source == 'post':
+        return {
+            'type': 'post',
+            'actor': _actor(obj.user),
+            'post': {
+                'id': obj.id,
+                'title': obj.title,
+                'content': obj.content[:100] + '...' if len(obj.content) > 100 else obj.content,
+            },
+            'created_at': obj.created_at,
+        }
+    if source == 'review':
+        return {
+            'type': 'review',
+            'actor': _actor(obj.user),
+            'review': {'id': obj.id, 'content': obj.content, 'rating': obj.rating},
+            'movie': {
+                'id': obj.movie.id,
+                'title': obj.movie.title,
+                'poster_path': obj.movie.poster_path,
+            },
+            'created_at': obj.created_at,
+        }
+    target = like_targets[obj.target_type].get(obj.target_id)
+    if target is None:
+        return None
+    if obj.target_type == 'movie':
+        target_data = {'id': target.id, 'title': target.title, 'poster_path': target.poster_path}
+    else:
+        target_data = {'id': target.id, 'name': target.name, 'profile_path': target.profile_path}
+    return {
+        'type': 'like',
+        'actor': _actor(obj.user),
+        'target_type': obj.target_type,
+        'target': target_data,
+        'created_at': obj.created_at,
+    }
+
+
+def build_feed(user, cursor, limit):
+    """
+    팔로잉 피드 한 페이지 생성
+
+    cursor: {소스 이름: [created_at, id]} - 소스별로 마지막으로 내려준 위치
+    반환: (항목 리스트, 다음 커서 또는 None)
+    쿼리 수는 팔로잉 수와 관계없이 소스 4개 + 원본/좋아요 대상 조회로 고정
+    """
+    cursor = cursor or {}
+    if not isinstance(cursor, dict):
+        raise InvalidCursor('잘못된 피드 커서입니다.')
+
+    rows = {}
+    for name, queryset in _source_querysets(user).items():
+        rows[name] = list(_before(queryset, cursor.get(name))[:limit + 1])
+
+    # 각 소스는 이미 (created_at, id) 내림차순이므로 힙으로 k-way 병합
+    merged = heapq.merge(
+        *[[(row.created_at, row.id, name, row) for row in source_rows] for name, source_rows in rows.items()],
+        key=lambda item: (item[0], item[1]),
+        reverse=True,
+    )
+    page = []
+    for item in merged:
+        if len(page) == limit:
+            break
+        page.append(item)
+
+    inbox = _hydrate_inbox([row for _, _, name, row in page if name == 'inbox'])
+
+    resolved = []
+    seen = set()
+    for created_at, pk, name, row in page:
+        source, obj = inbox[row.id] if name == 'inbox' else (name, row)
+        if obj is None or (source, obj.id) in seen:
+            continue
+        seen.add((source, obj.id))
+        resolved.append((source, obj))
+
+    like_targets = _like_targets([obj for source, obj in resolved if source == 'like'])
+    items = [
+        item for item in (_serialize(source, obj, like_targets) for source, obj in resolved)
+        if item is not None
+    ]
+
+    # 소스별 다음 커서 - 이번 페이지에서 소비한 마지막 행 (소비하지 않았으면 기존 위치 유지)
+    next_cursor = dict(cursor)
+    for created_at, pk, name, row in page:
+        next_cursor[name] = [created_at.isoformat(), pk]
+    consumed = {}
+    for _, _, name, _ in page:
+        consumed[name] = consumed.get(name, 0) + 1
+    has_next = any(len(source_rows) > consumed.get(name, 0) for name, source_rows in rows.items())
+
+    return items, next_cursor if has_next else None
+
+
+# ---- fan-out-on-write ----
+
+def _run_in_background(target, *args):
+    def run():
+        try:
+            target(*args)
+        except Exception as e:
+            print(f"❌ 피드 처리 오류: {str(e)}")
+        finally:
+            connection.close()
+
+    transaction.on_commit(lambda: threading.Thread(target=run, daemon=True).start())
+
+
+def _write_entries(owner_ids, author_id, items):
+    """items: [(source, object_id, created_at)] 를 owner_ids 각각의 피드에 청크 단위로 저장"""
+    batch = []
+    for owner_id in owner_ids:
+        for source, object_id, created_at in items:
+            batch.append(
+                FeedEntry(
+                    owner_id=owner_id, author_id=author_id, source=source,
+                    object_id=object_id, created_at=created_at,
+                )
+            )
+            if len(batch) >= FANOUT_CHUNK_SIZE:
+                FeedEntry.objects.bulk_create(batch, ignore_conflicts=True)
+                batch = []
+    if batch:
+        FeedEntry.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+def _follower_ids(author_id):
+    return Follow.objects.filter(following_id=author_id).values_list(
+        'follower_id', flat=True
+    ).iterator(chunk_size=FANOUT_CHUNK_SIZE)
+
+
+def _items_since(author_id, since):
+    """since 이후 활동 - 새 팔로워 피드에 채워 넣을 항목 (그 이전은 읽기 시점 병합이 가져옴)"""
+    items = []
+    for source, model in SOURCE_MODELS.items():
+        items.extend(
+            (source, pk, created_at)
+            for pk, created_at in model.objects.filter(user_id=author_id, created_at__gte=since)
+            .values_list('id', 'created_at')
+            .iterator(chunk_size=FANOUT_CHUNK_SIZE)
+        )
+    return items
+
+
+def _delete_entries(queryset):
+    while True:
+        pks = list(queryset.values_list('pk', flat=True)[:FANOUT_CHUNK_SIZE])
+        if not pks:
+            break
+        FeedEntry.objects.filter(pk__in=pks).delete()
+
+
+def fanout_since(user_id):
+    """작성자의 feed_fanout_since (펼침 대상이 아니면 None) - 활동 행마다 작성자를 조회하지 않도록 캐시"""
+    key = FANOUT_FLAG_KEY.format(user_id)
+    since = cache.get(key)
+    if since is None:
+        since = User.objects.filter(id=user_id, feed_fanout=True).values_list(
+            'feed_fanout_since', flat=True
+        ).first() or False
+        cache.set(key, since, FANOUT_FLAG_TIMEOUT)
+    return since or None
+
+
+def _set_fanout(user, since):
+    User.objects.filter(id=user.id).update(feed_fanout=since is not None, feed_fanout_since=since)
+    user.feed_fanout = since is not None
+    user.feed_fanout_since = since
+    cache.set(FANOUT_FLAG_KEY.format(user.id), since or False, FANOUT_FLAG_TIMEOUT)
+
+
+def _should_fan_out(obj):
+    # 펼치기 시작하기 전 활동은 읽기 시점 병합에 남아 있으므로 펼치지 않음
+    since = fanout_since(obj.user_id)
+    return since is not None and obj.created_at >= since
+
+
+def fan_out(source, obj):
+    """팔로워가 많은 사용자의 새 활동을 팔로워 피드에 펼침 (백그라운드)"""
+    if not _should_fan_out(obj):
+        return
+    _run_in_background(
+        lambda: _write_entries(
+            _follower_ids(obj.user_id), obj.user_id, [(source, obj.id, obj.created_at)]
+        )
+    )
+
+
+def retract(source, obj):
+    """삭제된 활동을 펼쳐 둔 피드에서 제거 (백그라운드)"""
+    if not _should_fan_out(obj):
+        return
+    _run_in_background(
+        _delete_entries, FeedEntry.objects.filter(source=source, object_id=obj.id)
+    )
+
+
+def on_follow(follower, target):
+    """팔로우 직후 호출 - 펼침 대상 사용자면 펼치기 시작한 뒤의 활동을 새 팔로워 피드에 채워 넣음"""
+    if target.feed_fanout:
+        _write_entries([follower.id], target.id, _items_since(target.id, target.feed_fanout_since))
+        return
+    if Follow.objects.filter(following=target).count() >= FANOUT_FOLLOWER_THRESHOLD:
+        # 다른 프로세스의 캐시가 갱신될 때까지 생기는 활동은 펼치지 않고 읽기 시점 병합에 남긴다
+        since = timezone.now() + datetime.timedelta(seconds=FANOUT_FLAG_TIMEOUT)
+        _set_fanout(target, since)
+
+
+def on_unfollow(follower, target):
+    """언팔로우 직후 호출 - 펼쳐 둔 항목을 정리하고 필요하면 읽기 시점 병합으로 복귀"""
+    if not target.feed_fanout:
+        return
+    _delete_entries(FeedEntry.objects.filter(owner=follower, author=target))
+    if Follow.objects.filter(following=target).count() < FANOUT_FOLLOWER_THRESHOLD * FANOUT_RELEASE_RATIO:
+        _set_fanout(target, None)
+        _run_in_background(_delete_entries, FeedEntry.objects.filter(author_id=target.id))
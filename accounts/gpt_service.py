@@ -9,7 +9,11 @@ from movies.models import Movie
 
 class GPTRecommendationService:
     def __init__(self):
-        self.client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+        # OPENAI_BASE_URL을 지정하면 호환 서버(부하 테스트용 스텁 등)로 요청
+        self.client = openai.OpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            base_url=getattr(settings, 'OPENAI_BASE_URL', None) or None,
+        )
 
     def generate_recommendations(
         self, user, favorite_movies, interesting_movies, excluded_genres
@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from accounts.deletion import purge_account, PURGE_CHUNK_SIZE, PURGE_CHUNK_PAUSE
+from accounts.models import AccountDeletion
+
+
+class Command(BaseCommand):
+    help = '중단된 탈퇴 계정 정리 작업을 마지막 단계부터 이어서 진행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=PURGE_CHUNK_SIZE)
+        parser.add_argument('--pause', type=float, default=PURGE_CHUNK_PAUSE)
+
+    def handle(self, *args, **options):
+        jobs = AccountDeletion.objects.order_by('requested_at')
+        for job in jobs:
+            self.stdout.write(f'user_id={job.user_id} 정리 재개 (단계: {job.stage or "처음"})')
+            purge_account(job, chunk_size=options['chunk_size'], pause=options['pause'])
+        self.stdout.write(self.style.SUCCESS('탈퇴 계정 정리가 완료되었습니다.'))
@@ -1,5 +1,6 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser
+from django.utils import timezone
 import uuid
 import os
 
@@ -24,6 +25,11 @@ class User(AbstractUser):
     # GPT가 생성한 사용자 취향 분석 텍스트
     taste_analysis = models.TextField(null=True, blank=True)
 
+    # 팔로워가 많아 활동을 작성 시점에 팔로워 피드로 펼쳐 두는 사용자인지 여부
+    feed_fanout = models.BooleanField(default=False)
+    # 펼치기 시작한 시각 - 이보다 이전 활동은 계속 읽기 시점 병합으로 가져온다
+    feed_fanout_since = models.DateTimeField(null=True, blank=True)
+
 
     def user_profile_image_path(instance, filename):
         ext = filename.split('.')[-1]
@@ -184,4 +190,83 @@ class Follow(models.Model):
         unique_together = ('follower', 'following')
         
     def __str__(self):
-        return f"{self.follower.username} follows {self.following.username}"
\ No newline at end of file
+        return f"{self.follower.username} follows {self.following.username}"
+
+class AccountDeletion(models.Model):  # 탈퇴 계정의 관련 데이터 정리 진행 상황
+    user = models.OneToOneField(
+        User, on_delete=models.CASCADE, related_name='deletion'
+    )
+    stage = models.CharField(max_length=50, blank=True)  # 마지막으로 처리 중이던 정리 단계
+    deleted_rows = models.PositiveIntegerField(default=0)  # 지금까지 삭제한 행 수
+    requested_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.user.username} 탈퇴 처리 중 ({self.stage or '대기'})"
+
+
+class FeedEntry(models.Model):  # 팔로워가 많은 사용자의 활동을 팔로워별로 미리 펼쳐 둔 피드 항목
+    SOURCE_CHOICES = [
+        ('post', '게시글'),
+        ('review', '영화 리뷰'),
+        ('like', '좋아요'),
+    ]
+
+    owner = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name='feed_entries'
+    )
+    author = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name='+'
+    )
+    source = models.CharField(max_length=10, choices=SOURCE_CHOICES)
+    object_id = models.BigIntegerField()  # 게시글/리뷰/좋아요 기록 id
+    created_at = models.DateTimeField()  # 원본 활동 시각
+
+    class Meta:
+        unique_together = ['source', 'object_id', 'owner']
+        indexes = [models.Index(fields=['owner', 'created_at', 'id'])]
+
+    def __str__(self):
+        return f"{self.owner.username} <- {self.source} {self.object_id}"
+
+
+
+class Notification(models.Model):  # 같은 대상에 대한 연속 알림을 읽기 전까지 한 행으로 묶은 알림
+    VERB_CHOICES = [
+        ('follow', '팔로우'),
+        ('post_like', '게시글 좋아요'),
+        ('comment_like', '댓글 좋아요'),
+        ('comment', '게시글 댓글'),
+        ('reply', '댓글 답글'),
+    ]
+
+    recipient = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name='notifications'
+    )
+    verb = models.CharField(max_length=20, choices=VERB_CHOICES)
+    target_id = models.BigIntegerField(default=0)  # 게시글/댓글 id (팔로우는 0)
+    post = models.ForeignKey(
+        'posts.Post', on_delete=models.CASCADE, null=True, blank=True, related_name='+'
+    )
+    actor_ids = models.JSONField(default=list)  # 최근 행위자 id (최신순, 중복 판별용으로 일부만 보관)
+    actor_count = models.PositiveIntegerField(default=1)  # 묶인 행위자 수
+    is_read = models.BooleanField(default=False)
+    created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(default=timezone.now)  # 마지막으로 묶인 시각 (목록 정렬 기준)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['recipient', 'updated_at', 'id']),
+            models.Index(fields=['recipient', 'is_read']),  # 읽지 않은 알림 수 (accounts.notifications.unread_count)
+        ]
+        constraints = [
+            # 읽지 않은 알림은 (받는 사람, 종류, 대상)마다 한 행
+            models.UniqueConstraint(
+                fields=['recipient', 'verb', 'target_id'],
+                condition=models.Q(is_read=False),
+                name='unique_unread_notification',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.recipient.username} <- {self.verb} {self.target_id} ({self.actor_count}명)"
@@ -0,0 +1,172 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from cinemamemory.cache import is_shared_cache
+from cinemamemory.pagination import paginate_keyset
+from .models import User, Notification
+
+# 알림함
+# 알림은 (받는 사람, 종류, 대상)마다 읽지 않은 행을 하나만 두고, 같은 대상에 대한
+# 행위가 이어지면 새 행 대신 그 행의 행위자 수/최근 행위자/시각만 갱신한다.
+# ("A님 외 37명이 회원님의 게시글을 좋아합니다.") 읽음 처리된 뒤의 행위는 새 행으로 시작한다.
+# 읽지 않은 알림 수는 캐시에 두고 새 행이 생길 때 증가, 읽음 처리/삭제 시 무효화한다.
+# 증가/무효화는 같은 캐시를 보는 프로세스에만 전달되므로 프로세스별 캐시(LocMem)에서는
+# 짧게만 보관하고 (recipient, is_read) 인덱스 COUNT로 다시 센다.
+RECENT_ACTORS = 3  # 응답에 보여 줄 최근 행위자 수
+ACTOR_HISTORY = 50  # 같은 사람의 반복 행위(좋아요 취소 후 다시 좋아요 등)를 한 번으로 셀 최근 행위자 수
+UNREAD_CACHE_KEY = 'notifications:unread:{}'
+UNREAD_CACHE_TIMEOUT = (
+    getattr(settings, 'NOTIFICATION_UNREAD_CACHE_TIMEOUT', 60 * 60 * 24) if is_shared_cache()
+    else getattr(settings, 'NOTIFICATION_UNREAD_LOCAL_CACHE_TIMEOUT', 10)
+)
+NOTIFICATION_ORDERING = ('updated_at', 'id')
+
+MESSAGES = {
+    'follow': '회원님을 팔로우했습니다.',
+    'post_like': '회원님의 게시글을 좋아합니다.',
+    'comment_like': '회원님의 댓글을 좋아합니다.',
+    'comment': '회원님의 게시글에 댓글을 남겼습니다.',
+    'reply': '회원님의 댓글에 답글을 남겼습니다.',
+}
+
+
+# ---- 읽지 않은 알림 수 ----
+
+def unread_count(user_id):
+    key = UNREAD_CACHE_KEY.format(user_id)
+    count = cache.get(key)
+    if count is None:
+        count = Notification.objects.filter(recipient_id=user_id, is_read=False).count()
+        cache.set(key, count, UNREAD_CACHE_TIMEOUT)
+    return count
+
+
+def _increment_unread(user_id):
+    try:
+        cache.incr(UNREAD_CACHE_KEY.format(user_id))
+    except ValueError:
+        # 캐시에 없으면 다음 조회 때 다시 셈
+        pass
+
+
+def invalidate_unread(user_id):
+    cache.delete(UNREAD_CACHE_KEY.format(user_id))
+
+
+# ---- 알림 생성 ----
+
+def _merge(notification, actor_id, now):
+    """기존 묶음에 행위자 추가 - 이미 최근 행위자에 있으면 순서만 앞으로"""
+    actor_ids = [pk for pk in notification.actor_ids if pk != actor_id]
+    if len(actor_ids) == len(notification.actor_ids):
+        notification.actor_count += 1
+    notification.actor_ids = [actor_id] + actor_ids[:ACTOR_HISTORY - 1]
+    notification.updated_at = now
+    notification.save(update_fields=['actor_ids', 'actor_count', 'updated_at'])
+
+
+def _unread_for_update(recipient_id, verb, target_id):
+    return (
+        Notification.objects.select_for_update()
+        .filter(recipient_id=recipient_id, verb=verb, target_id=target_id, is_read=False)
+        .first()
+    )
+
+
+def _coalesce(recipient_id, verb, actor_id, target_id, post_id):
+    now = timezone.now()
+    with transaction.atomic():
+        notification = _unread_for_update(recipient_id, verb, target_id)
+        if notification is None:
+            try:
+                with transaction.atomic():
+                    Notification.objects.create(
+                        recipient_id=recipient_id, verb=verb, target_id=target_id,
+                        post_id=post_id, actor_ids=[actor_id], created_at=now, updated_at=now,
+                    )
+            except IntegrityError:
+                # 같은 묶음이 동시에 만들어짐 - 그 행에 합침
+                notification = _unread_for_update(recipient_id, verb, target_id)
+            else:
+                transaction.on_commit(lambda: _increment_unread(recipient_id))
+                return
+        if notification is not None:
+            _merge(notification, actor_id, now)
+
+
+def notify(recipient_id, verb, actor_id, target_id=0, post_id=None):
+    """
+    알림 추가 (읽지 않은 같은 대상 알림이 있으면 그 행에 묶음)
+
+    자기 자신의 행위는 알리지 않으며, 실패해도 호출한 요청은 계속 진행한다.
+    """
+    if recipient_id is None or recipient_id == actor_id:
+        return
+    try:
+        _coalesce(recipient_id, verb, actor_id, target_id, post_id)
+    except Exception as e:
+        print(f"❌ 알림 생성 오류 ({verb} -> {recipient_id}): {str(e)}")
+
+
+# ---- 알림함 조회 / 읽음 처리 ----
+
+def _message(verb, actors, actor_count):
+    if not actors:
+        return MESSAGES[verb]
+    name = actors[0]['username']
+    if actor_count > 1:
+        return f"{name}님 외 {actor_count - 1}명이 {MESSAGES[verb]}"
+    return f"{name}님이 {MESSAGES[verb]}"
+
+
+def inbox_page(user, cursor=None, limit=20):
+    """
+    알림함 한 페이지 (마지막으로 묶인 시각 최신순)
+
+    반환: (알림 리스트, 다음 커서 또는 None) - 잘못된 커서는 InvalidCursor
+    """
+    notifications, next_cursor = paginate_keyset(
+        Notification.objects.filter(recipient=user), NOTIFICATION_ORDERING, cursor, limit
+    )
+
+    # 페이지 전체의 행위자를 한 번에 조회 (탈퇴한 사용자는 빠짐)
+    actors = User.objects.only('id', 'username', 'profile_image').in_bulk(
+        {pk for notification in notifications for pk in notification.actor_ids[:RECENT_ACTORS]}
+    )
+
+    results = []
+    for notification in notifications:
+        actor_data = [
+            {
+                'id': actors[pk].id,
+                'username': actors[pk].username,
+                'profile_image_url': actors[pk].profile_image_url,
+            }
+            for pk in notification.actor_ids[:RECENT_ACTORS] if pk in actors
+        ]
+        results.append({
+            'id': notification.id,
+            'verb': notification.verb,
+            'message': _message(notification.verb, actor_data, notification.actor_count),
+            'actors': actor_data,
+            'actor_count': notification.actor_count,
+            'target_id': notification.target_id,
+            'post_id': notification.post_id,
+            'is_read': notification.is_read,
+            'created_at': notification.created_at.isoformat(),
+            'updated_at': notification.updated_at.isoformat(),
+        })
+    return results, next_cursor
+
+
+def mark_read(user, ids=None):
+    """읽음 처리 (ids가 없으면 전체) - 처리한 알림 수 반환"""
+    queryset = Notification.objects.filter(recipient=user, is_read=False)
+    if ids is not None:
+        queryset = queryset.filter(id__in=ids)
+    updated = queryset.update(is_read=True)
+    if updated:
+        invalidate_unread(user.id)
+    return updated
@@ -0,0 +1,146 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.cache import get_conditional_response
+from django.http import HttpResponse
+from rest_framework.renderers import JSONRenderer
+
+from movies.models import Movie, Genre
+from .models import OnboardingMovie, OnboardingStep, UserMoviePreference, UserGenreExclusion
+
+# 온보딩 영화/장르 풀은 모든 사용자에게 동일하므로
+# 직렬화된 JSON(blob)과 ETag를 캐시에 보관하고, 원본 행이 바뀔 때만 다시 만든다.
+# 삭제(invalidate_pools)는 같은 캐시를 보는 프로세스에만 닿으므로 POOL_TIMEOUT 뒤에는 항상 다시 만든다.
+POOL_CACHE_KEY = 'onboarding:pool:{}'
+POOL_TIMEOUT = getattr(settings, 'ONBOARDING_CACHE_TIMEOUT', 300)
+POOL_SIZE = 20
+
+
+def _movie_pool_payload(movie_type):
+    onboarding_movies = OnboardingMovie.objects.filter(
+        movie_type=movie_type, is_active=True
+    ).select_related('movie')[:POOL_SIZE]
+
+    movies_data = []
+    for onboarding_movie in onboarding_movies:
+        movie = onboarding_movie.movie
+        movies_data.append(
+            {
+                'movie_id': movie.id,
+                'title': movie.title,
+                'poster_path': movie.poster_path,
+                'release_date': movie.release_date,
+                'overview': (
+                    movie.overview[:100] + '...' if movie.overview else ''
+                ),
+            }
+        )
+    return {'movies': movies_data}
+
+
+def _genre_pool_payload():
+    genres = Genre.objects.all()
+    return {
+        'genres': [
+            {'genre_id': genre.id, 'genre_name': genre.name} for genre in genres
+        ]
+    }
+
+
+POOL_BUILDERS = {
+    'famous': lambda: _movie_pool_payload('famous'),
+    'hidden': lambda: _movie_pool_payload('hidden'),
+    'genres': _genre_pool_payload,
+}
+
+
+def get_pool(name):
+    """(etag, 직렬화된 본문) 반환 - 캐시에 없을 때만 DB에서 새로 만든다"""
+    key = POOL_CACHE_KEY.format(name)
+    pool = cache.get(key)
+    if pool is None:
+        body = JSONRenderer().render(POOL_BUILDERS[name]())
+        # 내용 기반 strong ETag - 여러 프로세스에서 만들어도 같은 값이 나온다
+        etag = '"%s"' % hashlib.sha256(body).hexdigest()[:32]
+        pool = (etag, body)
+        cache.set(key, pool, POOL_TIMEOUT)
+    return pool
+
+
+def invalidate_pools(*names):
+    """원본 행이 바뀌었을 때 해당 풀 캐시 삭제 (다음 요청에서 다시 생성)"""
+    names = names or tuple(POOL_BUILDERS)
+    cache.delete_many([POOL_CACHE_KEY.format(name) for name in names])
+
+
+def pool_response(request, name):
+    """ETag / If-None-Match 처리를 포함한 풀 응답 생성"""
+    etag, body = get_pool(name)
+
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        not_modified['ETag'] = etag
+        return not_modified
+
+    response = HttpResponse(body, content_type='application/json')
+    response['ETag'] = etag
+    # 인증이 필요한 API이므로 공유 캐시에는 저장하지 않고 매번 재검증
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def clean_ids(values):
+    """요청으로 받은 id 목록을 중복 없는 정수 리스트로 정리 - (유효한 id, 변환 불가 값) 반환"""
+    ids, invalid = [], []
+    for value in values or []:
+        try:
+            ids.append(int(value))
+        except (TypeError, ValueError):
+            invalid.append(value)
+    return list(dict.fromkeys(ids)), invalid
+
+
+def replace_movie_preferences(user, preference_type, movie_ids, movies):
+    """기존 선호도를 지우고 movies(in_bulk 결과)에 존재하는 영화만 한 번에 저장"""
+    UserMoviePreference.objects.filter(
+        user=user, preference_type=preference_type
+    ).delete()
+    UserMoviePreference.objects.bulk_create(
+        [
+            UserMoviePreference(
+                user=user, movie_id=movie_id, preference_type=preference_type
+            )
+            for movie_id in movie_ids
+            if movie_id in movies
+        ]
+    )
+
+
+def replace_genre_exclusions(user, genre_ids, genres):
+    """기존 제외 장르를 지우고 genres(in_bulk 결과)에 존재하는 장르만 한 번에 저장"""
+    UserGenreExclusion.objects.filter(user=user).delete()
+    UserGenreExclusion.objects.bulk_create(
+        [
+            UserGenreExclusion(user=user, genre_id=genre_id)
+            for genre_id in genre_ids
+            if genre_id in genres
+        ]
+    )
+
+
+def existing_movies(movie_ids):
+    return Movie.objects.only('id').in_bulk(movie_ids)
+
+
+def existing_genres(genre_ids):
+    return Genre.objects.in_bulk(genre_ids)
+
+
+def update_onboarding_step(user, current_step, **step_data):
+    """온보딩 진행 상황과 step_data를 한 번의 저장으로 갱신"""
+    step, created = OnboardingStep.objects.get_or_create(user=user)
+    step.current_step = current_step
+    step.step_data.update(step_data)
+    step.save(update_fields=['current_step', 'step_data', 'updated_at'])
+    return step
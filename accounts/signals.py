@@ -0,0 +1,63 @@
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from movies.models import Movie, Genre, MovieReview, LikeActivity
+from posts.models import Post
+from .models import OnboardingMovie, Notification
+from .feed import fan_out, retract
+from .notifications import invalidate_unread
+from .onboarding_service import invalidate_pools
+from .adaptive_onboarding import invalidate_feature_index
+
+
+# 온보딩 풀 캐시 무효화
+@receiver([post_save, post_delete], sender=OnboardingMovie)
+def invalidate_onboarding_movie_pools(sender, instance, **kwargs):
+    invalidate_pools('famous', 'hidden')
+    invalidate_feature_index()
+
+
+@receiver([post_save, post_delete], sender=Movie)
+def invalidate_movie_pools(sender, instance, **kwargs):
+    # 제목/포스터 등 풀에 노출되는 영화 정보가 바뀐 경우
+    invalidate_pools('famous', 'hidden')
+    invalidate_feature_index()
+
+
+@receiver(m2m_changed, sender=Movie.genres.through)
+@receiver(m2m_changed, sender=Movie.directors.through)
+def invalidate_movie_features(sender, action, **kwargs):
+    # 적응형 온보딩에 쓰는 장르/감독 특징이 바뀐 경우
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        invalidate_feature_index()
+
+
+@receiver([post_save, post_delete], sender=Genre)
+def invalidate_genre_pool(sender, instance, **kwargs):
+    invalidate_pools('genres')
+
+
+# 팔로워가 많은 사용자의 활동을 팔로워 피드에 펼치기
+FEED_SOURCES = {Post: 'post', MovieReview: 'review', LikeActivity: 'like'}
+
+
+@receiver(post_save, sender=Post)
+@receiver(post_save, sender=MovieReview)
+@receiver(post_save, sender=LikeActivity)
+def fan_out_activity(sender, instance, created, **kwargs):
+    if created:
+        fan_out(FEED_SOURCES[sender], instance)
+
+
+@receiver(post_delete, sender=Post)
+@receiver(post_delete, sender=MovieReview)
+@receiver(post_delete, sender=LikeActivity)
+def retract_activity(sender, instance, **kwargs):
+    retract(FEED_SOURCES[sender], instance)
+
+
+# 게시글 삭제 등으로 읽지 않은 알림이 지워지면 캐시된 알림 수 무효화
+@receiver(post_delete, sender=Notification)
+def invalidate_unread_notifications(sender, instance, **kwargs):
+    if not instance.is_read:
+        invalidate_unread(instance.recipient_id)
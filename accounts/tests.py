@@ -1,3 +1,48 @@
+import datetime
+
+from django.core.cache import cache
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from movies.models import Movie, Genre
+from .models import User, UserMoviePreference
+
+BASE = '/api/v1/cinememory/accounts/'
+
+
+class SubmitOnboardingTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username='user', password='pw', birth=datetime.date(1995, 1, 1))
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.movies = [
+            Movie.objects.create(
+                id=i, title=f'movie {i}', release_date=datetime.date(2000, 1, 1),
+                poster_path='http://p', status='Released',
+            )
+            for i in (1, 2)
+        ]
+        self.genre = Genre.objects.create(id=1, name='genre')
+
+    def submit(self, **data):
+        body = {'favorite_movie_ids': [1], 'interesting_movie_ids': [2], 'excluded_genre_ids': [1], **data}
+        return self.client.post(f'{BASE}onboarding/submit/', body, format='json')
+
+    def test_saves_selection(self):
+        response = self.submit()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(UserMoviePreference.objects.filter(user=self.user).count(), 2)
+
+    def test_non_list_ids_return_400(self):
+        for field in ('favorite_movie_ids', 'interesting_movie_ids', 'excluded_genre_ids'):
+            for value in (5, 'abc', {'id': 1}):
+                with self.subTest(field=field, value=value):
+                    response = self.submit(**{field: value})
+                    self.assertEqual(response.status_code, 400)
+        self.assertFalse(UserMoviePreference.objects.filter(user=self.user).exists())
 
-# Create your tests here.
+    def test_unknown_ids_return_400(self):
+        response = self.submit(favorite_movie_ids=[1, 99])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data['invalid_movie_ids'], [99])
@@ -14,11 +14,18 @@ urlpatterns = [
     path('me/update/', views.update_user, name='update_user'),
     path('me/profile-image/', views.update_profile_image, name='update_profile_image'),
     path('me/delete/', views.delete_user, name='delete_user'),
+    path('me/export/', views.export_my_data, name='export_my_data'),  # 개인 데이터 내보내기 (스트리밍)
     
     # 팔로우, 팔로잉
     path('<int:user_id>/follow/', views.follow_user, name='follow_user'),
     path('<int:user_id>/followers/', views.get_followers, name='get_followers'),
     path('<int:user_id>/following/', views.get_following, name='get_following'),
+    path('feed/', views.get_feed, name='get_feed'),  # 팔로잉 피드
+
+    # 알림
+    path('notifications/', views.get_notifications, name='get_notifications'),
+    path('notifications/unread-count/', views.get_unread_notification_count, name='get_unread_notification_count'),
+    path('notifications/read/', views.read_notifications, name='read_notifications'),
 
     path('username/<str:username>/', views.get_user_by_username, name='get_user_by_username'),
     
@@ -26,11 +33,13 @@ urlpatterns = [
     path('onboarding/status/', views.onboarding_status, name='onboarding_status'),
     path('onboarding/movies/famous/', views.get_famous_movies, name='get_famous_movies'),
     path('onboarding/movies/hidden/', views.get_hidden_movies, name='get_hidden_movies'),
+    path('onboarding/movies/hidden/adaptive/', views.get_adaptive_hidden_movies, name='get_adaptive_hidden_movies'),
     path('onboarding/movies/random/', views.get_random_movie_during_analysis, name='get_random_movie'),
     path('onboarding/genres/', views.get_genres, name='get_genres'),
     path('onboarding/step1/save/', views.save_favorite_movies, name='save_favorite_movies'),
     path('onboarding/step2/save/', views.save_interesting_movies, name='save_interesting_movies'),
     path('onboarding/step3/save/', views.save_excluded_genres, name='save_excluded_genres'),
+    path('onboarding/submit/', views.submit_onboarding, name='submit_onboarding'),  # 1~3단계 일괄 저장
     path('onboarding/step4/generate/', views.generate_gpt_recommendations, name='generate_gpt_recommendations'),
     # 추천 결과 조회 및 관리
     path('recommendations/', views.get_user_recommendations, name='get_user_recommendations'),
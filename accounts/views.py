@@ -8,7 +8,21 @@ from .serializer import UserSerializer
 from .models import Follow, OnboardingStep, OnboardingMovie, UserMoviePreference, UserGenreExclusion, GPTRecommendation, GPTRecommendedMovie
 from movies.models import Movie, Genre
 from .gpt_service import GPTRecommendationService
+from .onboarding_service import (
+    pool_response, clean_ids, existing_movies, existing_genres,
+    replace_movie_preferences, replace_genre_exclusions, update_onboarding_step,
+)
+from .adaptive_onboarding import get_feature_index
+from .deletion import request_account_deletion
+from .export import export_records, export_zip
+from .feed import build_feed, on_follow, on_unfollow
+from .notifications import notify, inbox_page, unread_count, mark_read
+from cinemamemory.conditional import conditional_view, related_count, related_max
+from cinemamemory.pagination import InvalidCursor, decode_cursor, encode_cursor, get_page_size
+from cinemamemory.streaming import ndjson_response
 from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.utils import timezone
 
 User = get_user_model()
 
@@ -121,9 +135,32 @@ def delete_user(request):
     except Token.DoesNotExist:
         pass
     
-    user.delete()
+    # 계정은 즉시 비활성화하고, 게시글/댓글/좋아요 등은 백그라운드에서 나눠서 삭제
+    request_account_deletion(user)
     return Response({'message': '계정이 삭제되었습니다.'}, status=status.HTTP_200_OK)
 
+# 개인 데이터 내보내기
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def export_my_data(request):
+    """
+    개인 데이터 내보내기 API - 게시글/댓글/리뷰/좋아요/팔로우/온보딩 데이터를 스트리밍
+
+    쿼리 파라미터:
+    - archive: zip(기본, 테이블별 .ndjson 파일) / ndjson(한 줄에 한 행)
+    """
+    archive = request.GET.get('archive', 'zip')
+    stamp = timezone.now().strftime('%Y%m%d')
+    filename = f'cinememory-{request.user.username}-{stamp}'
+
+    if archive == 'ndjson':
+        return ndjson_response(export_records(request.user), filename=f'{filename}.ndjson')
+    if archive == 'zip':
+        response = StreamingHttpResponse(export_zip(request.user), content_type='application/zip')
+        response['Content-Disposition'] = f'attachment; filename="{filename}.zip"'
+        return response
+    return Response({'error': 'archive는 zip 또는 ndjson 입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
 # 로그인
 @api_view(['POST'])
 @permission_classes([AllowAny])
@@ -220,11 +257,14 @@ def follow_user(request, user_id):
         if follow_relation:
             # 언팔로우
             follow_relation.delete()
+            on_unfollow(request.user, target_user)
             return Response({'message': '언팔로우했습니다.', 'is_following': False}, 
                           status=status.HTTP_200_OK)
         else:
             # 팔로우
             Follow.objects.create(follower=request.user, following=target_user)
+            on_follow(request.user, target_user)
+            notify(target_user.id, 'follow', request.user.id)
             return Response({'message': '팔로우했습니다.', 'is_following': True}, 
                           status=status.HTTP_200_OK)
             
@@ -232,6 +272,81 @@ def follow_user(request, user_id):
         return Response({'error': '사용자를 찾을 수 없습니다.'}, 
                       status=status.HTTP_404_NOT_FOUND)
 
+# 팔로잉 피드
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_feed(request):
+    """
+    팔로잉한 사용자들의 게시글, 영화 리뷰, 영화/배우 좋아요를 최신순으로 조회
+
+    쿼리 파라미터:
+    - cursor: 이전 응답의 next_cursor (첫 페이지는 생략)
+    - page_size: 한 페이지 항목 수 (기본 20, 최대 100)
+    """
+    try:
+        cursor = decode_cursor(request.GET.get('cursor'))
+        items, next_cursor = build_feed(request.user, cursor, get_page_size(request))
+    except InvalidCursor:
+        return Response({'error': '잘못된 커서입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    return Response({
+        'feed': items,
+        'next_cursor': encode_cursor(next_cursor) if next_cursor else None,
+    }, status=status.HTTP_200_OK)
+
+# 알림함
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_notifications(request):
+    """
+    팔로우/좋아요/댓글/답글 알림을 최근 묶인 순으로 조회
+
+    쿼리 파라미터:
+    - cursor: 이전 응답의 next_cursor (첫 페이지는 생략)
+    - page_size: 한 페이지 항목 수 (기본 20, 최대 100)
+    """
+    try:
+        items, next_cursor = inbox_page(
+            request.user, request.GET.get('cursor'), get_page_size(request)
+        )
+    except InvalidCursor:
+        return Response({'error': '잘못된 커서입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    return Response({
+        'notifications': items,
+        'unread_count': unread_count(request.user.id),
+        'next_cursor': next_cursor,
+    }, status=status.HTTP_200_OK)
+
+# 읽지 않은 알림 수
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_unread_notification_count(request):
+    return Response({'unread_count': unread_count(request.user.id)}, status=status.HTTP_200_OK)
+
+# 알림 읽음 처리
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def read_notifications(request):
+    """
+    요청 본문:
+    - ids: 읽음 처리할 알림 id 리스트 (생략하면 전체)
+    """
+    ids = request.data.get('ids')
+    if ids is not None:
+        if not isinstance(ids, list):
+            return Response({'error': 'ids는 리스트여야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            ids = [int(pk) for pk in ids]
+        except (TypeError, ValueError):
+            return Response({'error': '잘못된 알림 id입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    updated = mark_read(request.user, ids)
+    return Response({
+        'read_count': updated,
+        'unread_count': unread_count(request.user.id),
+    }, status=status.HTTP_200_OK)
+
 # 팔로워 목록 조회
 @api_view(['GET'])
 @permission_classes([AllowAny])
@@ -300,26 +415,7 @@ def onboarding_status(request):
 @permission_classes([IsAuthenticated])
 def get_famous_movies(request):
     """1단계: 유명한 영화들 제공"""
-    famous_movies = OnboardingMovie.objects.filter(
-        movie_type='famous', is_active=True
-    ).select_related('movie')[:20]
-
-    movies_data = []
-    for onboarding_movie in famous_movies:
-        movie = onboarding_movie.movie
-        movies_data.append(
-            {
-                'movie_id': movie.id,
-                'title': movie.title,
-                'poster_path': movie.poster_path,
-                'release_date': movie.release_date,
-                'overview': (
-                    movie.overview[:100] + '...' if movie.overview else ''
-                ),
-            }
-        )
-
-    return Response({'movies': movies_data})
+    return pool_response(request, 'famous')
 
 
 @api_view(['POST'])
@@ -335,26 +431,15 @@ def save_favorite_movies(request):
         )
 
     with transaction.atomic():
-        # 기존 선호도 삭제
-        UserMoviePreference.objects.filter(
-            user=request.user, preference_type='favorite'
-        ).delete()
-
-        # 새로운 선호도 저장
-        for movie_id in movie_ids:
-            try:
-                movie = Movie.objects.get(id=movie_id)
-                UserMoviePreference.objects.create(
-                    user=request.user, movie=movie, preference_type='favorite'
-                )
-            except Movie.DoesNotExist:
-                continue
+        # 선택한 영화를 한 번에 조회한 뒤 기존 선호도 교체
+        valid_ids, _ = clean_ids(movie_ids)
+        movies = existing_movies(valid_ids)
+        replace_movie_preferences(request.user, 'favorite', valid_ids, movies)
 
         # 진행 상황 업데이트
-        step, created = OnboardingStep.objects.get_or_create(user=request.user)
-        step.current_step = 'interesting_movies'
-        step.step_data['favorite_movies'] = movie_ids
-        step.save()
+        update_onboarding_step(
+            request.user, 'interesting_movies', favorite_movies=movie_ids
+        )
 
     return Response({'message': '재밌게 본 영화가 저장되었습니다.'})
 
@@ -363,25 +448,30 @@ def save_favorite_movies(request):
 @permission_classes([IsAuthenticated])
 def get_hidden_movies(request):
     """2단계: 숨겨진 영화들 제공"""
-    hidden_movies = OnboardingMovie.objects.filter(
-        movie_type='hidden', is_active=True
-    ).select_related('movie')[:20]
-
-    movies_data = []
-    for onboarding_movie in hidden_movies:
-        movie = onboarding_movie.movie
-        movies_data.append(
-            {
-                'movie_id': movie.id,
-                'title': movie.title,
-                'poster_path': movie.poster_path,
-                'release_date': movie.release_date,
-                'overview': (
-                    movie.overview[:100] + '...' if movie.overview else ''
-                ),
-            }
+    return pool_response(request, 'hidden')
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def get_adaptive_hidden_movies(request):
+    """
+    2단계: 1단계 선택 결과에 맞춘 숨겨진 영화들 제공
+
+    쿼리 파라미터:
+    - favorite: 재밌게 본 영화 id 목록 (예: ?favorite=1,2,3)
+      없으면 저장된 1단계 선택 결과 사용
+    """
+    favorite_param = request.GET.get('favorite')
+    if favorite_param:
+        favorite_ids, _ = clean_ids(favorite_param.split(','))
+    else:
+        favorite_ids = list(
+            UserMoviePreference.objects.filter(
+                user=request.user, preference_type='favorite'
+            ).values_list('movie_id', flat=True)
         )
 
+    movies_data = get_feature_index().select_hidden(favorite_ids)
     return Response({'movies': movies_data})
 
 
@@ -398,28 +488,15 @@ def save_interesting_movies(request):
         )
 
     with transaction.atomic():
-        # 기존 선호도 삭제
-        UserMoviePreference.objects.filter(
-            user=request.user, preference_type='interesting'
-        ).delete()
-
-        # 새로운 선호도 저장
-        for movie_id in movie_ids:
-            try:
-                movie = Movie.objects.get(id=movie_id)
-                UserMoviePreference.objects.create(
-                    user=request.user,
-                    movie=movie,
-                    preference_type='interesting',
-                )
-            except Movie.DoesNotExist:
-                continue
+        # 선택한 영화를 한 번에 조회한 뒤 기존 선호도 교체
+        valid_ids, _ = clean_ids(movie_ids)
+        movies = existing_movies(valid_ids)
+        replace_movie_preferences(request.user, 'interesting', valid_ids, movies)
 
         # 진행 상황 업데이트
-        step, created = OnboardingStep.objects.get_or_create(user=request.user)
-        step.current_step = 'exclude_genres'
-        step.step_data['interesting_movies'] = movie_ids
-        step.save()
+        update_onboarding_step(
+            request.user, 'exclude_genres', interesting_movies=movie_ids
+        )
 
     return Response({'message': '관심있는 영화가 저장되었습니다.'})
 
@@ -428,11 +505,7 @@ def save_interesting_movies(request):
 @permission_classes([IsAuthenticated])
 def get_genres(request):
     """3단계: 전체 장르 목록 제공"""
-    genres = Genre.objects.all()
-    genres_data = [
-        {'genre_id': genre.id, 'genre_name': genre.name} for genre in genres
-    ]
-    return Response({'genres': genres_data})
+    return pool_response(request, 'genres')
 
 
 @api_view(['POST'])
@@ -442,28 +515,87 @@ def save_excluded_genres(request):
     genre_ids = request.data.get('genre_ids', [])
 
     with transaction.atomic():
-        # 기존 제외 장르 삭제
-        UserGenreExclusion.objects.filter(user=request.user).delete()
-
-        # 새로운 제외 장르 저장
-        for genre_id in genre_ids:
-            try:
-                genre = Genre.objects.get(id=genre_id)
-                UserGenreExclusion.objects.create(
-                    user=request.user, genre=genre
-                )
-            except Genre.DoesNotExist:
-                continue
+        # 선택한 장르를 한 번에 조회한 뒤 기존 제외 장르 교체
+        valid_ids, _ = clean_ids(genre_ids)
+        genres = existing_genres(valid_ids)
+        replace_genre_exclusions(request.user, valid_ids, genres)
 
         # 진행 상황 업데이트
-        step = OnboardingStep.objects.get(user=request.user)
-        step.current_step = 'gpt_analysis'
-        step.step_data['excluded_genres'] = genre_ids
-        step.save()
+        update_onboarding_step(
+            request.user, 'gpt_analysis', excluded_genres=genre_ids
+        )
 
     return Response({'message': '제외할 장르가 저장되었습니다.'})
 
 
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+def submit_onboarding(request):
+    """
+    1~3단계 선택 결과 한 번에 저장 API
+
+    요청 데이터:
+    - favorite_movie_ids: 재밌게 본 영화 id 목록 (1~10개)
+    - interesting_movie_ids: 재밌어 보이는 영화 id 목록 (1~10개)
+    - excluded_genre_ids: 제외할 장르 id 목록
+
+    선택 개수와 관계없이 영화/장르 조회 1번씩, 삭제/저장 1번씩으로 처리
+    """
+    fields = ('favorite_movie_ids', 'interesting_movie_ids', 'excluded_genre_ids')
+    values = {field: request.data.get(field) or [] for field in fields}
+    for field, value in values.items():
+        if not isinstance(value, list):
+            return Response({'error': f'{field}는 리스트여야 합니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    favorite_ids, invalid_favorites = clean_ids(values['favorite_movie_ids'])
+    interesting_ids, invalid_interesting = clean_ids(values['interesting_movie_ids'])
+    genre_ids, invalid_genres = clean_ids(values['excluded_genre_ids'])
+
+    if not (1 <= len(favorite_ids) <= 10) or not (1 <= len(interesting_ids) <= 10):
+        return Response(
+            {'error': '재밌게 본 영화와 재밌어 보이는 영화를 각각 1개 이상 10개 이하로 선택해주세요.'},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    # 영화/장르 존재 여부를 테이블당 한 번의 쿼리로 검증
+    movies = existing_movies(set(favorite_ids) | set(interesting_ids))
+    genres = existing_genres(genre_ids)
+
+    invalid_movie_ids = invalid_favorites + invalid_interesting + [
+        movie_id
+        for movie_id in dict.fromkeys(favorite_ids + interesting_ids)
+        if movie_id not in movies
+    ]
+    invalid_genre_ids = invalid_genres + [
+        genre_id for genre_id in genre_ids if genre_id not in genres
+    ]
+    if invalid_movie_ids or invalid_genre_ids:
+        return Response(
+            {
+                'error': '존재하지 않는 영화 또는 장르가 포함되어 있습니다.',
+                'invalid_movie_ids': invalid_movie_ids,
+                'invalid_genre_ids': invalid_genre_ids,
+            },
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+
+    with transaction.atomic():
+        replace_movie_preferences(request.user, 'favorite', favorite_ids, movies)
+        replace_movie_preferences(request.user, 'interesting', interesting_ids, movies)
+        replace_genre_exclusions(request.user, genre_ids, genres)
+
+        # 진행 상황은 한 번만 업데이트
+        update_onboarding_step(
+            request.user,
+            'gpt_analysis',
+            favorite_movies=favorite_ids,
+            interesting_movies=interesting_ids,
+            excluded_genres=genre_ids,
+        )
+
+    return Response({'message': '온보딩 선택 결과가 저장되었습니다.'})
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def get_random_movie_during_analysis(request):  # GPT 분석 중 보여줄 랜덤 영화
@@ -681,8 +813,18 @@ def regenerate_recommendations(request):
            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
        )
 
+def _recommendation_version(request):
+    """재생성 때마다 updated_at이 바뀌고 추천 영화 행이 새로 만들어진다"""
+    recommended = GPTRecommendedMovie.objects.all()
+    return GPTRecommendation.objects.filter(user=request.user).annotate(
+        movie_total=related_count(recommended, 'recommendation_id'),
+        last_movie=related_max(recommended, 'recommendation_id', 'id'),
+    ).values_list('id', 'updated_at', 'movie_total', 'last_movie').first()
+
+
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@conditional_view(_recommendation_version)
 def get_user_recommendations(request):
     """사용자의 GPT 추천 결과 조회"""
     try:
@@ -0,0 +1,188 @@
+import asyncio
+import random
+import threading
+import time
+import uuid
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+import httpx
+
+from .suite import API
+
+# 비동기 부하 테스트
+# 가상 사용자마다 회원가입 -> 온보딩 1~4단계 -> 둘러보기 -> 좋아요 -> 댓글 순서의 실제 사용 흐름을
+# httpx.AsyncClient로 실행하고, 단계별 처리량/지연 백분위/오류율을 집계한다.
+# 대상은 이미 떠 있는 서버(URL), 같은 프로세스의 ASGI 앱, 같은 프로세스의 WSGI 서버 중 하나다.
+REQUEST_TIMEOUT = 120.0  # 온보딩 4단계는 GPT 호출을 기다리므로 넉넉하게
+PERCENTILES = (50, 95, 99)
+
+
+class StepStats:
+    def __init__(self, name):
+        self.name = name
+        self.latencies = []
+        self.errors = {}  # 상태 코드/예외 이름 -> 횟수
+
+    @property
+    def count(self):
+        return len(self.latencies) + sum(self.errors.values())
+
+    def summary(self, elapsed):
+        latencies = sorted(self.latencies)
+        result = {
+            'step': self.name,
+            'requests': self.count,
+            'errors': sum(self.errors.values()),
+            'error_rate': round(sum(self.errors.values()) / self.count, 4) if self.count else 0.0,
+            'throughput_rps': round(self.count / elapsed, 2) if elapsed else 0.0,
+            'error_breakdown': dict(self.errors),
+        }
+        for percent in PERCENTILES + (100,):
+            key = 'max_ms' if percent == 100 else f'p{percent}_ms'
+            if latencies:
+                index = min(len(latencies) - 1, int(round(percent / 100 * (len(latencies) - 1))))
+                result[key] = round(latencies[index] * 1000, 1)
+            else:
+                result[key] = None
+        return result
+
+
+class JourneyFailed(Exception):
+    pass
+
+
+class LoadTest:
+    def __init__(self, client, users=50, concurrency=10, think_time=0.0, seed=None):
+        self.client = client
+        self.users = users
+        self.concurrency = concurrency
+        self.think_time = think_time
+        self.rng = random.Random(seed)
+        self.run_id = uuid.uuid4().hex[:8]
+        self.steps = {}
+        self.completed = 0
+
+    async def _request(self, step, method, path, token=None, **kwargs):
+        """요청 하나를 단계 이름으로 기록 - 2xx가 아니면 JourneyFailed"""
+        stats = self.steps.setdefault(step, StepStats(step))
+        headers = {'Authorization': f'Token {token}'} if token else {}
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, API + path, headers=headers, **kwargs)
+        except httpx.HTTPError as e:
+            stats.errors[type(e).__name__] = stats.errors.get(type(e).__name__, 0) + 1
+            raise JourneyFailed(step)
+        elapsed = time.perf_counter() - started
+
+        if response.status_code >= 400:
+            key = str(response.status_code)
+            stats.errors[key] = stats.errors.get(key, 0) + 1
+            raise JourneyFailed(step)
+        stats.latencies.append(elapsed)
+        if self.think_time:
+            await asyncio.sleep(self.rng.uniform(0, self.think_time))
+        return response.json() if response.content else {}
+
+    async def journey(self, index):
+        username = f'load{self.run_id}{index}'
+        password = f'pw-{self.run_id}-{index}'
+        signup = await self._request('signup', 'POST', '/accounts/signup/', json={
+            'username': username, 'password1': password, 'password2': password, 'birth': '1995-05-05',
+        })
+        token = signup['token']
+
+        # 온보딩 1~4단계
+        famous = await self._request('onboarding_famous', 'GET', '/accounts/onboarding/movies/famous/', token)
+        famous_ids = [movie['movie_id'] for movie in famous.get('movies', [])]
+        await self._request('onboarding_step1', 'POST', '/accounts/onboarding/step1/save/', token, json={
+            'movie_ids': self.rng.sample(famous_ids, min(5, len(famous_ids))) or [1],
+        })
+        hidden = await self._request('onboarding_hidden', 'GET', '/accounts/onboarding/movies/hidden/', token)
+        hidden_ids = [movie['movie_id'] for movie in hidden.get('movies', [])]
+        await self._request('onboarding_step2', 'POST', '/accounts/onboarding/step2/save/', token, json={
+            'movie_ids': self.rng.sample(hidden_ids, min(5, len(hidden_ids))) or [1],
+        })
+        genres = await self._request('onboarding_genres', 'GET', '/accounts/onboarding/genres/', token)
+        genre_ids = [genre['genre_id'] for genre in genres.get('genres', [])]
+        await self._request('onboarding_step3', 'POST', '/accounts/onboarding/step3/save/', token, json={
+            'genre_ids': self.rng.sample(genre_ids, min(2, len(genre_ids))),
+        })
+        await self._request('onboarding_step4', 'POST', '/accounts/onboarding/step4/generate/', token)
+
+        # 둘러보기 / 좋아요 / 댓글
+        posts = await self._request('browse_posts', 'GET', '/community/', token)
+        post_ids = [post['id'] for post in posts.get('posts', [])]
+        if famous_ids:
+            await self._request('browse_movie', 'GET', f'/movies/{self.rng.choice(famous_ids)}/', token)
+        if post_ids:
+            post_id = self.rng.choice(post_ids)
+            await self._request('browse_post', 'GET', f'/community/post/{post_id}/', token)
+            await self._request('like_post', 'POST', f'/community/post/{post_id}/likes/', token)
+            await self._request('comment', 'POST', f'/community/post/{post_id}/comments/', token, json={
+                'content': f'부하 테스트 댓글 {index}',
+            })
+        self.completed += 1
+
+    async def run(self):
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def limited(index):
+            async with semaphore:
+                try:
+                    await self.journey(index)
+                except JourneyFailed:
+                    pass
+
+        started = time.perf_counter()
+        await asyncio.gather(*(limited(index) for index in range(self.users)))
+        elapsed = time.perf_counter() - started
+        return {
+            'users': self.users,
+            'concurrency': self.concurrency,
+            'completed_journeys': self.completed,
+            'elapsed_seconds': round(elapsed, 2),
+            'journeys_per_second': round(self.completed / elapsed, 3) if elapsed else 0.0,
+            'steps': [stats.summary(elapsed) for stats in self.steps.values()],
+        }
+
+
+# ---- 대상 서버 ----
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def start_wsgi_server(host='127.0.0.1', port=0):
+    """같은 프로세스에서 스레드 WSGI 서버 실행 - 접속 URL 반환"""
+    from django.core.wsgi import get_wsgi_application
+
+    server = make_server(
+        host, port, get_wsgi_application(),
+        server_class=_ThreadingWSGIServer, handler_class=_QuietHandler,
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://{host}:{server.server_port}'
+
+
+def make_client(url=None, app=None, concurrency=10):
+    """url: 외부 서버 주소, app: 같은 프로세스의 ASGI 앱"""
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    if app is not None:
+        # ALLOWED_HOSTS에 있는 호스트 이름 사용
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app), base_url='http://localhost', timeout=REQUEST_TIMEOUT,
+        )
+    return httpx.AsyncClient(base_url=url, timeout=REQUEST_TIMEOUT, limits=limits)
+
+
+def run_load_test(client, users, concurrency, think_time=0.0, seed=None):
+    async def main():
+        async with client:
+            return await LoadTest(client, users, concurrency, think_time, seed).run()
+    return asyncio.run(main())
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from benchmarks.query_plans import CATALOG, audit
+
+
+class Command(BaseCommand):
+    help = '주요 뷰 쿼리셋의 실행 계획(EXPLAIN QUERY PLAN)에서 전체 스캔과 임시 B-tree 정렬을 찾습니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--only', nargs='*', help='점검할 쿼리 이름')
+        parser.add_argument('--verbose-plan', action='store_true', help='모든 쿼리의 전체 계획 출력')
+        parser.add_argument('--fail-on-issue', action='store_true',
+                            help='허용되지 않은 전체 스캔/임시 정렬이 있으면 오류로 종료')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError('EXPLAIN QUERY PLAN 형식은 SQLite에서만 점검할 수 있습니다.')
+        names = {name for name, _, _ in CATALOG}
+        unknown = set(options['only'] or []) - names
+        if unknown:
+            raise CommandError(f"알 수 없는 쿼리: {', '.join(sorted(unknown))}")
+
+        results = audit(options['only'])
+        issues = 0
+        for result in results:
+            if result['unexpected']:
+                issues += 1
+                self.stdout.write(self.style.ERROR(f"✗ {result['name']}"))
+            elif result['findings']:
+                self.stdout.write(self.style.WARNING(f"~ {result['name']} (허용된 항목만 있음)"))
+            else:
+                self.stdout.write(self.style.SUCCESS(f"✓ {result['name']}"))
+
+            if options['verbose_plan']:
+                for detail in result['plan']:
+                    self.stdout.write(f'    {detail}')
+            else:
+                for kind, detail in result['unexpected']:
+                    self.stdout.write(f'    [{kind}] {detail}')
+
+        self.stdout.write('')
+        self.stdout.write(f'쿼리 {len(results)}개 중 {issues}개에서 문제가 발견되었습니다.')
+        if issues and options['fail_on_issue']:
+            raise CommandError('실행 계획 점검 실패')
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from benchmarks.serialization import CASES, compare
+from benchmarks.suite import BenchmarkContext
+
+
+class Command(BaseCommand):
+    help = '목록 API의 기존 ModelSerializer 경로와 values() 행 직렬화 경로의 출력 일치 여부와 속도를 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100, help='목록 경우의 행 수')
+        parser.add_argument('--iterations', type=int, default=10, help='경로별 측정 횟수 (중앙값 사용)')
+        parser.add_argument('--only', nargs='*', help='비교할 경우 이름')
+        parser.add_argument('--fail-on-mismatch', action='store_true',
+                            help='출력이 다른 경우가 있으면 오류로 종료')
+
+    def handle(self, *args, **options):
+        names = {name for name, _, _, _ in CASES}
+        unknown = set(options['only'] or []) - names
+        if unknown:
+            raise CommandError(f"알 수 없는 경우: {', '.join(sorted(unknown))}")
+
+        context = BenchmarkContext.from_database()
+        if context is None:
+            raise CommandError('벤치마크 데이터가 없습니다. 먼저 seed_benchmark_data를 실행하세요.')
+
+        results = compare(context, options['rows'], options['iterations'], options['only'])
+        self.stdout.write(
+            f"{'case':<20} {'bytes':>9} {'drf ms':>9} {'rows ms':>9} {'speedup':>8} {'queries':>9}  output"
+        )
+        mismatches = 0
+        for result in results:
+            line = (
+                f"{result['name']:<20} {result['bytes']:>9} {result['drf_ms']:>9.2f} {result['rows_ms']:>9.2f} "
+                f"{result['speedup'] or 0:>7.2f}x {result['drf_queries']:>4}->{result['rows_queries']:<4}  "
+            )
+            if result['identical']:
+                self.stdout.write(line + self.style.SUCCESS('identical'))
+            else:
+                mismatches += 1
+                self.stdout.write(line + self.style.ERROR('DIFFERENT'))
+
+        if mismatches and options['fail_on_mismatch']:
+            raise CommandError(f'출력이 다른 경우 {mismatches}건')
@@ -0,0 +1,73 @@
+import platform
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from benchmarks.suite import (
+    ENDPOINTS, BenchmarkContext, diff_results, load_results, run_suite, save_results,
+)
+
+
+class Command(BaseCommand):
+    help = '공개 엔드포인트의 응답 시간 백분위와 쿼리 수를 측정하고 기준 결과와 비교합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=30, help='엔드포인트별 측정 횟수')
+        parser.add_argument('--warmup', type=int, default=3, help='측정 전 예열 호출 횟수')
+        parser.add_argument('--only', nargs='*', help='측정할 엔드포인트 이름')
+        parser.add_argument('--output', help='이번 결과를 저장할 JSON 경로')
+        parser.add_argument('--baseline', help='비교할 기준 결과 JSON 경로')
+        parser.add_argument('--threshold', type=float, default=0.1,
+                            help='회귀로 볼 응답 시간 증가 비율 (기본 0.1 = 10%%)')
+        parser.add_argument('--fail-on-regression', action='store_true',
+                            help='회귀가 있으면 오류로 종료')
+
+    def handle(self, *args, **options):
+        names = {name for name, _, _ in ENDPOINTS}
+        unknown = set(options['only'] or []) - names
+        if unknown:
+            raise CommandError(f"알 수 없는 엔드포인트: {', '.join(sorted(unknown))}")
+
+        context = BenchmarkContext.from_database()
+        if context is None:
+            raise CommandError('벤치마크 데이터가 없습니다. 먼저 seed_benchmark_data를 실행하세요.')
+
+        results = run_suite(
+            context, options['iterations'], options['warmup'], options['only'], log=self.stdout.write,
+        )
+
+        if options['output']:
+            save_results(options['output'], results, {
+                'created_at': timezone.now().isoformat(),
+                'iterations': options['iterations'],
+                'database': connection.vendor,
+                'python': platform.python_version(),
+                'debug': settings.DEBUG,
+            })
+            self.stdout.write(f"결과를 {options['output']}에 저장했습니다.")
+
+        if options['baseline']:
+            self._compare(load_results(options['baseline'])['results'], results, options)
+
+    def _compare(self, baseline, results, options):
+        rows = diff_results(baseline, results, options['threshold'])
+        regressions = [row for row in rows if row[5]]
+        self.stdout.write('')
+        self.stdout.write(f"{'endpoint':<28} {'metric':<8} {'baseline':>10} {'current':>10} {'change':>8}")
+        for name, key, old, new, change, regressed in rows:
+            line = f'{name:<28} {key:<8} {old:>10} {new:>10} {change:>+8.1%}'
+            if regressed:
+                line = self.style.ERROR(line)
+            elif change < -options['threshold']:
+                line = self.style.SUCCESS(line)
+            self.stdout.write(line)
+
+        if regressions:
+            message = f'회귀 {len(regressions)}건'
+            if options['fail_on_regression']:
+                raise CommandError(message)
+            self.stdout.write(self.style.WARNING(message))
+        else:
+            self.stdout.write(self.style.SUCCESS('기준 대비 회귀가 없습니다.'))
@@ -0,0 +1,85 @@
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from movies.models import Movie
+from benchmarks.loadtest import make_client, run_load_test, start_wsgi_server
+from benchmarks.openai_stub import DEFAULT_JITTER, DEFAULT_LATENCY, StubConfig, server_url, start_in_background
+
+
+class Command(BaseCommand):
+    help = '회원가입~온보딩~둘러보기~좋아요~댓글 흐름으로 비동기 부하 테스트를 실행합니다.'
+
+    def add_arguments(self, parser):
+        target = parser.add_mutually_exclusive_group()
+        target.add_argument('--url', help='이미 실행 중인 서버 주소 (예: http://127.0.0.1:8000)')
+        target.add_argument('--app', choices=['asgi', 'wsgi'], default='asgi',
+                            help='같은 프로세스에서 실행할 앱 (기본 asgi)')
+        parser.add_argument('--users', type=int, default=50, help='실행할 사용자 흐름 수')
+        parser.add_argument('--concurrency', type=int, default=10, help='동시에 진행할 사용자 수')
+        parser.add_argument('--think-time', type=float, default=0.0, help='요청 사이 최대 대기(초)')
+        parser.add_argument('--seed', type=int, help='난수 시드')
+        parser.add_argument('--no-stub', action='store_true',
+                            help='같은 프로세스 실행 시 OpenAI 스텁 대신 설정된 API 사용')
+        parser.add_argument('--stub-latency', type=float, default=DEFAULT_LATENCY, help='스텁 평균 지연(초)')
+        parser.add_argument('--stub-jitter', type=float, default=DEFAULT_JITTER, help='스텁 지연 변동 폭(초)')
+        parser.add_argument('--stub-error-rate', type=float, default=0.0, help='스텁 오류 비율 (0~1)')
+        parser.add_argument('--output', help='결과를 저장할 JSON 경로')
+
+    def handle(self, *args, **options):
+        if options['users'] < 1 or options['concurrency'] < 1:
+            raise CommandError('--users와 --concurrency는 1 이상이어야 합니다.')
+
+        server = None
+        if options['url']:
+            # 외부 서버는 run_openai_stub + OPENAI_BASE_URL 로 따로 준비
+            client = make_client(url=options['url'], concurrency=options['concurrency'])
+        else:
+            if not options['no_stub']:
+                stub = start_in_background(config=StubConfig(
+                    latency=options['stub_latency'], jitter=options['stub_jitter'],
+                    error_rate=options['stub_error_rate'],
+                    movie_range=max(Movie.objects.count(), 1),
+                ))
+                settings.OPENAI_BASE_URL = server_url(stub)
+                settings.OPENAI_API_KEY = settings.OPENAI_API_KEY or 'stub'
+                self.stdout.write(f'OpenAI 스텁: {settings.OPENAI_BASE_URL}')
+            if options['app'] == 'wsgi':
+                server, url = start_wsgi_server()
+                client = make_client(url=url, concurrency=options['concurrency'])
+            else:
+                from django.core.asgi import get_asgi_application
+                client = make_client(app=get_asgi_application(), concurrency=options['concurrency'])
+
+        try:
+            report = run_load_test(
+                client, options['users'], options['concurrency'], options['think_time'], options['seed'],
+            )
+        finally:
+            if server is not None:
+                server.shutdown()
+
+        self._print(report)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            self.stdout.write(f"결과를 {options['output']}에 저장했습니다.")
+
+    def _print(self, report):
+        self.stdout.write(
+            f"사용자 {report['users']}명 (동시 {report['concurrency']}) - 완료 {report['completed_journeys']}명, "
+            f"{report['elapsed_seconds']}초, {report['journeys_per_second']} 흐름/초"
+        )
+        self.stdout.write(
+            f"{'step':<20} {'req':>6} {'rps':>8} {'err%':>7} {'p50':>9} {'p95':>9} {'p99':>9} {'max':>9}"
+        )
+        for step in report['steps']:
+            line = (
+                f"{step['step']:<20} {step['requests']:>6} {step['throughput_rps']:>8} "
+                f"{step['error_rate']:>7.1%} {step['p50_ms'] or 0:>9} {step['p95_ms'] or 0:>9} "
+                f"{step['p99_ms'] or 0:>9} {step['max_ms'] or 0:>9}"
+            )
+            self.stdout.write(self.style.ERROR(line) if step['errors'] else line)
+            if step['errors']:
+                self.stdout.write(f"    {step['error_breakdown']}")
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand
+
+from benchmarks.openai_stub import DEFAULT_JITTER, DEFAULT_LATENCY, StubConfig, make_server, server_url
+
+
+class Command(BaseCommand):
+    help = '부하 테스트용 OpenAI chat.completions 스텁 서버를 실행합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8900)
+        parser.add_argument('--latency', type=float, default=DEFAULT_LATENCY, help='평균 응답 지연(초)')
+        parser.add_argument('--jitter', type=float, default=DEFAULT_JITTER, help='지연 변동 폭(초)')
+        parser.add_argument('--error-rate', type=float, default=0.0, help='429/500 오류 비율 (0~1)')
+        parser.add_argument('--movie-range', type=int, default=1000,
+                            help='추천에 쓸 시드 영화 id 범위 (1 ~ N)')
+
+    def handle(self, *args, **options):
+        config = StubConfig(
+            latency=options['latency'], jitter=options['jitter'],
+            error_rate=options['error_rate'], movie_range=options['movie_range'],
+        )
+        server = make_server(options['host'], options['port'], config)
+        self.stdout.write(self.style.SUCCESS(
+            f'스텁 서버 실행 중: {server_url(server)} '
+            f'(서버는 OPENAI_BASE_URL={server_url(server)} OPENAI_API_KEY=stub 로 실행)'
+        ))
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            self.stdout.write(f'요청 {config.requests}건, 오류 {config.errors}건')
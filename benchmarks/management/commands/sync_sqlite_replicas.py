@@ -0,0 +1,30 @@
+import sqlite3
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+
+class Command(BaseCommand):
+    help = 'default SQLite DB를 복제본 파일(DATABASE_REPLICA_FILES)로 복사합니다. (로컬 복제 흉내)'
+
+    def handle(self, *args, **options):
+        replicas = getattr(settings, 'DATABASE_REPLICAS', [])
+        if not replicas:
+            raise CommandError('DATABASE_REPLICA_FILES에 복제본 파일이 설정되어 있지 않습니다.')
+        if connections['default'].vendor != 'sqlite':
+            raise CommandError('SQLite DB에서만 사용할 수 있습니다.')
+
+        source = sqlite3.connect(settings.DATABASES['default']['NAME'])
+        try:
+            for alias in replicas:
+                connections[alias].close()
+                target = sqlite3.connect(settings.DATABASES[alias]['NAME'])
+                try:
+                    # 온라인 백업 API - 쓰는 중인 default도 일관된 시점으로 복사
+                    source.backup(target)
+                finally:
+                    target.close()
+                self.stdout.write(self.style.SUCCESS(f'{alias} 동기화 완료: {settings.DATABASES[alias]["NAME"]}'))
+        finally:
+            source.close()
@@ -0,0 +1,118 @@
+import json
+import random
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# 부하 테스트용 OpenAI chat.completions 흉내 서버
+# 실제 API 대신 설정한 지연(latency ± jitter) 뒤에 GPTRecommendationService가 해석할 수 있는
+# 추천 JSON을 돌려준다. 추천 영화 제목/개봉 연도는 seed_benchmark_data가 만드는 영화와 맞춰
+# DB 매칭 경로까지 실제처럼 실행되게 한다. error_rate 비율만큼 429/500 오류를 섞을 수 있다.
+DEFAULT_LATENCY = 2.0  # 초
+DEFAULT_JITTER = 0.5
+RECOMMENDATION_COUNT = 6
+
+
+def _seed_movie(movie_id):
+    # benchmarks.seed.Seeder.seed_catalog 의 제목/개봉일 규칙과 같음
+    return {'title': f'영화 {movie_id}', 'release_year': 1950 + movie_id % 75}
+
+
+def _completion_content(rng, movie_range):
+    movies = []
+    for order, movie_id in enumerate(rng.sample(range(1, movie_range + 1), RECOMMENDATION_COUNT), 1):
+        movies.append({
+            **_seed_movie(movie_id),
+            'reason': f'선택하신 영화들과 분위기가 비슷한 추천 {order}',
+            'target_age': 10 + order * 5,
+        })
+    return json.dumps({'taste_summary': '부하 테스트용 취향 분석 결과입니다.', 'movies': movies}, ensure_ascii=False)
+
+
+class StubConfig:
+    def __init__(self, latency=DEFAULT_LATENCY, jitter=DEFAULT_JITTER, error_rate=0.0, movie_range=1000, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.movie_range = movie_range
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+
+    def draw(self):
+        """(지연 시간, 오류 여부, 응답 본문 난수원) - 여러 스레드에서 호출"""
+        with self.lock:
+            self.requests += 1
+            delay = max(0.0, self.rng.uniform(self.latency - self.jitter, self.latency + self.jitter))
+            failed = self.rng.random() < self.error_rate
+            self.errors += int(failed)
+            return delay, failed, random.Random(self.rng.random())
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    config = None  # make_server에서 지정
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            request = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            request = {}
+
+        if not self.path.rstrip('/').endswith('/chat/completions'):
+            self._send(404, {'error': {'message': f'Unknown path {self.path}', 'type': 'invalid_request_error'}})
+            return
+
+        delay, failed, rng = self.config.draw()
+        time.sleep(delay)
+        if failed:
+            status = rng.choice([429, 500])
+            self._send(status, {'error': {'message': 'stub failure', 'type': 'server_error', 'code': status}})
+            return
+
+        content = _completion_content(rng, self.config.movie_range)
+        self._send(200, {
+            'id': f'chatcmpl-{uuid.uuid4().hex}',
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': request.get('model', 'gpt-3.5-turbo'),
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': content},
+                'finish_reason': 'stop',
+            }],
+            'usage': {'prompt_tokens': 500, 'completion_tokens': 300, 'total_tokens': 800},
+        })
+
+
+def make_server(host='127.0.0.1', port=0, config=None):
+    """스텁 서버 생성 (port=0이면 빈 포트) - base_url은 server_url(server)"""
+    handler = type('StubHandler', (_Handler,), {'config': config or StubConfig()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def server_url(server):
+    host, port = server.server_address[:2]
+    return f'http://{host}:{port}/v1'
+
+
+def start_in_background(host='127.0.0.1', port=0, config=None):
+    server = make_server(host, port, config)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,139 @@
+from django.db import connections
+
+from accounts.feed import _source_querysets
+from accounts.models import User, Notification
+from accounts.notifications import NOTIFICATION_ORDERING
+from movies.models import Movie, MovieActor, MovieProvider, MovieReview
+from posts.comment_tree import COMMENT_ORDERING
+from posts.models import Tag, Post, Comment
+from posts.querysets import with_counts
+from posts.views import POST_LIST_ORDERINGS
+
+# 쿼리 실행 계획 점검
+# 뷰가 실제로 만드는 쿼리셋(같은 필터/정렬/페이지 크기)을 모아 두고 SQLite EXPLAIN QUERY PLAN으로
+# 인덱스 없이 테이블 전체를 읽는 SCAN과 정렬용 임시 B-tree(USE TEMP B-TREE)를 찾는다.
+# 값에 따라 계획이 달라지지 않으므로 대상 id는 DB에 있는 아무 행이나 쓴다.
+PAGE_SIZE = 20
+
+FULL_SCAN = 'full_scan'
+TEMP_SORT = 'temp_sort'
+
+
+def _page(queryset, fields, descending=True):
+    # cinemamemory.pagination.paginate_keyset 이 실행하는 첫 페이지 쿼리
+    prefix = '-' if descending else ''
+    return queryset.order_by(*[f'{prefix}{field}' for field in fields])[:PAGE_SIZE + 1]
+
+
+def _first_id(model):
+    return model.objects.order_by('pk').values_list('pk', flat=True).first() or 1
+
+
+def sample_ids():
+    return {
+        'user': _first_id(User),
+        'movie': _first_id(Movie),
+        'actor': MovieActor.objects.values_list('actor_id', flat=True).first() or 1,
+        'post': _first_id(Post),
+        'tag': _first_id(Tag),
+    }
+
+
+def _post_list(sort):
+    return lambda ids: _page(
+        with_counts(Post.objects.select_related('user')), POST_LIST_ORDERINGS[sort]
+    )
+
+
+# (이름, 쿼리셋 생성 함수, 허용하는 발견 항목) - 허용 항목은 의도된 계획
+CATALOG = [
+    ('post_list', _post_list('latest'), set()),
+    ('post_list_hot', _post_list('hot'), set()),
+    ('post_list_popular', _post_list('popular'), set()),
+    ('post_list_comments', _post_list('comments'), set()),
+    # 태그 연결 테이블에서 게시글을 모은 뒤 정렬
+    ('posts_by_tag', lambda ids: with_counts(
+        Post.objects.filter(tags=ids['tag']).select_related('user')
+    ).order_by('-created_at'), {TEMP_SORT}),
+    ('user_posts', lambda ids: _page(
+        with_counts(Post.objects.filter(user_id=ids['user'])), ('created_at', 'id')
+    ), set()),
+    ('user_comments', lambda ids: _page(
+        Comment.objects.filter(user_id=ids['user']).select_related('post'), ('created_at', 'id')
+    ), set()),
+    ('tag_list', lambda ids: Tag.objects.filter(post_count__gt=0).order_by('-post_count', 'name'), set()),
+    ('comment_roots', lambda ids: _page(
+        Comment.objects.filter(post_id=ids['post'], parent__isnull=True).select_related('user'),
+        COMMENT_ORDERING, descending=False,
+    ), set()),
+    # 여러 부모의 답글을 합쳐 정렬 - 한 페이지 분량이라 임시 정렬 허용
+    ('comment_replies', lambda ids: Comment.objects.filter(
+        post_id=ids['post'], parent_id__in=[1, 2, 3]
+    ).select_related('user').order_by(*COMMENT_ORDERING), {TEMP_SORT}),
+    ('comment_tree', lambda ids: Comment.objects.filter(
+        post_id=ids['post']
+    ).select_related('user').order_by(*COMMENT_ORDERING), {TEMP_SORT}),
+    ('movie_recent_reviews', lambda ids: MovieReview.objects.filter(
+        movie_id=ids['movie']
+    ).select_related('user').order_by('-created_at')[:5], set()),
+    ('movie_cast', lambda ids: MovieActor.objects.filter(
+        movie_id=ids['movie']
+    ).select_related('actor').order_by('cast_order'), set()),
+    ('actor_filmography', lambda ids: MovieActor.objects.filter(
+        actor_id=ids['actor']
+    ).select_related('movie').order_by('cast_order'), set()),
+    ('movie_providers', lambda ids: MovieProvider.objects.filter(
+        movie_id=ids['movie']
+    ).select_related('provider').order_by('display_priority'), set()),
+    ('popular_movies', lambda ids: Movie.objects.filter(popularity__gt=50).order_by('-popularity')[:30], set()),
+    ('user_reviews', lambda ids: MovieReview.objects.filter(
+        user_id=ids['user']
+    ).select_related('movie').order_by('-created_at'), set()),
+    # 팔로잉 여러 명의 행을 모은 뒤 정렬 (user IN 조건이라 한 인덱스 순서로 읽을 수 없음)
+    ('feed_posts', lambda ids: _page(_source_querysets(ids['user'])['post'], ('created_at', 'id')), {TEMP_SORT}),
+    ('feed_reviews', lambda ids: _page(_source_querysets(ids['user'])['review'], ('created_at', 'id')), {TEMP_SORT}),
+    ('feed_likes', lambda ids: _page(_source_querysets(ids['user'])['like'], ('created_at', 'id')), {TEMP_SORT}),
+    ('notifications', lambda ids: _page(
+        Notification.objects.filter(recipient_id=ids['user']), NOTIFICATION_ORDERING
+    ), set()),
+]
+
+
+def explain(queryset):
+    """EXPLAIN QUERY PLAN 결과의 detail 목록"""
+    connection = connections[queryset.db]
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+        return [row[-1] for row in cursor.fetchall()]
+
+
+def classify(detail):
+    """계획 한 줄 -> 발견 항목 또는 None"""
+    if detail.startswith('SCAN ') and ' USING ' not in detail:
+        return FULL_SCAN
+    if detail.startswith('USE TEMP B-TREE'):
+        return TEMP_SORT
+    return None
+
+
+def audit(only=None):
+    """
+    CATALOG 쿼리셋마다 실행 계획 점검
+
+    반환: [{'name', 'plan', 'findings': [(항목, detail)], 'unexpected': [(항목, detail)]}]
+    """
+    ids = sample_ids()
+    results = []
+    for name, build, allowed in CATALOG:
+        if only and name not in only:
+            continue
+        plan = explain(build(ids))
+        findings = [(kind, detail) for detail in plan for kind in [classify(detail)] if kind]
+        results.append({
+            'name': name,
+            'plan': plan,
+            'findings': findings,
+            'unexpected': [(kind, detail) for kind, detail in findings if kind not in allowed],
+        })
+    return results
@@ -0,0 +1,339 @@
+import datetime
+import random
+from contextlib import contextmanager
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.models import User, Follow, OnboardingMovie
+from movies.models import (
+    Genre, Director, Actor, Provider, Movie, MovieActor, MovieProvider, MovieReview, LikeActivity,
+)
+from posts.models import Tag, Post, Comment
+from posts.likes import recount_likes
+from posts.querysets import recount_comments
+from posts.ranking import redecay_hot_scores
+from posts.search import rebuild_index
+from posts.stats import community_snapshot
+from posts.tags import recount_tags
+
+# 벤치마크용 합성 데이터
+# scale=1 기준 영화 10만, 출연 50만, 사용자 5만, 좋아요 100만 행 규모이며
+# 모든 행은 생성기에서 만들어 bulk_create로 batch_size씩 넣고 묶음마다 커밋한다
+# (scale=1에서 한 트랜잭션이 좋아요 100만 행을 붙잡고 있지 않도록).
+# bulk_create는 신호를 보내지 않으므로 마지막에 좋아요 수/태그 수/인기 점수/검색 색인을 다시 계산한다.
+# 같은 scale/seed면 같은 데이터가 만들어진다.
+BASE_SIZES = {
+    'genres': 19,
+    'providers': 20,
+    'directors': 20000,
+    'actors': 100000,
+    'movies': 100000,
+    'cast': 500000,  # 영화-배우 출연 행
+    'users': 50000,
+    'follows': 300000,
+    'reviews': 100000,
+    'tags': 500,
+    'posts': 50000,
+    'comments': 200000,
+    'movie_likes': 600000,
+    'post_likes': 300000,
+    'comment_likes': 100000,
+}
+USER_PASSWORD = 'benchmark-password'
+USERNAME_PREFIX = 'bench'
+HISTORY_DAYS = 365  # 작성 시각을 흩뿌릴 기간
+ONBOARDING_POOL_SIZE = 40  # 온보딩 유명/숨은 영화 풀 크기
+
+
+FIXED_SIZES = {'genres', 'providers'}  # 규모와 관계없이 고정된 목록
+
+
+def sizes_for(scale):
+    return {
+        name: size if name in FIXED_SIZES else max(1, int(size * scale))
+        for name, size in BASE_SIZES.items()
+    }
+
+
+def username(index):
+    return f'{USERNAME_PREFIX}{index}'
+
+
+@contextmanager
+def _manual_timestamps(*models):
+    """auto_now/auto_now_add를 잠시 꺼서 bulk_create에 넘긴 작성 시각을 그대로 저장"""
+    saved = []
+    for model in models:
+        for field in model._meta.concrete_fields:
+            if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+                saved.append((field, field.auto_now, field.auto_now_add))
+                field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+class Seeder:
+    def __init__(self, scale=1.0, batch_size=2000, seed=42, log=print):
+        self.sizes = sizes_for(scale)
+        self.batch_size = batch_size
+        self.rng = random.Random(seed)
+        self.log = log
+        self.now = timezone.now()
+
+    # ---- 도구 ----
+
+    def _skewed(self, count):
+        """앞쪽 id일수록 자주 뽑히는 인덱스 (인기 영화/게시글 쏠림 흉내)"""
+        return int(count * self.rng.random() ** 3)
+
+    def _timestamp(self):
+        return self.now - datetime.timedelta(seconds=self.rng.randrange(HISTORY_DAYS * 86400))
+
+    def _insert(self, model, rows, total, ignore_conflicts=False):
+        """rows(생성기)를 batch_size씩 나눠 묶음마다 한 트랜잭션으로 저장"""
+        batch = []
+        written = 0
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                with transaction.atomic():
+                    model.objects.bulk_create(batch, ignore_conflicts=ignore_conflicts)
+                written += len(batch)
+                batch = []
+        if batch:
+            with transaction.atomic():
+                model.objects.bulk_create(batch, ignore_conflicts=ignore_conflicts)
+            written += len(batch)
+        self.log(f'  {model._meta.label}: {written}/{total}')
+
+    def _unique_pairs(self, total, left, right):
+        """(left 인덱스, right 인덱스) 중복 없는 쌍 total개"""
+        seen = set()
+        attempts = 0
+        while len(seen) < total and attempts < total * 5:
+            attempts += 1
+            pair = (left(), right())
+            if pair not in seen:
+                seen.add(pair)
+                yield pair
+
+    # ---- 단계 ----
+
+    def seed_catalog(self):
+        sizes = self.sizes
+        self._insert(Genre, (Genre(id=i, name=f'장르 {i}') for i in range(1, sizes['genres'] + 1)), sizes['genres'])
+        self._insert(Provider, (
+            Provider(id=i, name=f'Provider {i}', logo_path=f'https://example.com/p/{i}.png')
+            for i in range(1, sizes['providers'] + 1)
+        ), sizes['providers'])
+        self._insert(Director, (
+            Director(id=i, name=f'감독 {i}', role='Directing', profile_path=f'https://example.com/d/{i}.jpg')
+            for i in range(1, sizes['directors'] + 1)
+        ), sizes['directors'])
+        self._insert(Actor, (
+            Actor(id=i, name=f'배우 {i}', role='Acting', profile_path=f'https://example.com/a/{i}.jpg')
+            for i in range(1, sizes['actors'] + 1)
+        ), sizes['actors'])
+        self._insert(Movie, (
+            Movie(
+                id=i,
+                title=f'영화 {i}',
+                release_date=datetime.date(1950 + i % 75, 1 + i % 12, 1 + i % 28),
+                poster_path=f'https://example.com/m/{i}.jpg',
+                popularity=sizes['movies'] / i,
+                overview=f'영화 {i}의 줄거리입니다. ' * 5,
+                status='Released',
+                runtime=80 + i % 80,
+                vote_average=round(self.rng.uniform(1, 10), 1),
+            )
+            for i in range(1, sizes['movies'] + 1)
+        ), sizes['movies'])
+
+        movies, genres, directors = sizes['movies'], sizes['genres'], sizes['directors']
+        self._insert(Movie.genres.through, (
+            Movie.genres.through(movie_id=movie_id, genre_id=genre_id)
+            for movie_id in range(1, movies + 1)
+            for genre_id in {1 + movie_id % genres, 1 + (movie_id * 7) % genres}
+        ), movies * 2)
+        self._insert(Movie.directors.through, (
+            Movie.directors.through(movie_id=movie_id, director_id=1 + self._skewed(directors))
+            for movie_id in range(1, movies + 1)
+        ), movies)
+        self._insert(MovieProvider, (
+            MovieProvider(
+                movie_id=movie_id, provider_id=1 + movie_id % sizes['providers'],
+                provider_type='flatrate', display_priority=0,
+            )
+            for movie_id in range(1, movies + 1)
+        ), movies)
+
+        # 온보딩 풀 - 인기 상위 영화는 유명한 영화, 하위 영화는 숨은 영화
+        pool = min(ONBOARDING_POOL_SIZE, movies // 2)
+        self._insert(OnboardingMovie, (
+            OnboardingMovie(
+                movie_id=movie_id, movie_type='famous' if movie_id <= pool else 'hidden',
+                display_order=order,
+            )
+            for order, movie_id in enumerate(
+                list(range(1, pool + 1)) + list(range(movies - pool + 1, movies + 1))
+            )
+        ), pool * 2)
+
+        per_movie = max(1, sizes['cast'] // movies)
+        self._insert(MovieActor, (
+            MovieActor(
+                movie_id=movie_id, actor_id=1 + self._skewed(sizes['actors']),
+                character_name=f'역할 {order}', cast_order=order,
+            )
+            for movie_id in range(1, movies + 1)
+            for order in range(per_movie)
+        ), movies * per_movie, ignore_conflicts=True)
+
+    def seed_users(self):
+        sizes = self.sizes
+        # 비밀번호 해시는 느리므로 한 번만 계산해 모든 사용자가 공유
+        password = make_password(USER_PASSWORD)
+        self._insert(User, (
+            User(
+                username=username(i), password=password,
+                birth=datetime.date(1960 + i % 45, 1 + i % 12, 1 + i % 28),
+                onboarding_completed=True,
+            )
+            for i in range(sizes['users'])
+        ), sizes['users'])
+        self.user_ids = list(
+            User.objects.filter(username__startswith=USERNAME_PREFIX)
+            .order_by('id').values_list('id', flat=True)
+        )
+
+        users = self.user_ids
+        self._insert(Follow, (
+            # 앞쪽 사용자에게 팔로워가 몰리도록
+            Follow(follower_id=users[follower], following_id=users[following], created_at=self._timestamp())
+            for follower, following in self._unique_pairs(
+                sizes['follows'],
+                lambda: self.rng.randrange(len(users)),
+                lambda: self._skewed(len(users)),
+            )
+            if follower != following
+        ), sizes['follows'])
+
+    def seed_reviews(self):
+        sizes, users = self.sizes, self.user_ids
+        self._insert(MovieReview, (
+            MovieReview(
+                user_id=users[user], movie_id=1 + movie, content=f'리뷰 {user}-{movie}',
+                rating=self.rng.randint(1, 10) / 2, created_at=(created := self._timestamp()),
+                updated_at=created,
+            )
+            for user, movie in self._unique_pairs(
+                sizes['reviews'],
+                lambda: self.rng.randrange(len(users)),
+                lambda: self._skewed(sizes['movies']),
+            )
+        ), sizes['reviews'])
+
+    def seed_community(self):
+        sizes, users = self.sizes, self.user_ids
+        self._insert(Tag, (Tag(name=f'태그{i}') for i in range(sizes['tags'])), sizes['tags'])
+        tag_ids = list(Tag.objects.order_by('id').values_list('id', flat=True))
+
+        self._insert(Post, (
+            Post(
+                user_id=users[self._skewed(len(users))],
+                title=f'게시글 {i} 영화 이야기', content=f'게시글 {i} 본문입니다. ' * 10,
+                created_at=(created := self._timestamp()), updated_at=created,
+            )
+            for i in range(sizes['posts'])
+        ), sizes['posts'])
+        post_ids = list(Post.objects.order_by('id').values_list('id', flat=True))
+
+        self._insert(Post.tags.through, (
+            Post.tags.through(post_id=post_id, tag_id=tag_ids[self._skewed(len(tag_ids))])
+            for post_id in post_ids
+        ), len(post_ids), ignore_conflicts=True)
+
+        # 댓글의 20%는 대댓글 (앞서 만든 최상위 댓글 중에서 부모 선택)
+        top_level = sizes['comments'] * 4 // 5
+        self._insert(Comment, (
+            Comment(
+                user_id=users[self.rng.randrange(len(users))], post_id=post_ids[self._skewed(len(post_ids))],
+                content=f'댓글 {i}', created_at=(created := self._timestamp()), updated_at=created,
+            )
+            for i in range(top_level)
+        ), top_level)
+        parents = list(Comment.objects.order_by('id').values_list('id', 'post_id'))
+        self._insert(Comment, (
+            Comment(
+                user_id=users[self.rng.randrange(len(users))], post_id=parent[1], parent_id=parent[0],
+                content=f'답글 {i}', created_at=(created := self._timestamp()), updated_at=created,
+            )
+            for i, parent in enumerate(
+                parents[self._skewed(len(parents))] for _ in range(sizes['comments'] - top_level)
+            )
+        ), sizes['comments'] - top_level)
+        self.post_ids = post_ids
+        self.comment_ids = [comment_id for comment_id, _ in parents]
+
+    def seed_likes(self):
+        sizes, users = self.sizes, self.user_ids
+        movie_likes = list(self._unique_pairs(
+            sizes['movie_likes'],
+            lambda: self.rng.randrange(len(users)),
+            lambda: self._skewed(sizes['movies']),
+        ))
+        self._insert(Movie.liked_by.through, (
+            Movie.liked_by.through(user_id=users[user], movie_id=1 + movie) for user, movie in movie_likes
+        ), len(movie_likes))
+        self._insert(LikeActivity, (
+            LikeActivity(user_id=users[user], target_type='movie', target_id=1 + movie, created_at=self._timestamp())
+            for user, movie in movie_likes
+        ), len(movie_likes))
+        del movie_likes
+
+        self._insert(Post.like_users.through, (
+            Post.like_users.through(user_id=users[user], post_id=self.post_ids[post])
+            for user, post in self._unique_pairs(
+                sizes['post_likes'],
+                lambda: self.rng.randrange(len(users)),
+                lambda: self._skewed(len(self.post_ids)),
+            )
+        ), sizes['post_likes'])
+        self._insert(Comment.like_users.through, (
+            Comment.like_users.through(user_id=users[user], comment_id=self.comment_ids[comment])
+            for user, comment in self._unique_pairs(
+                sizes['comment_likes'],
+                lambda: self.rng.randrange(len(users)),
+                lambda: self._skewed(len(self.comment_ids)),
+            )
+        ), sizes['comment_likes'])
+
+    def rebuild_derived(self):
+        """bulk_create가 건너뛴 신호 대신 저장된 집계 값을 다시 계산"""
+        recount_likes(Post)
+        recount_likes(Comment)
+        recount_comments()
+        recount_tags()
+        redecay_hot_scores()
+        rebuild_index()
+        community_snapshot.invalidate()
+
+    def run(self):
+        steps = [
+            ('영화/인물', self.seed_catalog),
+            ('사용자/팔로우', self.seed_users),
+            ('영화 리뷰', self.seed_reviews),
+            ('커뮤니티', self.seed_community),
+            ('좋아요', self.seed_likes),
+            ('집계 값 재계산', self.rebuild_derived),
+        ]
+        models = (Follow, MovieReview, LikeActivity, Post, Comment)
+        with _manual_timestamps(*models):
+            for label, step in steps:
+                self.log(f'{label}...')
+                step()
@@ -0,0 +1,110 @@
+import statistics
+import time
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.renderers import JSONRenderer
+
+from movies.models import Movie, MovieReview
+from movies.serializer import (
+    MovieListSerializer, MovieListRowSerializer, MovieReviewSerializer, MovieReviewRowSerializer,
+)
+from posts.models import Post
+from posts.querysets import with_counts
+from posts.serializer import PostListSerializer, PostListRowSerializer
+
+# 직렬화 경로 비교
+# 같은 대상을 기존 ModelSerializer 경로(select_related/prefetch_related 쿼리셋)와
+# values() 행 직렬화 경로(cinemamemory.row_serializer)로 각각 만들어
+# JSONRenderer 출력이 바이트 단위로 같은지 확인하고 조회+직렬화 시간과 쿼리 수를 비교한다.
+# (인증/라우팅까지 포함한 엔드포인트 전체 시간은 run_benchmarks --baseline 비교로 본다)
+
+
+def _posts(context, rows):
+    return with_counts(Post.objects.all()).order_by('-created_at', '-id')[:rows]
+
+
+def _tag_posts(context, rows):
+    return with_counts(Post.objects.filter(tags__name=context['tag_name'])).order_by('-created_at')
+
+
+def _liked_posts(context, rows):
+    return with_counts(context['user'].liked_posts.all()).order_by('-created_at')
+
+
+def _movies(context, rows):
+    return Movie.objects.order_by('-popularity')[:rows]
+
+
+def _liked_movies(context, rows):
+    return context['user'].liked_movies.all()
+
+
+def _reviews(context, rows):
+    return MovieReview.objects.order_by('-created_at')[:rows]
+
+
+# (이름, 대상 쿼리셋 생성 함수, 기존 경로, values() 행 경로)
+CASES = [
+    ('post_list', _posts,
+     lambda qs: PostListSerializer(qs.select_related('user').prefetch_related('tags'), many=True).data,
+     lambda qs: PostListRowSerializer(PostListRowSerializer.values(qs)).data),
+    ('posts_by_tag', _tag_posts,
+     lambda qs: PostListSerializer(qs.select_related('user').prefetch_related('tags'), many=True).data,
+     lambda qs: PostListRowSerializer(PostListRowSerializer.values(qs)).data),
+    ('user_liked_posts', _liked_posts,
+     lambda qs: PostListSerializer(qs.select_related('user').prefetch_related('tags'), many=True).data,
+     lambda qs: PostListRowSerializer(PostListRowSerializer.values(qs)).data),
+    ('movie_list', _movies,
+     lambda qs: MovieListSerializer(qs, many=True).data,
+     lambda qs: MovieListRowSerializer(MovieListRowSerializer.values(qs)).data),
+    ('user_liked_movies', _liked_movies,
+     lambda qs: MovieListSerializer(qs, many=True).data,
+     lambda qs: MovieListRowSerializer(MovieListRowSerializer.values(qs)).data),
+    ('review_list', _reviews,
+     lambda qs: MovieReviewSerializer(qs.select_related('movie'), many=True).data,
+     lambda qs: MovieReviewRowSerializer(MovieReviewRowSerializer.values(qs)).data),
+]
+
+
+def _measure(render, iterations):
+    durations = []
+    body = b''
+    queries = 0
+    for _ in range(iterations):
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            body = render()
+            durations.append((time.perf_counter() - started) * 1000)
+        queries = len(captured)
+    return body, statistics.median(durations), queries
+
+
+def compare(context, rows=100, iterations=10, only=None):
+    """
+    CASES마다 두 경로를 iterations회 실행
+
+    반환: [{'name', 'items', 'identical', 'drf_ms', 'rows_ms', 'speedup', 'drf_queries', 'rows_queries'}]
+    """
+    renderer = JSONRenderer()
+    results = []
+    for name, build, drf, fast in CASES:
+        if only and name not in only:
+            continue
+        drf_body, drf_ms, drf_queries = _measure(
+            lambda: renderer.render(drf(build(context, rows))), iterations
+        )
+        rows_body, rows_ms, rows_queries = _measure(
+            lambda: renderer.render(fast(build(context, rows))), iterations
+        )
+        results.append({
+            'name': name,
+            'bytes': len(drf_body),
+            'identical': drf_body == rows_body,
+            'drf_ms': round(drf_ms, 2),
+            'rows_ms': round(rows_ms, 2),
+            'speedup': round(drf_ms / rows_ms, 2) if rows_ms else None,
+            'drf_queries': drf_queries,
+            'rows_queries': rows_queries,
+        })
+    return results
@@ -0,0 +1,179 @@
+import io
+import json
+import statistics
+import time
+from contextlib import redirect_stdout
+
+from django.db import connection
+from django.db.models import Count
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from rest_framework.authtoken.models import Token
+
+from accounts.models import User, Follow
+from movies.models import Movie, MovieActor
+from posts.models import Tag, Post, Comment
+from .seed import USERNAME_PREFIX
+
+# 엔드포인트 벤치마크
+# 시드 데이터에서 대표 대상(인기 영화/배우, 댓글이 많은 게시글, 팔로워가 많은 사용자 등)을 골라
+# 공개 엔드포인트를 테스트 클라이언트로 반복 호출하고 응답 시간 백분위와 쿼리 수를 기록한다.
+# 결과는 JSON으로 저장해 두었다가 다음 실행과 비교(diff)한다.
+API = '/api/v1/cinememory'
+PERCENTILES = (50, 90, 99)
+
+# (이름, 경로 템플릿, 로그인 필요 여부) - 경로는 BenchmarkContext 값으로 채움
+ENDPOINTS = [
+    ('movie_detail', '/movies/{movie_id}/', False),
+    ('person_detail', '/movies/person/{actor_id}/', False),
+    ('search_some', '/movies/search/?search=영화 1', False),
+    ('user_liked_movies', '/movies/user/liked/', True),
+    ('user_reviews', '/movies/user/reviews/', True),
+    ('post_list', '/community/', False),
+    ('post_list_hot', '/community/?sort=hot', False),
+    ('post_list_popular', '/community/?sort=popular', False),
+    ('post_detail', '/community/post/{post_id}/', True),
+    ('comment_list', '/community/post/{post_id}/comments/list/', True),
+    ('tag_list', '/community/tags/', False),
+    ('posts_by_tag', '/community/tags/{tag_name}/posts/', False),
+    ('search_community', '/community/search/?q=영화 이야기', False),
+    ('community_stats', '/community/stats/', False),
+    ('user_posts', '/community/user/posts/', True),
+    ('user_comments', '/community/user/comments/', True),
+    ('user_liked_posts', '/community/user/liked-posts/', True),
+    ('get_my_info', '/accounts/me/', True),
+    ('get_user_profile', '/accounts/{popular_user_id}/', False),
+    ('get_followers', '/accounts/{popular_user_id}/followers/', False),
+    ('get_following', '/accounts/{user_id}/following/', False),
+    ('get_feed', '/accounts/feed/', True),
+    ('get_notifications', '/accounts/notifications/', True),
+    ('onboarding_famous_movies', '/accounts/onboarding/movies/famous/', True),
+]
+
+
+class BenchmarkContext(dict):
+    """경로 템플릿에 넣을 대표 대상 id"""
+
+    @classmethod
+    def from_database(cls):
+        # 팔로잉이 가장 많은 시드 사용자를 요청 사용자로 (피드/좋아요 목록이 비지 않도록)
+        user = (
+            User.objects.filter(username__startswith=USERNAME_PREFIX)
+            .annotate(num_following=Count('following'))
+            .order_by('-num_following', 'id').first()
+        )
+        if user is None:
+            return None
+        popular_user_id = (
+            Follow.objects.values('following_id').annotate(n=Count('id'))
+            .order_by('-n').values_list('following_id', flat=True).first()
+        )
+        post_id = (
+            Comment.objects.values('post_id').annotate(n=Count('id'))
+            .order_by('-n').values_list('post_id', flat=True).first()
+        ) or Post.objects.values_list('id', flat=True).first()
+        return cls(
+            user=user,
+            user_id=user.id,
+            popular_user_id=popular_user_id or user.id,
+            movie_id=Movie.objects.order_by('-popularity').values_list('id', flat=True).first(),
+            actor_id=(
+                MovieActor.objects.values('actor_id').annotate(n=Count('id'))
+                .order_by('-n').values_list('actor_id', flat=True).first()
+            ),
+            post_id=post_id,
+            tag_name=Tag.objects.order_by('-post_count').values_list('name', flat=True).first(),
+        )
+
+
+def _percentile(sorted_values, percent):
+    index = min(len(sorted_values) - 1, int(round(percent / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def time_endpoint(client, path, iterations, warmup):
+    """path를 warmup회 호출한 뒤 iterations회 측정"""
+    for _ in range(warmup):
+        client.get(path)
+
+    durations = []
+    queries = []
+    status_code = None
+    for _ in range(iterations):
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            response = client.get(path)
+            durations.append((time.perf_counter() - started) * 1000)
+        queries.append(len(captured))
+        status_code = response.status_code
+
+    durations.sort()
+    result = {
+        'status': status_code,
+        'queries': max(queries),
+        'mean_ms': round(statistics.fmean(durations), 2),
+    }
+    for percent in PERCENTILES:
+        result[f'p{percent}_ms'] = round(_percentile(durations, percent), 2)
+    return result
+
+
+def run_suite(context, iterations=30, warmup=3, only=None, log=print):
+    token, _ = Token.objects.get_or_create(user=context['user'])
+    # 테스트 환경 설정 없이 실행하므로 ALLOWED_HOSTS에 있는 호스트로 요청
+    clients = {
+        True: Client(HTTP_HOST='localhost', HTTP_AUTHORIZATION=f'Token {token.key}'),
+        False: Client(HTTP_HOST='localhost'),
+    }
+
+    results = {}
+    for name, template, needs_login in ENDPOINTS:
+        if only and name not in only:
+            continue
+        path = API + template.format(**context)
+        # 뷰의 디버그 출력/쿼리 예산 경고가 결과 표를 덮지 않도록 측정 중에는 버림
+        with redirect_stdout(io.StringIO()):
+            results[name] = time_endpoint(clients[needs_login], path, iterations, warmup)
+        result = results[name]
+        log(
+            f"{name:<28} {result['status']}  p50 {result['p50_ms']:>8.2f}ms  "
+            f"p99 {result['p99_ms']:>8.2f}ms  queries {result['queries']}"
+        )
+    return results
+
+
+# ---- 기준 결과 비교 ----
+
+def load_results(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_results(path, results, meta):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'meta': meta, 'results': results}, f, ensure_ascii=False, indent=2)
+
+
+def diff_results(baseline, current, threshold=0.1):
+    """
+    기준 결과 대비 변화
+
+    반환: [(이름, 항목, 기준값, 현재값, 변화율, 회귀 여부)]
+    p50/p99가 threshold 비율 이상 느려지거나 쿼리 수가 늘면 회귀로 본다.
+    """
+    rows = []
+    for name, result in current.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        for key in ('p50_ms', 'p99_ms', 'queries'):
+            old, new = before.get(key), result.get(key)
+            if old is None or new is None:
+                continue
+            change = (new - old) / old if old else 0.0
+            if key == 'queries':
+                regressed = new > old
+            else:
+                regressed = change > threshold
+            rows.append((name, key, old, new, change, regressed))
+    return rows
@@ -0,0 +1,245 @@
+import functools
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.response import Response
+
+from .db_router import LAG_TOLERANCE, REPLICAS
+
+# 태그 기반 뷰 응답 캐시
+# @cached_view는 뷰가 돌려준 직렬화 결과(response.data)를 의존 태그(예: 'movie:123', 'post:*')의
+# 현재 버전을 합친 키로 저장한다. 모델 저장/삭제 신호가 invalidate()로 태그 버전을 올리면
+# 이전 키는 더 이상 조회되지 않는다. 'post:45'를 무효화하면 'post:*'도 함께 올라간다.
+# 조회 순서: 프로세스 LRU -> 공유 캐시(CACHES[VIEW_CACHE_ALIAS]) -> 뷰 실행.
+# 태그 버전은 매 요청 CACHES[VIEW_CACHE_ALIAS]에서 읽으므로 공유 백엔드(Redis 등)면 LRU도 다른 프로세스의
+# 무효화를 따른다. 프로세스별 백엔드(LocMem, 기본값)에서는 다른 워커의 무효화가 보이지 않으므로
+# 보관 시간을 VIEW_CACHE_LOCAL_TIMEOUT(초)으로 줄여 그 시간 안에만 늦게 반영되게 한다.
+# 읽기 복제본이 있으면 지연 중에 옛 데이터가 새 버전으로 다시 저장될 수 있으므로
+# REPLICA_LAG_TOLERANCE 뒤에 한 번 더 버전을 올린다.
+# (신호를 거치지 않는 카운터 - 조회수 등 - 는 timeout 동안 늦게 반영될 수 있다)
+CACHE_ALIAS = getattr(settings, 'VIEW_CACHE_ALIAS', 'default')
+DEFAULT_TIMEOUT = getattr(settings, 'VIEW_CACHE_TIMEOUT', 300)
+LOCAL_SIZE = getattr(settings, 'VIEW_CACHE_LOCAL_SIZE', 512)
+LOCAL_TIMEOUT = getattr(settings, 'VIEW_CACHE_LOCAL_TIMEOUT', 10)  # 프로세스별 캐시 백엔드일 때 최대 보관 시간(초)
+VERSION_KEY = 'viewcache:tag:{}'
+ENTRY_KEY = 'viewcache:entry:{}'
+
+
+def _shared():
+    return caches[CACHE_ALIAS]
+
+
+# 프로세스마다 따로 저장되는 백엔드 - 다른 워커의 쓰기/삭제가 보이지 않는다
+PROCESS_LOCAL_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def is_shared_cache(alias='default'):
+    """CACHES[alias]가 모든 워커 프로세스가 함께 보는 백엔드인지 (Redis/Memcached/DB 등)"""
+    return settings.CACHES[alias]['BACKEND'] not in PROCESS_LOCAL_BACKENDS
+
+
+# ---- 태그 버전 ----
+
+def _expand(tags):
+    """'post:45' -> {'post:45', 'post:*'}"""
+    expanded = set()
+    for tag in tags:
+        expanded.add(tag)
+        prefix, _, rest = tag.partition(':')
+        if rest and rest != '*':
+            expanded.add(f'{prefix}:*')
+    return expanded
+
+
+def _new_version():
+    # 버전 키가 밀려나 다시 만들어져도 예전 값과 겹치지 않도록 시간 기반으로 시작
+    return time.time_ns()
+
+
+def tag_versions(tags):
+    shared = _shared()
+    keys = {tag: VERSION_KEY.format(tag) for tag in tags}
+    found = shared.get_many(list(keys.values()))
+    versions = {}
+    for tag, key in keys.items():
+        version = found.get(key)
+        if version is None:
+            shared.add(key, _new_version(), timeout=None)
+            version = shared.get(key)
+        versions[tag] = version
+    return versions
+
+
+def _bump(tags):
+    shared = _shared()
+    for tag in tags:
+        key = VERSION_KEY.format(tag)
+        try:
+            shared.incr(key)
+        except ValueError:
+            shared.set(key, _new_version(), timeout=None)
+    metrics.record('invalidations', len(tags))
+
+
+def _bump_after_commit(tags):
+    _bump(tags)
+    if REPLICAS and LAG_TOLERANCE > 0:
+        timer = threading.Timer(LAG_TOLERANCE, _bump, [tags])
+        timer.daemon = True
+        timer.start()
+
+
+def invalidate(*tags):
+    """tags(와 해당 '*' 태그)에 의존하는 캐시 무효화 - 트랜잭션 커밋 뒤 실행"""
+    expanded = _expand(tags)
+    if expanded:
+        transaction.on_commit(lambda: _bump_after_commit(expanded))
+
+
+# ---- 프로세스 LRU ----
+
+class LocalLRU:
+    def __init__(self, size=LOCAL_SIZE):
+        self.size = size
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # 키 -> (만료 시각, 값)
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, value, timeout):
+        if self.size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + timeout, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+local_cache = LocalLRU()
+
+
+# ---- 적중률 ----
+
+class CacheMetrics:
+    COUNTERS = ('local_hits', 'shared_hits', 'misses', 'stored', 'invalidations')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals = dict.fromkeys(self.COUNTERS, 0)
+        self._views = {}  # 뷰 이름 -> {'local_hits', 'shared_hits', 'misses'}
+
+    def record(self, counter, amount=1, view=None):
+        with self._lock:
+            self._totals[counter] += amount
+            if view is not None:
+                entry = self._views.setdefault(view, {'local_hits': 0, 'shared_hits': 0, 'misses': 0})
+                entry[counter] = entry.get(counter, 0) + amount
+
+    def summary(self):
+        with self._lock:
+            totals = dict(self._totals)
+            views = {name: dict(entry) for name, entry in self._views.items()}
+
+        def hit_rate(entry):
+            lookups = entry['local_hits'] + entry['shared_hits'] + entry['misses']
+            return round((entry['local_hits'] + entry['shared_hits']) / lookups, 4) if lookups else None
+
+        return {
+            **totals,
+            'hit_rate': hit_rate(totals),
+            'local_entries': len(local_cache),
+            'views': {name: {**entry, 'hit_rate': hit_rate(entry)} for name, entry in views.items()},
+        }
+
+    def reset(self):
+        with self._lock:
+            self._totals = dict.fromkeys(self.COUNTERS, 0)
+            self._views.clear()
+
+
+metrics = CacheMetrics()
+
+
+# ---- 데코레이터 ----
+
+def _entry_key(name, request, versions, per_user):
+    parts = [name, request.get_full_path()]
+    if per_user:
+        parts.append(f'user={request.user.id or 0}')
+    # @conditional_view 아래라면 ETag가 가리키는 버전의 본문만 꺼내 쓴다
+    # (프로세스별 캐시에서 다른 워커의 쓰기를 못 본 옛 본문이 새 ETag로 나가지 않도록)
+    etag = getattr(request, 'conditional_etag', None)
+    if etag:
+        parts.append(f'etag={etag}')
+    raw = '|'.join([*parts, *(f'{tag}={versions[tag]}' for tag in sorted(versions))])
+    return ENTRY_KEY.format(hashlib.md5(raw.encode()).hexdigest())
+
+
+def cached_view(*tags, timeout=DEFAULT_TIMEOUT, per_user=False):
+    """
+    GET 응답을 태그 단위로 캐시
+
+    tags: 뷰 인자로 채우는 형식 문자열 (예: 'person:{person_id}', 'tag:*')
+    per_user: 응답에 요청 사용자별 값(is_liked 등)이 있으면 True - 사용자마다 따로 저장
+    @api_view / @permission_classes 아래(def 바로 위)에 붙인다 - 인증/권한 확인은 매번 실행되고
+    적중하면 뷰 본문과 직렬화만 건너뛴다. 200 응답만 저장한다.
+    """
+    def decorator(view):
+        name = view.__name__
+        # 다른 워커의 무효화를 볼 수 없으면 짧게만 보관
+        entry_timeout = timeout if is_shared_cache(CACHE_ALIAS) else min(timeout, LOCAL_TIMEOUT)
+
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method != 'GET':
+                return view(request, *args, **kwargs)
+
+            dependencies = [tag.format(**kwargs) for tag in tags]
+            key = _entry_key(name, request, tag_versions(dependencies), per_user)
+
+            data = local_cache.get(key)
+            if data is not None:
+                metrics.record('local_hits', view=name)
+                return Response(data, headers={'X-Cache': 'HIT-LOCAL'})
+
+            data = _shared().get(key)
+            if data is not None:
+                metrics.record('shared_hits', view=name)
+                local_cache.set(key, data, entry_timeout)
+                return Response(data, headers={'X-Cache': 'HIT'})
+
+            metrics.record('misses', view=name)
+            response = view(request, *args, **kwargs)
+            if isinstance(response, Response) and response.status_code == 200:
+                _shared().set(key, response.data, entry_timeout)
+                local_cache.set(key, response.data, entry_timeout)
+                metrics.record('stored')
+                response['X-Cache'] = 'MISS'
+            return response
+        return wrapper
+    return decorator
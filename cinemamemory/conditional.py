@@ -0,0 +1,85 @@
+import functools
+import hashlib
+
+from django.db.models import Count, Max, OuterRef, Subquery, Sum
+from django.utils.cache import get_conditional_response
+
+# 조건부 GET (ETag / If-None-Match)
+# 뷰마다 응답 내용을 결정하는 값(updated_at, 좋아요/댓글 수 같은 변경 카운터, 요청 사용자)을
+# 한 번의 가벼운 쿼리로 읽는 version 함수를 두고, 그 값으로 ETag를 만든다.
+# If-None-Match가 일치하면 본문 조회와 직렬화 없이 304를 돌려준다.
+# 버퍼링 중인 조회수처럼 자주 바뀌는 부수 값은 버전에 넣지 않으므로 weak ETag를 쓴다.
+# (카운터 변화는 시각으로 표현되지 않아 Last-Modified / If-Modified-Since는 쓰지 않는다)
+
+
+def make_etag(name, version):
+    digest = hashlib.sha256(repr((name, version)).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def _related(queryset, field, aggregate):
+    return Subquery(
+        queryset.filter(**{field: OuterRef('pk')}).order_by()
+        .values(field).annotate(value=aggregate).values('value')
+    )
+
+
+def related_count(queryset, field):
+    """queryset 중 field가 바깥 행 pk인 행 수 (version 쿼리용 상관 서브쿼리, 없으면 None)"""
+    return _related(queryset, field, Count('*'))
+
+
+def related_max(queryset, field, column):
+    return _related(queryset, field, Max(column))
+
+
+def related_sum(queryset, field, column):
+    return _related(queryset, field, Sum(column))
+
+
+def viewer_id(request):
+    """응답에 요청 사용자별 값(is_liked 등)이 있을 때 버전에 포함할 사용자 id (비로그인은 0)"""
+    user = getattr(request, 'user', None)
+    return user.id if user is not None and user.is_authenticated else 0
+
+
+def conditional_view(version, on_not_modified=None):
+    """
+    version(request, *args, **kwargs) 결과로 ETag를 붙이고 If-None-Match가 맞으면 304
+
+    version이 None을 돌려주면(대상 없음 등) 조건 처리 없이 뷰를 그대로 실행한다.
+    on_not_modified: 304로 응답할 때도 실행할 부수 작업 (예: 조회수 기록)
+    @api_view / @permission_classes 아래에 붙인다 - 인증이 끝난 request.user를 쓴다.
+    @read_replica와 함께 쓰면 그 아래에 붙여 버전과 본문을 같은 DB에서 읽게 한다.
+    """
+    def decorator(view):
+        name = view.__name__
+
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if request.method not in ('GET', 'HEAD'):
+                return view(request, *args, **kwargs)
+
+            current = version(request, *args, **kwargs)
+            if current is None:
+                return view(request, *args, **kwargs)
+
+            etag = make_etag(name, current)
+            # 아래 @cached_view가 이 버전으로 저장된 본문만 쓰도록 (cinemamemory.cache._entry_key)
+            request.conditional_etag = etag
+            not_modified = get_conditional_response(request, etag=etag)
+            if not_modified is not None:
+                if on_not_modified is not None:
+                    on_not_modified(request, *args, **kwargs)
+                not_modified['ETag'] = etag
+                not_modified['Cache-Control'] = 'private, no-cache'
+                return not_modified
+
+            response = view(request, *args, **kwargs)
+            if response.status_code == 200:
+                response['ETag'] = etag
+                # 사용자별 값이 섞여 있으므로 공유 캐시에는 저장하지 않고 매번 재검증
+                response['Cache-Control'] = 'private, no-cache'
+            return response
+        return wrapper
+    return decorator
@@ -0,0 +1,158 @@
+import contextvars
+import functools
+import random
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connections
+
+# 읽기/쓰기 DB 분리
+# @read_replica를 붙인 읽기 전용 뷰의 ORM 읽기만 복제본(DATABASE_REPLICAS 중 하나)으로 보내고,
+# 나머지 읽기와 모든 쓰기는 default로 간다. 쓰기 요청을 마친 사용자는 REPLICA_LAG_TOLERANCE(초) 동안
+# 고정(pin)되어 복제본이 따라오기 전에도 자신이 쓴 내용을 default에서 읽는다.
+# 고정 정보는 Django 캐시에 두므로 복제본을 쓰려면 공유 캐시 백엔드가 필요하다
+# (프로세스별 캐시면 다른 워커가 고정을 못 보고 지연된 복제본을 읽으므로 시작할 때 거부한다).
+# (connection.cursor()로 직접 실행하는 SQL은 라우터를 거치지 않고 항상 default)
+DEFAULT_DB = 'default'
+REPLICAS = list(getattr(settings, 'DATABASE_REPLICAS', []))
+LAG_TOLERANCE = getattr(settings, 'REPLICA_LAG_TOLERANCE', 5)
+PIN_KEY = 'db_router:pinned:{}'
+
+_replica = contextvars.ContextVar('read_replica', default=None)  # 현재 뷰가 읽을 복제본 alias
+_request_state = contextvars.ContextVar('db_request_state', default=None)
+
+
+class _RequestState:
+    def __init__(self):
+        self.wrote = False
+
+
+def pin_user(user_id):
+    """이 사용자의 읽기를 LAG_TOLERANCE 동안 default로"""
+    if REPLICAS and LAG_TOLERANCE > 0:
+        cache.set(PIN_KEY.format(user_id), 1, timeout=LAG_TOLERANCE)
+
+
+def is_pinned(user_id):
+    return cache.get(PIN_KEY.format(user_id)) is not None
+
+
+def check_pin_cache():
+    """복제본이 설정됐는데 default 캐시가 프로세스별이면 ImproperlyConfigured"""
+    from .cache import is_shared_cache  # cache 모듈이 이 모듈을 import 한다
+
+    if REPLICAS and LAG_TOLERANCE > 0 and not is_shared_cache():
+        raise ImproperlyConfigured(
+            'DATABASE_REPLICAS를 쓰려면 공유 캐시(CACHE_BACKEND=Redis/Memcached 등)가 필요합니다. '
+            '쓰기 뒤 고정 정보가 워커 사이에 공유되지 않습니다.'
+        )
+
+
+def _choose_replica(request):
+    if not REPLICAS:
+        return None
+    user = getattr(request, 'user', None)
+    if user is not None and user.is_authenticated and is_pinned(user.id):
+        return None
+    return random.choice(REPLICAS)
+
+
+def read_replica(view):
+    """
+    읽기 전용 뷰를 복제본에서 실행
+
+    @api_view / @permission_classes 아래에 붙인다 - DRF 인증이 끝난 request.user로
+    고정 여부를 판단하기 위해서다.
+    """
+    @functools.wraps(view)
+    def wrapper(request, *args, **kwargs):
+        alias = _choose_replica(request)
+        if alias is None:
+            return view(request, *args, **kwargs)
+        token = _replica.set(alias)
+        try:
+            return view(request, *args, **kwargs)
+        finally:
+            _replica.reset(token)
+    return wrapper
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        alias = _replica.get()
+        if alias is None:
+            return None
+        state = _request_state.get()
+        if state is not None and state.wrote:
+            # 같은 요청 안에서 쓴 내용을 바로 읽는 경우
+            return DEFAULT_DB
+        if connections[DEFAULT_DB].in_atomic_block:
+            return DEFAULT_DB
+        return alias
+
+    def db_for_write(self, model, **hints):
+        state = _request_state.get()
+        if state is not None:
+            state.wrote = True
+        return DEFAULT_DB
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 default와 같은 데이터
+        databases = {DEFAULT_DB, *REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # 복제본 스키마는 default에서 복제된다
+        if db in REPLICAS:
+            return False
+        return None
+
+
+class ReplicaPinningMiddleware:
+    """쓰기 요청(안전하지 않은 메서드 또는 라우터를 거친 쓰기)을 마친 로그인 사용자를 고정"""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        check_pin_cache()
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self._acall(request)
+
+        state = _RequestState()
+        token = _request_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_state.reset(token)
+        self._pin(request, response, state)
+        return response
+
+    async def _acall(self, request):
+        state = _RequestState()
+        token = _request_state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _request_state.reset(token)
+        self._pin(request, response, state)
+        return response
+
+    def _pin(self, request, response, state):
+        if not (state.wrote or request.method not in ('GET', 'HEAD', 'OPTIONS')):
+            return
+        if response.status_code >= 400:
+            return
+        # DRF가 인증한 사용자도 request.user에 반영된다
+        user = getattr(request, 'user', None)
+        if user is not None and user.is_authenticated:
+            pin_user(user.id)
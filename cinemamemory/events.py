@@ -0,0 +1,136 @@
+import asyncio
+import json
+import threading
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.module_loading import import_string
+from rest_framework.utils.encoders import JSONEncoder
+
+# 실시간 이벤트 버스
+# publish()는 동기 코드(뷰, 신호)에서, subscribe()는 비동기 스트리밍 뷰에서 호출한다.
+# 기본 InProcessBackend는 한 프로세스 안에서만 전달되므로 워커가 여러 개면
+# EVENT_BUS_BACKEND 설정으로 RedisBackend 등 프로세스 간 백엔드를 지정한다.
+# 백엔드는 publish(channel, event)와 async subscribe(channel) -> 구독 객체(get/close)를 제공한다.
+SUBSCRIBER_QUEUE_SIZE = 100  # 느린 구독자는 오래된 이벤트부터 버림
+
+
+def dumps_event(event):
+    return json.dumps(event, cls=JSONEncoder, ensure_ascii=False)
+
+
+class _QueueSubscription:
+    def __init__(self, backend, channel, loop):
+        self.backend = backend
+        self.channel = channel
+        self.loop = loop
+        self.queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def deliver(self, event):
+        # 이벤트 루프 스레드에서 실행됨
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(event)
+
+    async def get(self, timeout):
+        """다음 이벤트 - timeout(초) 동안 없으면 None"""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def close(self):
+        self.backend._remove(self)
+
+
+class InProcessBackend:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {}  # channel -> set(_QueueSubscription)
+
+    def publish(self, channel, event):
+        # 직렬화 가능한 형태로 한 번 변환해 두어 구독자 간 객체 공유를 피함
+        event = json.loads(dumps_event(event))
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, event)
+            except RuntimeError:
+                # 루프가 이미 닫힌 구독자
+                self._remove(subscription)
+
+    async def subscribe(self, channel):
+        subscription = _QueueSubscription(self, channel, asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def _remove(self, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.channel]
+
+
+class _RedisSubscription:
+    def __init__(self, client, pubsub):
+        self.client = client
+        self.pubsub = pubsub
+
+    async def get(self, timeout):
+        message = await self.pubsub.get_message(ignore_subscribe_messages=True, timeout=timeout)
+        if message is None:
+            return None
+        return json.loads(message['data'])
+
+    async def close(self):
+        await self.pubsub.aclose()
+        await self.client.aclose()
+
+
+class RedisBackend:
+    """여러 워커 프로세스 배포용 - redis 패키지와 EVENT_BUS_REDIS_URL 설정 필요"""
+
+    def __init__(self):
+        try:
+            import redis
+            import redis.asyncio
+        except ImportError:
+            raise ImproperlyConfigured('RedisBackend를 사용하려면 redis 패키지를 설치해야 합니다.')
+        self._redis = redis
+        self.url = getattr(settings, 'EVENT_BUS_REDIS_URL', 'redis://localhost:6379/0')
+        self._client = redis.Redis.from_url(self.url)
+
+    def publish(self, channel, event):
+        self._client.publish(channel, dumps_event(event))
+
+    async def subscribe(self, channel):
+        client = self._redis.asyncio.Redis.from_url(self.url)
+        pubsub = client.pubsub()
+        await pubsub.subscribe(channel)
+        return _RedisSubscription(client, pubsub)
+
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_event_bus():
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                path = getattr(settings, 'EVENT_BUS_BACKEND', 'cinemamemory.events.InProcessBackend')
+                _backend = import_string(path)()
+    return _backend
+
+
+def publish(channel, event):
+    """이벤트 발행 - 실패해도 호출한 요청은 계속 진행"""
+    try:
+        get_event_bus().publish(channel, event)
+    except Exception as e:
+        print(f"❌ 이벤트 발행 오류 ({channel}): {str(e)}")
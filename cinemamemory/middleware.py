@@ -0,0 +1,247 @@
+import contextvars
+import re
+import threading
+import time
+from collections import Counter, deque
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+# 요청별 SQL 사용량 계측
+# DB 연결마다 execute_wrapper를 한 번 걸어 두고, 현재 요청의 측정값(contextvar)이 있으면
+# 쿼리 수/SQL 시간/쿼리 모양(fingerprint)을 모은다. 뷰 안에서 SQL을 뺀 파이썬 시간(serializer.data 평가 포함)과
+# 응답 렌더링(JSON 인코딩) 시간은 process_view/process_template_response 훅으로 따로 잰다.
+# contextvar는 sync_to_async 스레드로도 전달되므로 ASGI에서 실행되는 동기 뷰도 계측된다. 결과는 Server-Timing 헤더로 내려주고,
+# 쿼리 예산을 넘긴 요청은 반복된 쿼리와 함께 출력하며, 경로별 최근 표본으로 백분위를 계산한다.
+# (스트리밍 응답 본문을 만드는 동안과 백그라운드 스레드의 쿼리는 포함되지 않는다)
+QUERY_BUDGET = getattr(settings, 'QUERY_BUDGET', 30)
+QUERY_BUDGET_OVERRIDES = getattr(settings, 'QUERY_BUDGET_OVERRIDES', {})  # URL 이름 -> 예산
+REPEATED_QUERY_THRESHOLD = getattr(settings, 'REPEATED_QUERY_THRESHOLD', 5)  # 같은 모양이 이 횟수 이상이면 N+1 의심
+ROUTE_SAMPLE_SIZE = getattr(settings, 'QUERY_STATS_SAMPLE_SIZE', 500)  # 경로별 보관할 최근 요청 수
+SERVER_TIMING_ENABLED = getattr(settings, 'SERVER_TIMING_ENABLED', True)
+PERCENTILES = (50, 90, 99)
+
+_NUMBER_RE = re.compile(r'\b\d+\b')
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_IN_LIST_RE = re.compile(r'\((?:\s*%s\s*,)+\s*%s\s*\)')
+
+
+def fingerprint(sql):
+    """값만 다른 쿼리를 같은 모양으로 묶기 위한 정규화"""
+    sql = _STRING_RE.sub('?', sql)
+    sql = _NUMBER_RE.sub('?', sql)
+    sql = _IN_LIST_RE.sub('(...)', sql)
+    return ' '.join(sql.split())
+
+
+class RequestMetrics:
+    def __init__(self):
+        self.query_count = 0
+        self.sql_seconds = 0.0
+        self.app_seconds = 0.0  # 뷰 안에서 SQL을 뺀 시간 (serializer, SerializerMethodField 등)
+        self.render_seconds = 0.0
+        self.view_started = None
+        self.fingerprints = Counter()
+
+    def __call__(self, execute, sql, params, many, context):
+        # connection.execute_wrapper 훅
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_seconds += time.perf_counter() - started
+            self.query_count += 1
+            self.fingerprints[fingerprint(sql)] += 1
+
+    def repeated_queries(self):
+        return [
+            (sql, count) for sql, count in self.fingerprints.most_common()
+            if count >= REPEATED_QUERY_THRESHOLD
+        ]
+
+
+_current = contextvars.ContextVar('request_metrics', default=None)
+
+
+def _record_query(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    return metrics(execute, sql, params, many, context)
+
+
+def _install_wrapper(connection, **kwargs):
+    if _record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record_query)
+
+
+# ---- 경로별 집계 ----
+
+def _percentile(sorted_values, percent):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, int(round(percent / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class RouteStats:
+    def __init__(self, sample_size=ROUTE_SAMPLE_SIZE):
+        self.sample_size = sample_size
+        self._lock = threading.Lock()
+        self._routes = {}  # (메서드, 경로) -> {'count', 'over_budget', 'samples': deque}
+
+    def record(self, method, route, duration, metrics, over_budget):
+        with self._lock:
+            entry = self._routes.get((method, route))
+            if entry is None:
+                entry = self._routes[(method, route)] = {
+                    'count': 0, 'over_budget': 0, 'samples': deque(maxlen=self.sample_size),
+                }
+            entry['count'] += 1
+            entry['over_budget'] += int(over_budget)
+            entry['samples'].append(
+                (duration, metrics.query_count, metrics.sql_seconds, metrics.app_seconds, metrics.render_seconds)
+            )
+
+    def summary(self):
+        """경로별 최근 표본의 백분위 (시간은 ms)"""
+        with self._lock:
+            routes = [
+                (key, entry['count'], entry['over_budget'], list(entry['samples']))
+                for key, entry in self._routes.items()
+            ]
+
+        result = []
+        for (method, route), count, over_budget, samples in routes:
+            columns = {
+                'duration_ms': sorted(sample[0] * 1000 for sample in samples),
+                'queries': sorted(sample[1] for sample in samples),
+                'sql_ms': sorted(sample[2] * 1000 for sample in samples),
+                'app_ms': sorted(sample[3] * 1000 for sample in samples),
+                'render_ms': sorted(sample[4] * 1000 for sample in samples),
+            }
+            item = {
+                'method': method,
+                'route': route,
+                'requests': count,
+                'over_budget': over_budget,
+                'samples': len(samples),
+            }
+            for name, values in columns.items():
+                item[name] = {
+                    f'p{percent}': round(_percentile(values, percent), 2)
+                    for percent in PERCENTILES
+                }
+            result.append(item)
+        result.sort(key=lambda item: item['duration_ms']['p99'], reverse=True)
+        return result
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+
+
+route_stats = RouteStats()
+
+
+# ---- 미들웨어 ----
+
+def _route(request):
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return None, None
+    return match.url_name, '/' + match.route
+
+
+def _server_timing(metrics, duration):
+    parts = [
+        f'db;dur={metrics.sql_seconds * 1000:.1f};desc="{metrics.query_count} queries"',
+        f'app;dur={metrics.app_seconds * 1000:.1f}',
+        f'render;dur={metrics.render_seconds * 1000:.1f}',
+        f'total;dur={duration * 1000:.1f}',
+    ]
+    repeated = metrics.repeated_queries()
+    if repeated:
+        parts.append(f'repeated;desc="{len(repeated)} shapes, max x{repeated[0][1]}"')
+    return ', '.join(parts)
+
+
+class QueryBudgetMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+        connection_created.connect(_install_wrapper, dispatch_uid='query_budget_wrapper')
+        for connection in connections.all(initialized_only=True):
+            _install_wrapper(connection)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self._acall(request)
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        self._report(request, response, metrics, time.perf_counter() - started)
+        return response
+
+    async def _acall(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        self._report(request, response, metrics, time.perf_counter() - started)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        metrics = _current.get()
+        if metrics is not None:
+            metrics.view_started = (time.perf_counter(), metrics.sql_seconds)
+
+    def process_template_response(self, request, response):
+        # DRF Response는 뷰가 끝난 뒤 여기서 렌더링 직전 -> 뷰 시간과 렌더링 시간을 나눠 잰다
+        metrics = _current.get()
+        if metrics is None or metrics.view_started is None:
+            return response
+        view_started, sql_before = metrics.view_started
+        now = time.perf_counter()
+        metrics.app_seconds += max(0.0, (now - view_started) - (metrics.sql_seconds - sql_before))
+
+        def rendered(response):
+            metrics.render_seconds += time.perf_counter() - now
+        response.add_post_render_callback(rendered)
+        return response
+
+    def _report(self, request, response, metrics, duration):
+        url_name, route = _route(request)
+        if route is None:
+            return
+        budget = QUERY_BUDGET_OVERRIDES.get(url_name, QUERY_BUDGET)
+        over_budget = metrics.query_count > budget
+        route_stats.record(request.method, route, duration, metrics, over_budget)
+
+        if SERVER_TIMING_ENABLED:
+            response['Server-Timing'] = _server_timing(metrics, duration)
+
+        if over_budget:
+            print(
+                f"⚠️ 쿼리 예산 초과: {request.method} {route} "
+                f"{metrics.query_count}개 (예산 {budget}), SQL {metrics.sql_seconds * 1000:.1f}ms, "
+                f"app {metrics.app_seconds * 1000:.1f}ms, render {metrics.render_seconds * 1000:.1f}ms"
+            )
+            for sql, count in metrics.repeated_queries()[:3]:
+                print(f"   x{count} {sql[:200]}")
+
@@ -0,0 +1,102 @@
+import base64
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+# 키셋(커서) 페이지네이션 공용 도구
+# 커서는 마지막으로 내려준 행의 정렬 키를 base64(JSON)로 감싼 불투명한 문자열이다.
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(data):
+    raw = json.dumps(data, separators=(',', ':'), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(value):
+    """커서 문자열 해석 - 없으면 None, 잘못된 값이면 InvalidCursor"""
+    if not value:
+        return None
+    try:
+        padded = value + '=' * (-len(value) % 4)
+        return json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(str(e))
+
+
+def parse_cursor_datetime(value):
+    parsed = parse_datetime(value) if isinstance(value, str) else None
+    if parsed is None:
+        raise InvalidCursor(f'잘못된 시간 값: {value}')
+    return parsed
+
+
+def get_page_size(request, default=DEFAULT_PAGE_SIZE, maximum=MAX_PAGE_SIZE):
+    try:
+        size = int(request.GET.get('page_size', default))
+    except (TypeError, ValueError):
+        size = default
+    return max(1, min(size, maximum))
+
+
+def _dump(value):
+    if hasattr(value, 'isoformat'):
+        return {'t': value.isoformat()}
+    return value
+
+
+def _restore(value):
+    if isinstance(value, dict) and 't' in value:
+        return parse_cursor_datetime(value['t'])
+    return value
+
+
+def _value(row, field):
+    return row[field] if isinstance(row, dict) else getattr(row, field)
+
+
+def keyset_filter(queryset, fields, values, descending=True):
+    """fields 정렬(기본 내림차순)에서 values 위치 다음 행만 남김"""
+    lookup = 'lt' if descending else 'gt'
+    condition = Q()
+    for i, field in enumerate(fields):
+        clause = Q(**{f'{field}__{lookup}': values[i]})
+        for prev_field, prev_value in zip(fields[:i], values[:i]):
+            clause &= Q(**{prev_field: prev_value})
+        condition |= clause
+    return queryset.filter(condition)
+
+
+def paginate_keyset(queryset, fields, cursor, limit, descending=True):
+    """
+    fields 키셋 페이지네이션 (기본 내림차순, descending=False면 오름차순)
+
+    fields: 정렬 기준 필드/annotate 이름 (마지막은 id 처럼 유일한 값이어야 함)
+    cursor: 이전 응답의 next_cursor 문자열
+    반환: (행 리스트, 다음 커서 문자열 또는 None)
+    """
+    values = decode_cursor(cursor)
+    if values is not None:
+        if not isinstance(values, list) or len(values) != len(fields):
+            raise InvalidCursor('커서 형식이 올바르지 않습니다.')
+        try:
+            queryset = keyset_filter(
+                queryset, fields, [_restore(v) for v in values], descending
+            )
+        except (TypeError, ValueError, ValidationError) as e:
+            raise InvalidCursor(str(e))
+
+    prefix = '-' if descending else ''
+    rows = list(queryset.order_by(*[f'{prefix}{field}' for field in fields])[:limit + 1])
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([_dump(_value(rows[-1], field)) for field in fields])
+    return rows, next_cursor
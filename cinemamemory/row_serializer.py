@@ -0,0 +1,148 @@
+from itertools import islice
+
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import ISO_8601, fields as drf_fields, relations, serializers
+from rest_framework.settings import api_settings
+
+from .streaming import STREAM_CHUNK_SIZE
+
+# values() 행 직렬화
+# 행이 많은 목록 경로에서 ModelSerializer 인스턴스화와 필드별 to_representation 호출을 피하려고
+# values() 딕셔너리에서 응답 딕셔너리를 바로 만든다. 필드 순서와 변환 함수는 기존 serializer의
+# 필드 정의에서 한 번 컴파일해 두므로 JSON 출력은 기존 serializer와 같다
+# (python manage.py compare_serializers 로 확인).
+# 단순 필드가 아닌 필드(중첩 serializer, SerializerMethodField)는 하위 클래스의 get_<이름>(row)이 채우고,
+# 관련 행은 prefetch()에서 목록 전체에 대해 한 번에 모은다.
+
+# DRF 필드의 to_representation -> 같은 결과를 내는 내장 변환 (DB 값 기준)
+_BUILTIN = {
+    drf_fields.IntegerField.to_representation: int,
+    drf_fields.FloatField.to_representation: float,
+    drf_fields.CharField.to_representation: str,
+    drf_fields.BooleanField.to_representation: bool,
+}
+# values() 한 칸으로 표현되지 않는 필드 - get_<이름>()이 필요
+_NESTED = (
+    serializers.BaseSerializer, drf_fields.SerializerMethodField,
+    relations.RelatedField, relations.ManyRelatedField,
+)
+
+
+def _iso_format(field, default):
+    output_format = getattr(field, 'format', default)
+    return output_format is not None and output_format.lower() == ISO_8601
+
+
+def _datetime_converter(field):
+    """DateTimeField.to_representation 과 같은 결과 - 요청마다 현재 시간대로 만든다"""
+    if not _iso_format(field, api_settings.DATETIME_FORMAT):
+        return field.to_representation
+    tz = field.timezone if hasattr(field, 'timezone') else field.default_timezone()
+    if tz is None:
+        return field.to_representation
+
+    def convert(value):
+        if isinstance(value, str) or value.tzinfo is None:
+            return field.to_representation(value)
+        text = value.astimezone(tz).isoformat()
+        if text.endswith('+00:00'):
+            text = text[:-6] + 'Z'
+        return text
+    return convert
+
+
+def _converter(field):
+    if isinstance(field, drf_fields.DateField) and _iso_format(field, api_settings.DATE_FORMAT):
+        return lambda value: value if isinstance(value, str) else value.isoformat()
+    return _BUILTIN.get(type(field).to_representation, field.to_representation)
+
+
+class RowSerializer:
+    """
+    values() 행 목록 -> serializer_class와 같은 모양의 딕셔너리 목록
+
+    serializer_class: 출력 필드 순서와 형식을 가져올 기존 serializer
+    extra_columns: get_<이름>()에서 읽는 추가 values() 키
+    prefix: 다른 모델 행 안의 관련 객체를 직렬화할 때 키 앞부분 (예: 'actor__')
+    """
+    serializer_class = None
+    extra_columns = ()
+
+    def __init__(self, rows=(), prefix=''):
+        self.rows = list(rows)
+        self.prefix = prefix
+
+    @classmethod
+    def _fields(cls):
+        """(이름, values() 키 또는 None, 변환 함수 또는 DateTimeField) - 클래스마다 한 번 컴파일"""
+        compiled = cls.__dict__.get('_compiled')
+        if compiled is None:
+            compiled = []
+            for name, field in cls.serializer_class().fields.items():
+                if field.write_only:
+                    continue
+                if hasattr(cls, f'get_{name}'):
+                    compiled.append((name, None, None))
+                    continue
+                if isinstance(field, _NESTED) or field.source == '*':
+                    raise ImproperlyConfigured(f'{cls.__name__}.get_{name}() 이 필요합니다.')
+                source = field.source.replace('.', '__')
+                # DateTimeField는 요청 시점의 시간대에 따라 달라지므로 builder()에서 변환 함수를 만든다
+                if isinstance(field, drf_fields.DateTimeField):
+                    compiled.append((name, source, field))
+                else:
+                    compiled.append((name, source, _converter(field)))
+            cls._compiled = compiled
+        return compiled
+
+    @classmethod
+    def columns(cls, prefix=''):
+        keys = [source for _, source, _ in cls._fields() if source is not None]
+        return [f'{prefix}{key}' for key in dict.fromkeys([*keys, *cls.extra_columns])]
+
+    @classmethod
+    def values(cls, queryset, *extra):
+        """queryset을 이 serializer가 읽는 컬럼(+extra, 예: 키셋 정렬 필드)의 values()로"""
+        return queryset.prefetch_related(None).values(*dict.fromkeys([*cls.columns(), *extra]))
+
+    def prefetch(self):
+        """목록 전체의 관련 행을 한 번에 모으는 자리 (get_<이름>에서 사용)"""
+
+    def builder(self):
+        """행 -> 응답 딕셔너리 함수 (prefetch() 뒤에 만든다)"""
+        prefix = self.prefix
+        plan = []
+        for name, source, convert in self._fields():
+            if source is None:
+                plan.append((name, None, getattr(self, f'get_{name}')))
+            else:
+                if isinstance(convert, drf_fields.DateTimeField):
+                    convert = _datetime_converter(convert)
+                plan.append((name, prefix + source, convert))
+
+        def build(row):
+            item = {}
+            for name, key, convert in plan:
+                if key is None:
+                    item[name] = convert(row)
+                else:
+                    value = row[key]
+                    item[name] = None if value is None else convert(value)
+            return item
+        return build
+
+    @property
+    def data(self):
+        self.prefetch()
+        build = self.builder()
+        return [build(row) for row in self.rows]
+
+    @classmethod
+    def stream(cls, rows, chunk_size=STREAM_CHUNK_SIZE):
+        """rows 이터레이터를 chunk_size개씩 묶어 직렬화 (NDJSON 스트리밍용 - 관련 행도 묶음마다 한 번 조회)"""
+        rows = iter(rows)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                return
+            yield from cls(chunk).data
@@ -20,6 +20,7 @@ load_dotenv()
 BASE_DIR = Path(__file__).resolve().parent.parent
 
 OPENAI_API_KEY = os.environ.get('OPENAI_API_KEY')
+OPENAI_BASE_URL = os.environ.get('OPENAI_BASE_URL')  # 비우면 공식 API, 부하 테스트 시 스텁 서버 주소
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/4.2/howto/deployment/checklist/
@@ -39,6 +40,7 @@ INSTALLED_APPS = [
     'movies',
     'posts',
     'accounts',
+    'benchmarks',  # 벤치마크 데이터 생성/측정 명령
     'rest_framework',
     'rest_framework.authtoken',
     'dj_rest_auth',
@@ -60,6 +62,7 @@ INSTALLED_APPS = [
 SITE_ID = 1
 
 MIDDLEWARE = [
+    'cinemamemory.middleware.QueryBudgetMiddleware',  # 요청별 쿼리 수/SQL 시간 계측 (가장 바깥에서 측정)
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'allauth.account.middleware.AccountMiddleware',
@@ -67,6 +70,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'cinemamemory.db_router.ReplicaPinningMiddleware',  # 쓰기 요청 뒤 사용자를 default DB에 고정
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -115,6 +119,43 @@ DATABASES = {
     }
 }
 
+# 읽기 전용 복제본 - 쉼표로 구분한 SQLite 파일 경로마다 replica_N alias를 추가한다
+# (로컬에서는 sync_sqlite_replicas 명령으로 default를 복사해 복제를 흉내 냄)
+# 쓰기 뒤 고정 정보를 워커끼리 공유해야 하므로 아래 CACHES가 공유 백엔드일 때만 켤 수 있다
+DATABASE_REPLICAS = []
+for _index, _name in enumerate(filter(None, os.getenv('DATABASE_REPLICA_FILES', '').split(',')), 1):
+    DATABASES[f'replica_{_index}'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': _name.strip(),
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS.append(f'replica_{_index}')
+
+DATABASE_ROUTERS = ['cinemamemory.db_router.ReplicaRouter']
+
+# 복제 지연 허용치(초) - 쓰기 요청 뒤 이 시간 동안 같은 사용자의 읽기는 default로
+REPLICA_LAG_TOLERANCE = float(os.getenv('REPLICA_LAG_TOLERANCE', '5'))
+
+# 캐시 - 워커 프로세스가 여러 개면 공유 백엔드 사용
+# (예: CACHE_BACKEND=django.core.cache.backends.redis.RedisCache CACHE_LOCATION=redis://localhost:6379/1)
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.getenv('CACHE_LOCATION', 'cinememory'),
+    }
+}
+
+# 뷰 응답 캐시 (cinemamemory.cache) - 공유 캐시 alias, 기본 보관 시간(초), 프로세스 LRU 항목 수
+VIEW_CACHE_ALIAS = 'default'
+VIEW_CACHE_TIMEOUT = int(os.getenv('VIEW_CACHE_TIMEOUT', '300'))
+VIEW_CACHE_LOCAL_SIZE = int(os.getenv('VIEW_CACHE_LOCAL_SIZE', '512'))
+# 캐시 백엔드가 프로세스별(LocMem)이면 다른 워커의 무효화가 보이지 않으므로 이 시간(초)까지만 보관
+VIEW_CACHE_LOCAL_TIMEOUT = int(os.getenv('VIEW_CACHE_LOCAL_TIMEOUT', '10'))
+
+# 온보딩 풀 캐시 보관 시간(초) - 무효화는 같은 캐시를 보는 프로세스에만 전달되므로
+# 프로세스별 캐시(LocMem)에서도 이 시간이 지나면 모든 워커가 새 풀을 만든다
+ONBOARDING_CACHE_TIMEOUT = int(os.getenv('ONBOARDING_CACHE_TIMEOUT', '300'))
+
 
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
@@ -180,4 +221,24 @@ CORS_ALLOW_CREDENTIALS = True
 
 ALLOWED_HOSTS = ['localhost', '127.0.0.1', '0.0.0.0']
 
+# 탈퇴 계정 정리 - 한 트랜잭션에서 삭제할 최대 행 수, 청크 사이 대기 시간(초)
+ACCOUNT_PURGE_CHUNK_SIZE = int(os.getenv('ACCOUNT_PURGE_CHUNK_SIZE', '500'))
+ACCOUNT_PURGE_CHUNK_PAUSE = float(os.getenv('ACCOUNT_PURGE_CHUNK_PAUSE', '0.05'))
+
+# 커뮤니티 통계 스냅샷 - 이 시간(초)이 지나면 DB에서 다시 계산
+COMMUNITY_STATS_MAX_STALENESS = int(os.getenv('COMMUNITY_STATS_MAX_STALENESS', '300'))
+
+# 게시글 조회수 버퍼 - 반영 주기(초), 쌓인 조회 수 기준, 같은 사용자 중복 조회 무시 시간(초)
+POST_VIEW_FLUSH_INTERVAL = float(os.getenv('POST_VIEW_FLUSH_INTERVAL', '10'))
+POST_VIEW_FLUSH_THRESHOLD = int(os.getenv('POST_VIEW_FLUSH_THRESHOLD', '500'))
+POST_VIEW_DEDUPE_WINDOW = int(os.getenv('POST_VIEW_DEDUPE_WINDOW', '1800'))
+
+# 실시간 이벤트 버스 - 워커 프로세스가 여러 개면 cinemamemory.events.RedisBackend 사용
+EVENT_BUS_BACKEND = os.getenv('EVENT_BUS_BACKEND', 'cinemamemory.events.InProcessBackend')
+EVENT_BUS_REDIS_URL = os.getenv('EVENT_BUS_REDIS_URL', 'redis://localhost:6379/0')
 
+# 요청별 SQL 계측 - 요청당 쿼리 예산(초과 시 출력), URL 이름별 예외, N+1 의심 반복 횟수
+QUERY_BUDGET = int(os.getenv('QUERY_BUDGET', '30'))
+QUERY_BUDGET_OVERRIDES = {}
+REPEATED_QUERY_THRESHOLD = int(os.getenv('REPEATED_QUERY_THRESHOLD', '5'))
+SERVER_TIMING_ENABLED = os.getenv('SERVER_TIMING_ENABLED', 'True').lower() in ('true', '1', 't')
@@ -0,0 +1,28 @@
+import json
+
+from django.http import StreamingHttpResponse
+from rest_framework.utils.encoders import JSONEncoder
+
+# 스트리밍 응답 공용 도구
+# 행을 iterator(chunk_size=...)로 읽어 한 줄씩 내보내므로 결과 크기와 관계없이 메모리가 일정하다.
+# 시간/Decimal 표현은 DRF Response와 같은 JSONEncoder를 사용한다.
+STREAM_CHUNK_SIZE = 500
+
+
+def to_json_line(item):
+    return json.dumps(item, cls=JSONEncoder, ensure_ascii=False) + '\n'
+
+
+def ndjson_response(items, filename=None):
+    """items(딕셔너리 이터러블)를 NDJSON으로 흘려보내는 응답"""
+    response = StreamingHttpResponse(
+        (to_json_line(item) for item in items),
+        content_type='application/x-ndjson; charset=utf-8',
+    )
+    if filename:
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+def wants_stream(request):
+    return request.GET.get('stream') == 'ndjson'
@@ -0,0 +1,82 @@
+import os
+import tempfile
+from types import SimpleNamespace
+from unittest import mock
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import ImproperlyConfigured
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from movies.models import Movie
+from . import db_router
+
+SHARED_CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.path.join(tempfile.gettempdir(), 'cinememory-test-cache'),
+    }
+}
+
+
+def _read_alias(request):
+    return db_router.ReplicaRouter().db_for_read(Movie)
+
+
+@override_settings(CACHES=SHARED_CACHES)
+@mock.patch.object(db_router, 'REPLICAS', ['replica_1'])
+class ReplicaRoutingTests(SimpleTestCase):
+    """@read_replica 읽기는 복제본으로, 쓰기 요청을 마친 사용자는 잠시 default로"""
+
+    def setUp(self):
+        from django.core.cache import cache
+        cache.clear()
+        self.factory = RequestFactory()
+        self.user = SimpleNamespace(id=42, is_authenticated=True)
+        self.read = db_router.read_replica(_read_alias)
+
+    def request(self, method='get', user=None):
+        request = getattr(self.factory, method)('/')
+        request.user = user or self.user
+        return request
+
+    def middleware(self, get_response):
+        return db_router.ReplicaPinningMiddleware(get_response)
+
+    def test_reads_go_to_replica(self):
+        self.assertEqual(self.read(self.request()), 'replica_1')
+        self.assertEqual(self.read(self.request(user=AnonymousUser())), 'replica_1')
+
+    def test_reads_outside_read_replica_use_default(self):
+        self.assertIsNone(_read_alias(self.request()))
+
+    def test_write_request_pins_user(self):
+        self.middleware(lambda request: HttpResponse())(self.request('post'))
+        self.assertTrue(db_router.is_pinned(self.user.id))
+        self.assertIsNone(self.read(self.request()))
+        # 다른 사용자는 계속 복제본
+        other = SimpleNamespace(id=7, is_authenticated=True)
+        self.assertEqual(self.read(self.request(user=other)), 'replica_1')
+
+    def test_safe_request_that_writes_pins_user(self):
+        def view(request):
+            db_router.ReplicaRouter().db_for_write(Movie)
+            return HttpResponse()
+        self.middleware(view)(self.request())
+        self.assertTrue(db_router.is_pinned(self.user.id))
+
+    def test_failed_write_does_not_pin(self):
+        self.middleware(lambda request: HttpResponse(status=400))(self.request('post'))
+        self.assertFalse(db_router.is_pinned(self.user.id))
+
+    def test_reads_after_write_in_same_request_use_default(self):
+        def view(request):
+            db_router.ReplicaRouter().db_for_write(Movie)
+            return HttpResponse(self.read(request) or 'default')
+        response = self.middleware(view)(self.request())
+        self.assertEqual(response.content, b'default')
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+    def test_refuses_process_local_cache(self):
+        with self.assertRaises(ImproperlyConfigured):
+            self.middleware(lambda request: HttpResponse())
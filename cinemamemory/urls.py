@@ -19,6 +19,7 @@ from django.contrib import admin
 from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
+from . import views
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -32,6 +33,10 @@ urlpatterns = [
     # API 문서화
     path('api/v1/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/v1/redoc/', SpectacularRedocView.as_view(url_name='schema'), name='redoc'),
+    # 경로별 쿼리/응답 시간 집계 (관리자 전용)
+    path('api/v1/cinememory/admin/query-stats/', views.query_stats, name='query_stats'),
+    # 뷰 응답 캐시 적중률 (관리자 전용)
+    path('api/v1/cinememory/admin/cache-stats/', views.cache_stats, name='cache_stats'),
     path('api/v1/accounts/', include('accounts.urls')),
 ]
 
@@ -0,0 +1,41 @@
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from .cache import local_cache, metrics as cache_metrics
+from .middleware import QUERY_BUDGET, route_stats
+
+
+# 경로별 요청 시간/쿼리 수 백분위 (관리자 전용)
+@api_view(['GET', 'DELETE'])
+@permission_classes([IsAdminUser])
+def query_stats(request):
+    """
+    GET: 프로세스가 시작된 뒤 경로별 최근 요청의 p50/p90/p99 (느린 경로부터)
+    DELETE: 집계 초기화
+    """
+    if request.method == 'DELETE':
+        route_stats.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    return Response({
+        'query_budget': QUERY_BUDGET,
+        'routes': route_stats.summary(),
+    }, status=status.HTTP_200_OK)
+
+
+# 뷰 응답 캐시 적중률 (관리자 전용)
+@api_view(['GET', 'DELETE'])
+@permission_classes([IsAdminUser])
+def cache_stats(request):
+    """
+    GET: 프로세스 LRU/공유 캐시 적중, 미스, 무효화 횟수와 뷰별 적중률
+    DELETE: 집계 초기화 (프로세스 LRU도 비움)
+    """
+    if request.method == 'DELETE':
+        cache_metrics.reset()
+        local_cache.clear()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    return Response(cache_metrics.summary(), status=status.HTTP_200_OK)
@@ -96,6 +96,9 @@ class Movie(models.Model):
     onboarding_priority = models.IntegerField(default=0)
     onboarding_category = models.CharField(max_length=50, blank=True)
     
+    class Meta:
+        indexes = [models.Index(fields=['-popularity'])]  # 인기순 영화 조회
+
     def __str__(self):
         return self.title
     
@@ -163,6 +166,10 @@ class MovieActor(models.Model):
         # 다른 캐릭터라면 같은 배우가 여러 역할 가능 (1인 2역, 성우 등)
         unique_together = ['movie', 'actor', 'character_name']
         ordering = ['cast_order']                    # 출연 순서대로 정렬
+        indexes = [
+            models.Index(fields=['movie', 'cast_order']),  # 영화 상세 출연진
+            models.Index(fields=['actor', 'cast_order']),  # 배우 상세 출연작
+        ]
     
     def __str__(self):
         if self.character_name:
@@ -186,6 +193,7 @@ class MovieProvider(models.Model):
     class Meta:
         unique_together = ['movie', 'provider', 'provider_type']  # 같은 영화, 같은 서비스, 같은 유형은 중복 불가
         ordering = ['display_priority']              # 우선순위대로 정렬
+        indexes = [models.Index(fields=['movie', 'display_priority'])]  # 영화 상세 스트리밍 서비스
     
     def __str__(self):
         return f"{self.movie.title} - {self.provider.name} ({self.get_provider_type_display()})"
@@ -200,6 +208,31 @@ class MovieReview(models.Model):
 
     class Meta:
         unique_together = ['user', 'movie']         # 한 사용자는 한 영화에 대해 하나의 리뷰만 작성 가능
+        indexes = [
+            models.Index(fields=['user', 'created_at', 'id']),  # 팔로잉 피드 키셋 조회
+            models.Index(fields=['movie', 'created_at']),  # 영화 상세 최근 리뷰
+        ]
     
     def __str__(self):
-        return f"{self.user.username} - {self.movie.title} ({self.rating}⭐)"
\ No newline at end of file
+        return f"{self.user.username} - {self.movie.title} ({self.rating}⭐)"
+
+
+class LikeActivity(models.Model):  # 좋아요 기록 (피드 노출용 - 좋아요 M2M에는 시간 정보가 없음)
+    TARGET_TYPE_CHOICES = [
+        ('movie', '영화'),
+        ('actor', '배우'),
+        ('director', '감독'),
+    ]
+
+    user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name='like_activities')
+    target_type = models.CharField(max_length=10, choices=TARGET_TYPE_CHOICES)
+    target_id = models.IntegerField()                # 좋아요한 영화/배우/감독 id
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        unique_together = ['user', 'target_type', 'target_id']
+        indexes = [models.Index(fields=['user', 'created_at', 'id'])]  # 팔로잉 피드 키셋 조회
+
+    def __str__(self):
+        return f"{self.user.username} ♥ {self.get_target_type_display()} {self.target_id}"
+
@@ -1,5 +1,8 @@
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
 from rest_framework import serializers
 
+from cinemamemory.row_serializer import RowSerializer
 from .models import Movie, Actor, Director, MovieReview, Series, Genre, Provider, MovieProvider, MovieActor
 
 
@@ -119,6 +122,84 @@ class MovieListSerializer(serializers.ModelSerializer): # 영화 목록 페이
         return MovieActorSerializer(movie_actors, many=True).data
 
 
+# ---- values() 행 직렬화 (목록 API용, cinemamemory.row_serializer 참고) ----
+
+class ActorBasicRowSerializer(RowSerializer):
+    serializer_class = ActorBasicSerializer
+
+class DirectorBasicRowSerializer(RowSerializer):
+    serializer_class = DirectorBasicSerializer
+
+class GenreRowSerializer(RowSerializer):
+    serializer_class = GenreSerializer
+
+class SeriesRowSerializer(RowSerializer):
+    serializer_class = SeriesSerializer
+
+class MovieActorRowSerializer(RowSerializer):
+    serializer_class = MovieActorSerializer
+
+    @classmethod
+    def columns(cls, prefix=''):
+        return [*super().columns(prefix), *ActorBasicRowSerializer.columns(f'{prefix}actor__')]
+
+    def prefetch(self):
+        self.actor = ActorBasicRowSerializer(prefix=f'{self.prefix}actor__').builder()
+
+    def get_actor(self, row):
+        return self.actor(row)
+
+class MovieListRowSerializer(RowSerializer):
+    """MovieListSerializer와 같은 출력 - 출연진/감독/장르는 목록 전체에 대해 한 번씩 조회"""
+    serializer_class = MovieListSerializer
+
+    @classmethod
+    def columns(cls, prefix=''):
+        return [*super().columns(prefix), *SeriesRowSerializer.columns(f'{prefix}series__')]
+
+    def prefetch(self):
+        movie_ids = [row['id'] for row in self.rows]
+        self.series = SeriesRowSerializer(prefix='series__').builder()
+        self.actors, self.directors, self.genres = {}, {}, {}
+        if not movie_ids:
+            return
+
+        # 영화별 상위 5명 - MovieListSerializer.get_actors와 같은 순서 (cast_order, 같으면 저장 순서)
+        cast = MovieActor.objects.filter(movie_id__in=movie_ids).annotate(
+            position=Window(RowNumber(), partition_by=F('movie_id'), order_by=(F('cast_order').asc(), F('id').asc())),
+        ).filter(position__lte=5).order_by('movie_id', 'position')
+        cast = list(cast.values('movie_id', *MovieActorRowSerializer.columns()))
+        for row, item in zip(cast, MovieActorRowSerializer(cast).data):
+            self.actors.setdefault(row['movie_id'], []).append(item)
+
+        # 연결 테이블 순서 (movie.directors.all() / movie.genres.all()과 같은 순서)
+        for related, serializer_class, target in (
+            ('director', DirectorBasicRowSerializer, self.directors),
+            ('genre', GenreRowSerializer, self.genres),
+        ):
+            through = getattr(Movie, f'{related}s').through
+            rows = list(
+                through.objects.filter(movie_id__in=movie_ids).order_by('movie_id', f'{related}_id')
+                .values('movie_id', *serializer_class.columns(f'{related}__'))
+            )
+            for row, item in zip(rows, serializer_class(rows, prefix=f'{related}__').data):
+                target.setdefault(row['movie_id'], []).append(item)
+
+    def get_actors(self, row):
+        return self.actors.get(row['id'], [])
+
+    def get_directors(self, row):
+        return self.directors.get(row['id'], [])
+
+    def get_genres(self, row):
+        return self.genres.get(row['id'], [])
+
+    def get_series(self, row):
+        if row['series__id'] is None:
+            return None
+        return self.series(row)
+
+
 class MovieSerializer(serializers.ModelSerializer): # 영화 상세 페이지 들어갔을 때 정보
     movie_id = serializers.IntegerField(source='id', read_only=True)  # id를 movie_id로도 제공
     movieId = serializers.IntegerField(source='id', read_only=True)   # camelCase로도 제공
@@ -230,4 +311,24 @@ class MovieReviewSerializer(serializers.ModelSerializer):
             'title': obj.movie.title,
             'poster_path': obj.movie.poster_path
         }
-    
\ No newline at end of file
+
+class MovieReviewRowSerializer(RowSerializer):
+    """MovieReviewSerializer와 같은 출력을 values() 행에서"""
+    serializer_class = MovieReviewSerializer
+    extra_columns = ('user__id', 'user__username', 'movie__id', 'movie__title', 'movie__poster_path')
+
+    def get_user(self, row):  # StringRelatedField - str(user)는 username
+        return row['user__username']
+
+    def get_user_profile(self, row):
+        return {
+            'id': row['user__id'],
+            'username': row['user__username'],
+        }
+
+    def get_movie_info(self, row):
+        return {
+            'id': row['movie__id'],
+            'title': row['movie__title'],
+            'poster_path': row['movie__poster_path']
+        }
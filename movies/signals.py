@@ -0,0 +1,55 @@
+from django.db.models.signals import post_save, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from cinemamemory.cache import invalidate
+from .models import Movie, Actor, Director, MovieActor
+
+# 뷰 캐시 무효화 (cinemamemory.cache)
+# 배우/감독 상세는 'person:{id}'와 출연작 정보 때문에 'movie:*'에 의존한다.
+# (좋아요 여부가 포함되므로 사용자별로 저장 - movies.views.person_detail)
+
+
+@receiver(post_save, sender=Movie)
+@receiver(post_delete, sender=Movie)
+def invalidate_movie_cache(sender, instance, **kwargs):
+    invalidate(f'movie:{instance.pk}')
+
+
+@receiver(post_save, sender=Actor)
+@receiver(post_delete, sender=Actor)
+@receiver(post_save, sender=Director)
+@receiver(post_delete, sender=Director)
+def invalidate_person_cache(sender, instance, **kwargs):
+    invalidate(f'person:{instance.pk}')
+
+
+@receiver(post_save, sender=MovieActor)
+@receiver(post_delete, sender=MovieActor)
+def invalidate_cast_cache(sender, instance, **kwargs):
+    invalidate(f'person:{instance.actor_id}', f'movie:{instance.movie_id}')
+
+
+@receiver(m2m_changed, sender=Movie.directors.through)
+def invalidate_director_cache(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if reverse:
+        # director.movies 쪽에서 바뀐 것
+        invalidate(f'person:{instance.pk}', 'movie:*')
+    else:
+        invalidate(f'movie:{instance.pk}', *[f'person:{pk}' for pk in pk_set or ()])
+
+
+@receiver(m2m_changed, sender=Actor.liked_by.through)
+@receiver(m2m_changed, sender=Director.liked_by.through)
+def invalidate_person_like_cache(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if reverse:
+        # user.liked_actors / user.liked_directors 쪽에서 바뀐 것 - pk_set이 배우/감독 id
+        if pk_set is None:
+            invalidate('person:*')
+        else:
+            invalidate(*[f'person:{pk}' for pk in pk_set])
+    else:
+        invalidate(f'person:{instance.pk}')
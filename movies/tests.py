@@ -1,3 +1,61 @@
+import datetime
+
+from django.core.cache import cache
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from .models import Movie, Genre, Director, Actor, MovieActor
+
+BASE = '/api/v1/cinememory/movies/'
+
+
+class ConditionalGetTests(TestCase):
+    """movie_detail / person_detail ETag - 그대로면 304, 응답에 들어가는 관련 행이 바뀌면 200"""
+
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create_user(username='viewer', password='pw', birth=datetime.date(1995, 1, 1))
+        self.client = APIClient()
+        self.client.force_authenticate(user)
+        self.movie = Movie.objects.create(
+            id=1, title='movie', release_date=datetime.date(2000, 1, 1), poster_path='http://p', status='Released',
+        )
+        self.genre = Genre.objects.create(id=1, name='genre')
+        self.director = Director.objects.create(id=1, name='director', role='d', profile_path='http://x')
+        self.actor = Actor.objects.create(id=2, name='actor', role='a', profile_path='http://x')
+        MovieActor.objects.create(movie=self.movie, actor=self.actor, character_name='role')
+
+    def revalidate(self, url):
+        etag = self.client.get(url)['ETag']
+        return lambda: self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_unchanged_movie_returns_304(self):
+        self.assertEqual(self.revalidate(f'{BASE}1/')().status_code, 304)
+
+    def test_movie_links_change_etag(self):
+        for link in (lambda: self.movie.genres.add(self.genre), lambda: self.movie.directors.add(self.director)):
+            again = self.revalidate(f'{BASE}1/')
+            link()
+            self.assertEqual(again().status_code, 200)
+
+    def test_embedded_row_edit_changes_movie_etag(self):
+        again = self.revalidate(f'{BASE}1/')
+        self.actor.name = 'renamed'
+        self.actor.save()
+        response = again()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['actors'][0]['actor']['name'], 'renamed')
+
+    def test_unchanged_person_returns_304(self):
+        self.assertEqual(self.revalidate(f'{BASE}person/{self.actor.id}/')().status_code, 304)
 
-# Create your tests here.
+    def test_filmography_edit_changes_person_etag(self):
+        url = f'{BASE}person/{self.actor.id}/'
+        again = self.revalidate(url)
+        self.movie.title = 'renamed'
+        self.movie.save()
+        response = again()
+        self.assertEqual(response.status_code, 200)
+        # 응답 캐시에서 옛 본문을 꺼내지 않아야 한다
+        self.assertEqual(response.data['movies'][0]['movie']['title'], 'renamed')
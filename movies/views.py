@@ -2,16 +2,92 @@ from django.conf import settings
 from django.shortcuts import render
 from rest_framework.response import Response
 from rest_framework.decorators import api_view
-from .models import Movie, Actor, Director, MovieReview, MovieProvider, Provider
-from .serializer import DirectorBasicSerializer, MovieReviewSerializer, MovieSerializer, ActorSerializer, DirectorSerializer, MovieListSerializer, ActorBasicSerializer, MovieProviderSerializer
+from .models import Movie, Actor, Director, Series, MovieReview, MovieProvider, Provider, LikeActivity, MovieActor
+from .serializer import DirectorBasicSerializer, MovieBasicSerializer, MovieReviewSerializer, MovieSerializer, ActorSerializer, DirectorSerializer, MovieListRowSerializer, MovieReviewRowSerializer, ActorBasicSerializer, MovieProviderSerializer
 
 from rest_framework.decorators import permission_classes
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
+from django.db.models import Exists, OuterRef
+from cinemamemory.cache import cached_view
+from cinemamemory.conditional import conditional_view, related_count, related_max, viewer_id
+from cinemamemory.db_router import read_replica
+
+
+def _columns(model):
+    return [field.attname for field in model._meta.concrete_fields]
+
+
+def _liked(through, field, viewer):
+    return Exists(through.objects.filter(**{field: OuterRef('pk')}, user_id=viewer))
+
+
+def _related(prefix, serializer):
+    return [f'{prefix}__{field}' for field in serializer.Meta.fields]
+
+
+def _embedded(queryset, *fields):
+    """응답에 함께 들어가는 관련 행의 표시 값 (버전용 - 모델 인스턴스 없이 values_list 한 번)"""
+    return tuple(queryset.order_by('pk').values_list('pk', *fields))
+
+
+def _movie_version(request, id):
+    """
+    movie_detail 응답을 결정하는 값 - 영화/시리즈 행, 좋아요/리뷰 카운터, 요청 사용자의 좋아요,
+    출연진/감독/장르/서비스 연결과 그 행의 표시 값 (모두 DB에서 읽으므로 워커마다 같다)
+    """
+    viewer = viewer_id(request)
+    reviews = MovieReview.objects.all()
+    row = Movie.objects.filter(pk=id).annotate(
+        like_total=related_count(Movie.liked_by.through.objects.all(), 'movie_id'),
+        reviewer_total=related_count(Movie.reviewed_by.through.objects.all(), 'movie_id'),
+        review_total=related_count(reviews, 'movie_id'),
+        reviews_updated=related_max(reviews, 'movie_id', 'updated_at'),
+        viewer_liked=_liked(Movie.liked_by.through, 'movie_id', viewer),
+    ).values_list(
+        *_columns(Movie), *[f'series__{column}' for column in _columns(Series)],
+        'like_total', 'reviewer_total', 'review_total', 'reviews_updated', 'viewer_liked',
+    ).first()
+    if row is None:
+        return None
+    embedded = (
+        _embedded(MovieActor.objects.filter(movie_id=id), 'character_name', 'cast_order',
+                  *_related('actor', ActorBasicSerializer)),
+        _embedded(Movie.directors.through.objects.filter(movie_id=id), *_related('director', DirectorBasicSerializer)),
+        _embedded(Movie.genres.through.objects.filter(movie_id=id), 'genre_id', 'genre__name'),
+        _embedded(MovieProvider.objects.filter(movie_id=id), *_columns(MovieProvider),
+                  *[f'provider__{column}' for column in _columns(Provider)]),
+    )
+    return (viewer, *row, *embedded)
+
+
+def _person_version(request, person_id):
+    """
+    person_detail 응답을 결정하는 값 - 배우(없으면 감독) 행, 좋아요 카운터, 요청 사용자의 좋아요,
+    출연작 연결과 출연작 영화의 표시 값
+    """
+    viewer = viewer_id(request)
+    for model, works, extra in (
+        (Actor, MovieActor, ('character_name', 'cast_order')),
+        (Director, Movie.directors.through, ()),
+    ):
+        field = f'{model._meta.model_name}_id'
+        row = model.objects.filter(pk=person_id).annotate(
+            like_total=related_count(model.liked_by.through.objects.all(), field),
+            last_like=related_max(model.liked_by.through.objects.all(), field, 'id'),
+            viewer_liked=_liked(model.liked_by.through, field, viewer),
+        ).values_list(*_columns(model), 'like_total', 'last_like', 'viewer_liked').first()
+        if row is not None:
+            filmography = _embedded(
+                works.objects.filter(**{field: person_id}), *extra, *_related('movie', MovieBasicSerializer),
+            )
+            return (model._meta.model_name, viewer, *row, filmography)
+    return None
 
 
 # Create your views here.
 @api_view(['GET'])
+@conditional_view(_movie_version)
 def movie_detail(request, id):
     print(f'요청된 movie_id: {id}')
     try:
@@ -31,6 +107,9 @@ def movie_detail(request, id):
     
         
 @api_view(['GET'])
+@read_replica
+@conditional_view(_person_version)
+@cached_view('person:{person_id}', 'movie:*', per_user=True)
 def person_detail(request, person_id):
     try:
         # 배우인지 확인
@@ -50,6 +129,7 @@ def person_detail(request, person_id):
         )
 
 @api_view(['GET'])
+@read_replica
 def search_some(request):
     search_query = request.GET.get('search', '')
     
@@ -64,12 +144,12 @@ def search_some(request):
         }
         
         # 모든 카테고리에서 검색
-        movies = Movie.objects.filter(title__icontains=search_query)[:10]
+        movies = MovieListRowSerializer.values(Movie.objects.filter(title__icontains=search_query))[:10]
         actors = Actor.objects.filter(name__icontains=search_query)[:10]
         directors = Director.objects.filter(name__icontains=search_query)[:10]
         
         if movies:
-            results['movies'] = MovieListSerializer(movies, many=True).data
+            results['movies'] = MovieListRowSerializer(movies).data
         if actors:
             results['actors'] = ActorBasicSerializer(actors, many=True).data
         if directors:
@@ -127,10 +207,12 @@ def like_movie(request, movie_id):
         
         if is_liked_before:
             movie.liked_by.remove(request.user)
+            LikeActivity.objects.filter(user=request.user, target_type='movie', target_id=movie.id).delete()
             is_liked_after = False
             message = '좋아요가 취소되었습니다.'
         else:
             movie.liked_by.add(request.user)
+            LikeActivity.objects.get_or_create(user=request.user, target_type='movie', target_id=movie.id)
             is_liked_after = True
             message = '좋아요가 추가되었습니다.'
             
@@ -156,9 +238,11 @@ def like_person(request, person_id):
     try:
         if Actor.objects.filter(id=person_id).exists():
             person = Actor.objects.get(id=person_id)
+            target_type = 'actor'
             is_liked_before = person.liked_by.filter(id=request.user.id).exists()
         elif Director.objects.filter(id=person_id).exists():
             person = Director.objects.get(id=person_id)
+            target_type = 'director'
             is_liked_before = person.liked_by.filter(id=request.user.id).exists()
         else:
             return Response(
@@ -167,10 +251,12 @@ def like_person(request, person_id):
             )
         if is_liked_before:
             person.liked_by.remove(request.user)
+            LikeActivity.objects.filter(user=request.user, target_type=target_type, target_id=person.id).delete()
             is_liked_after = False
             message = '좋아요가 취소되었습니다.'
         else:
             person.liked_by.add(request.user)
+            LikeActivity.objects.get_or_create(user=request.user, target_type=target_type, target_id=person.id)
             is_liked_after = True
             message = '좋아요가 추가되었습니다.'
             
@@ -218,8 +304,8 @@ def review_movie_detail(request, movie_id, review_id):
 def user_liked_movies(request):
     """사용자가 좋아요한 영화 목록"""
     try:
-        liked_movies = request.user.liked_movies.all()
-        serializer = MovieListSerializer(liked_movies, many=True)
+        liked_movies = MovieListRowSerializer.values(request.user.liked_movies.all())
+        serializer = MovieListRowSerializer(liked_movies)
         return Response({
             'liked_movies': serializer.data,
             'count': liked_movies.count()
@@ -232,8 +318,10 @@ def user_liked_movies(request):
 def user_reviews(request):
     """사용자가 작성한 리뷰 목록"""
     try:
-        movie_reviews = MovieReview.objects.filter(user=request.user).select_related('movie').order_by('-created_at')
-        serializer = MovieReviewSerializer(movie_reviews, many=True)
+        movie_reviews = MovieReviewRowSerializer.values(
+            MovieReview.objects.filter(user=request.user).order_by('-created_at')
+        )
+        serializer = MovieReviewRowSerializer(movie_reviews)
         return Response({
             'reviews': serializer.data,
             'count': movie_reviews.count()
@@ -0,0 +1,99 @@
+from rest_framework import serializers
+
+from cinemamemory.pagination import paginate_keyset
+from .models import Comment
+
+# 게시글 댓글 트리 생성
+# 댓글마다 like_users.count()/exists()를 실행하던 CommentSerializer 재귀 대신
+# 댓글을 한 번에 읽고 (좋아요 수는 like_count 컬럼) 부모/자식 구조는 메모리에서 조립한다.
+# 응답 형태는 CommentSerializer와 동일하다.
+COMMENT_ORDERING = ('created_at', 'id')
+
+# CommentSerializer와 같은 시간 표현(타임존/형식)을 쓰기 위한 필드
+_datetime_field = serializers.DateTimeField()
+
+
+def _comment_queryset(post_id):
+    return Comment.objects.filter(post_id=post_id).select_related('user')
+
+
+def _liked_ids(post_id, viewer):
+    """viewer가 이 게시글에서 좋아요한 댓글 id 집합 - 한 번의 쿼리"""
+    if viewer is None or not viewer.is_authenticated:
+        return set()
+    return set(
+        Comment.like_users.through.objects.filter(
+            user_id=viewer.id, comment__post_id=post_id
+        ).values_list('comment_id', flat=True)
+    )
+
+
+def _node(comment, liked_ids):
+    return {
+        'id': comment.id,
+        'author': {
+            'id': comment.user.id,
+            'username': comment.user.username,
+        },
+        'content': comment.content,
+        'replies': [],
+        'like_count': comment.like_count,
+        'is_liked': comment.id in liked_ids,
+        'created_at': _datetime_field.to_representation(comment.created_at),
+        'updated_at': _datetime_field.to_representation(comment.updated_at),
+    }
+
+
+def _assemble(roots, descendants, liked_ids):
+    """roots 순서를 유지하며 descendants를 부모 아래에 붙임 (descendants는 작성순)"""
+    nodes = {}
+    tree = []
+    for comment in roots:
+        nodes[comment.id] = _node(comment, liked_ids)
+        tree.append(nodes[comment.id])
+    for comment in descendants:
+        nodes[comment.id] = _node(comment, liked_ids)
+    for comment in descendants:
+        parent = nodes.get(comment.parent_id)
+        if parent is not None:
+            parent['replies'].append(nodes[comment.id])
+    return tree
+
+
+def build_comment_tree(post_id, viewer=None):
+    """
+    게시글의 전체 댓글 트리
+
+    댓글 1회 + viewer 좋아요 1회 쿼리로 깊이와 관계없이 고정
+    """
+    comments = list(_comment_queryset(post_id).order_by(*COMMENT_ORDERING))
+    liked_ids = _liked_ids(post_id, viewer)
+    roots = [comment for comment in comments if comment.parent_id is None]
+    descendants = [comment for comment in comments if comment.parent_id is not None]
+    return _assemble(roots, descendants, liked_ids)
+
+
+def build_comment_page(post_id, viewer=None, cursor=None, limit=20):
+    """
+    최상위 댓글을 작성순 키셋으로 나눈 한 페이지와 그 아래 대댓글
+
+    반환: (트리, 다음 커서 또는 None) - 잘못된 커서는 InvalidCursor
+    """
+    queryset = _comment_queryset(post_id)
+    roots, next_cursor = paginate_keyset(
+        queryset.filter(parent__isnull=True), COMMENT_ORDERING, cursor, limit,
+        descending=False,
+    )
+
+    # 대댓글은 단계별로 한 번씩 조회 (현재 답글은 한 단계만 허용하므로 보통 1회)
+    descendants = []
+    frontier = [comment.id for comment in roots]
+    while frontier:
+        children = list(
+            queryset.filter(parent_id__in=frontier).order_by(*COMMENT_ORDERING)
+        )
+        descendants.extend(children)
+        frontier = [comment.id for comment in children]
+
+    liked_ids = _liked_ids(post_id, viewer)
+    return _assemble(roots, descendants, liked_ids), next_cursor
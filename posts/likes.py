@@ -0,0 +1,94 @@
+from django.db import connection, transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from .models import Post, Comment
+from .ranking import schedule_refresh
+from .stats import community_snapshot
+from .live import publish_post_event
+from accounts.notifications import notify
+from cinemamemory.cache import invalidate
+
+# 게시글/댓글 좋아요 토글
+# exists() -> add()/remove() -> count() 대신 연결 테이블에 INSERT ... ON CONFLICT DO NOTHING을
+# 실행하고, 들어가지 않았으면(이미 좋아요) DELETE 한다. 영향받은 행 수로 방향을 판단하고
+# 같은 트랜잭션에서 like_count를 증감한 뒤 RETURNING으로 새 값(과 알림을 받을 작성자 id)을 돌려받는다.
+# 좋아요는 2개, 취소는 3개 문장이며, 동시 요청이 와도 IntegrityError 없이 정확히 한 번씩 반영된다.
+# (ORM의 add()/remove() 경로는 posts.signals에서 recount_likes로 맞춘다)
+
+
+def _toggle(model, object_id, user_id, **filters):
+    through = model.like_users.through
+    owner_column = through._meta.get_field(model._meta.model_name).column
+    user_column = through._meta.get_field('user').column
+    qn = connection.ops.quote_name
+    link_table, table = qn(through._meta.db_table), qn(model._meta.db_table)
+
+    conditions = ' AND '.join(
+        [f'{qn("id")} = %s'] + [f'{qn(model._meta.get_field(name).column)} = %s' for name in filters]
+    )
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f'INSERT INTO {link_table} ({qn(owner_column)}, {qn(user_column)}) VALUES (%s, %s) '
+            f'ON CONFLICT ({qn(owner_column)}, {qn(user_column)}) DO NOTHING',
+            [object_id, user_id],
+        )
+        if cursor.rowcount:
+            delta = 1
+        else:
+            cursor.execute(
+                f'DELETE FROM {link_table} WHERE {qn(owner_column)} = %s AND {qn(user_column)} = %s',
+                [object_id, user_id],
+            )
+            delta = -cursor.rowcount
+        cursor.execute(
+            f'UPDATE {table} SET like_count = CASE WHEN like_count + %s < 0 THEN 0 '
+            f'ELSE like_count + %s END WHERE {conditions} RETURNING like_count, {qn("user_id")}',
+            [delta, delta, object_id, *filters.values()],
+        )
+        row = cursor.fetchone()
+        if row is None:
+            # 대상이 없으면 트랜잭션을 되돌려 연결 행도 남기지 않음
+            raise model.DoesNotExist
+    return delta > 0, row[0], row[1]
+
+
+def toggle_post_like(post_id, user_id):
+    """반환: (토글 후 좋아요 여부, 새 좋아요 수) - 게시글이 없으면 Post.DoesNotExist"""
+    is_liked, like_count, author_id = _toggle(Post, post_id, user_id)
+    if is_liked:
+        notify(author_id, 'post_like', user_id, target_id=post_id, post_id=post_id)
+    community_snapshot.likes_changed(post_id, 1 if is_liked else -1)
+    invalidate(f'post:{post_id}')
+    schedule_refresh(post_id)
+    publish_post_event(post_id, 'post_like', {
+        'post_id': post_id, 'like_count': like_count, 'delta': 1 if is_liked else -1,
+    })
+    return is_liked, like_count
+
+
+def toggle_comment_like(comment_id, user_id, post_id):
+    """반환: (토글 후 좋아요 여부, 새 좋아요 수) - 해당 게시글의 댓글이 없으면 Comment.DoesNotExist"""
+    is_liked, like_count, author_id = _toggle(Comment, comment_id, user_id, post=post_id)
+    if is_liked:
+        notify(author_id, 'comment_like', user_id, target_id=comment_id, post_id=post_id)
+    publish_post_event(post_id, 'comment_like', {
+        'comment_id': comment_id, 'like_count': like_count, 'delta': 1 if is_liked else -1,
+    })
+    return is_liked, like_count
+
+
+def recount_likes(model, object_ids=None):
+    """like_count를 연결 테이블 기준으로 다시 계산 (object_ids가 없으면 전체)"""
+    through = model.like_users.through
+    owner = model._meta.model_name
+    counts = through.objects.filter(
+        **{f'{owner}_id': OuterRef('pk')}
+    ).order_by().values(f'{owner}_id').annotate(count=Count('*')).values('count')
+    objects = model.objects.all() if object_ids is None else model.objects.filter(pk__in=object_ids)
+    updated = objects.update(like_count=Coalesce(Subquery(counts), 0))
+    if object_ids is None:
+        invalidate(f'{owner}:*')
+    else:
+        invalidate(*[f'{owner}:{pk}' for pk in object_ids])
+    return updated
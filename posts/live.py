@@ -0,0 +1,74 @@
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.http import HttpResponseNotAllowed, JsonResponse, StreamingHttpResponse
+from rest_framework import serializers
+
+from cinemamemory.events import dumps_event, get_event_bus, publish
+from .models import Post
+
+# 게시글 실시간 업데이트 (Server-Sent Events)
+# 댓글/대댓글 작성, 좋아요 수 변경을 게시글 채널로 발행하고, 클라이언트는
+# post/<id>/events/ 를 EventSource로 구독해 post_detail 폴링 없이 반영한다.
+# 비동기 스트리밍 응답이므로 ASGI 서버(cinemamemory.asgi)로 실행해야 한다.
+HEARTBEAT_SECONDS = getattr(settings, 'POST_EVENTS_HEARTBEAT', 15)
+# 연결 하나의 최대 유지 시간 - 끊긴 연결이 남지 않도록 주기적으로 닫고 클라이언트가 재연결(retry)
+MAX_STREAM_SECONDS = getattr(settings, 'POST_EVENTS_MAX_SECONDS', 300)
+RETRY_MILLISECONDS = 3000
+
+# CommentSerializer와 같은 시간 표현
+_datetime_field = serializers.DateTimeField()
+
+
+def post_channel(post_id):
+    return f'post:{post_id}'
+
+
+def publish_post_event(post_id, event_type, data):
+    """현재 트랜잭션이 커밋된 뒤 게시글 채널로 이벤트 발행"""
+    event = {'type': event_type, 'data': data}
+    transaction.on_commit(lambda: publish(post_channel(post_id), event))
+
+
+def comment_event_data(comment, author):
+    return {
+        'id': comment.id,
+        'parent_id': comment.parent_id,
+        'author': {'id': author.id, 'username': author.username},
+        'content': comment.content,
+        'created_at': _datetime_field.to_representation(comment.created_at),
+    }
+
+
+def _format(event):
+    return f"event: {event['type']}\ndata: {dumps_event(event['data'])}\n\n"
+
+
+async def post_events(request, post_id):
+    """게시글 실시간 이벤트 스트림 (comment_created / reply_created / post_like / comment_like)"""
+    # Django 4.2의 require_GET은 async 뷰를 감싸지 못하므로 직접 확인
+    if request.method != 'GET':
+        return HttpResponseNotAllowed(['GET'])
+    if not await Post.objects.filter(id=post_id).aexists():
+        return JsonResponse({'error': '포스트를 찾을 수 없습니다.'}, status=404)
+
+    subscription = await get_event_bus().subscribe(post_channel(post_id))
+
+    async def stream():
+        deadline = time.monotonic() + MAX_STREAM_SECONDS
+        try:
+            yield f'retry: {RETRY_MILLISECONDS}\n\n'
+            while time.monotonic() < deadline:
+                event = await subscription.get(HEARTBEAT_SECONDS)
+                if event is None:
+                    yield ': heartbeat\n\n'
+                else:
+                    yield _format(event)
+        finally:
+            await subscription.close()
+
+    response = StreamingHttpResponse(stream(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # 프록시 버퍼링 방지
+    return response
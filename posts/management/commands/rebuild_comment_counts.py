@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from posts.querysets import recount_comments
+
+
+class Command(BaseCommand):
+    help = '게시글 comment_count를 댓글 테이블 기준으로 다시 계산합니다.'
+
+    def handle(self, *args, **options):
+        posts = recount_comments()
+        self.stdout.write(self.style.SUCCESS(f'게시글 {posts}개의 댓글 수를 갱신했습니다.'))
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from posts.likes import recount_likes
+from posts.models import Post, Comment
+
+
+class Command(BaseCommand):
+    help = '게시글/댓글 like_count를 좋아요 연결 기준으로 다시 계산합니다.'
+
+    def handle(self, *args, **options):
+        posts = recount_likes(Post)
+        comments = recount_likes(Comment)
+        self.stdout.write(self.style.SUCCESS(f'게시글 {posts}개, 댓글 {comments}개의 좋아요 수를 갱신했습니다.'))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from posts.search import is_supported, rebuild_index
+
+
+class Command(BaseCommand):
+    help = '커뮤니티 검색 색인(FTS5)을 게시글/댓글 전체로 다시 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=500)
+
+    def handle(self, *args, **options):
+        if not is_supported():
+            raise CommandError('전문 검색 색인은 SQLite에서만 사용합니다.')
+        count = rebuild_index(chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f'{count}건을 색인했습니다.'))
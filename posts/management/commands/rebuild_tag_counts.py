@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from posts.tags import normalize_existing_tags, recount_tags
+
+
+class Command(BaseCommand):
+    help = '태그별 post_count를 게시글-태그 연결 기준으로 다시 계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--normalize', action='store_true',
+                            help='먼저 기존 태그 이름을 정규화하고 대소문자/# 중복 태그를 합침')
+
+    def handle(self, *args, **options):
+        if options['normalize']:
+            renamed, merged, removed = normalize_existing_tags()
+            self.stdout.write(
+                f'이름 정규화 {renamed}개, 중복 태그 합침 {merged}개, 빈 이름 태그 삭제 {removed}개'
+            )
+        updated = recount_tags()
+        self.stdout.write(self.style.SUCCESS(f'태그 {updated}개의 게시글 수를 갱신했습니다.'))
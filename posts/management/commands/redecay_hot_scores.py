@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from posts.ranking import redecay_hot_scores, REDECAY_CHUNK_SIZE
+
+
+class Command(BaseCommand):
+    help = '게시글 hot 점수를 현재 시각 기준으로 다시 계산합니다. (cron 등으로 주기 실행)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--chunk-size', type=int, default=REDECAY_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        updated = redecay_hot_scores(chunk_size=options['chunk_size'])
+        self.stdout.write(self.style.SUCCESS(f'hot 점수 {updated}건을 갱신했습니다.'))
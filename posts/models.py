@@ -2,7 +2,13 @@ from django.db import models
 from django.conf import settings
 
 class Tag(models.Model):
-    name = models.CharField(max_length=255)
+    name = models.CharField(max_length=255, unique=True)  # posts.tags.normalize_tag_name 으로 정규화된 이름
+    post_count = models.PositiveIntegerField(default=0)  # 이 태그가 달린 게시글 수 (신호로 동기화)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['-post_count', 'name']),  # 태그 목록/인기 태그 조회
+        ]
 
     def __str__(self):
         return self.name
@@ -16,9 +22,22 @@ class Post(models.Model):
     title = models.CharField(max_length=255)
     content = models.TextField()
     tags = models.ManyToManyField(Tag, blank=True)
+    like_count = models.PositiveIntegerField(default=0)  # 좋아요 수 (posts.likes 참고)
+    view_count = models.PositiveIntegerField(default=0)  # 조회수 (posts.view_counter 가 모아서 반영)
+    comment_count = models.PositiveIntegerField(default=0)  # 댓글 수 (posts.signals 에서 증감, rebuild_comment_counts 로 재계산)
+    hot_score = models.FloatField(default=0)  # 시간 감쇠 인기 점수 (posts.ranking 참고)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['created_at', 'id']),  # 게시글 목록 키셋 조회
+            models.Index(fields=['-hot_score', '-id']),  # hot 정렬 키셋 조회
+            models.Index(fields=['-like_count', '-created_at', '-id']),  # popular 정렬 키셋 조회
+            models.Index(fields=['-comment_count', '-created_at', '-id']),  # comments 정렬 키셋 조회
+            models.Index(fields=['user', 'created_at', 'id']),  # 팔로잉 피드 키셋 조회
+        ]
+
     def __str__(self):
         return self.title
 
@@ -33,6 +52,7 @@ class Comment(models.Model):
       related_name='liked_comments',
       blank=True
     )
+    like_count = models.PositiveIntegerField(default=0)  # 좋아요 수 (posts.likes 참고)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -40,4 +60,8 @@ class Comment(models.Model):
         return self.content
 
     class Meta:
-        ordering = ['created_at']
\ No newline at end of file
+        ordering = ['created_at']
+        indexes = [
+            models.Index(fields=['post', 'parent', 'created_at', 'id']),  # 댓글 트리/최상위 댓글 키셋 조회
+            models.Index(fields=['user', 'created_at', 'id']),  # 내 댓글 키셋 조회
+        ]
\ No newline at end of file
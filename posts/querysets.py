@@ -0,0 +1,32 @@
+from django.db.models import Count, F, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from cinemamemory.cache import invalidate
+from .models import Post, Comment
+
+
+def with_counts(posts):
+    """목록/통계에서 쓰는 댓글 수를 num_comments로 (comment_count 컬럼, 좋아요 수는 like_count 컬럼)"""
+    return posts.annotate(num_comments=F('comment_count'))
+
+
+def adjust_comment_count(post_id, delta):
+    """댓글 작성/삭제 시 comment_count 증감 (0 미만으로 내려가지 않음)"""
+    if delta < 0:
+        Post.objects.filter(pk=post_id, comment_count__gte=-delta).update(comment_count=F('comment_count') + delta)
+    else:
+        Post.objects.filter(pk=post_id).update(comment_count=F('comment_count') + delta)
+
+
+def recount_comments(post_ids=None):
+    """comment_count를 댓글 테이블 기준으로 다시 계산 (post_ids가 없으면 전체)"""
+    counts = Comment.objects.filter(
+        post_id=OuterRef('pk')
+    ).order_by().values('post_id').annotate(count=Count('*')).values('count')
+    posts = Post.objects.all() if post_ids is None else Post.objects.filter(pk__in=post_ids)
+    updated = posts.update(comment_count=Coalesce(Subquery(counts), 0))
+    if post_ids is None:
+        invalidate('post:*')
+    else:
+        invalidate(*[f'post:{pk}' for pk in post_ids])
+    return updated
@@ -0,0 +1,79 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Post
+from .querysets import with_counts
+
+# 게시글 hot 점수
+# (좋아요 + 댓글 * COMMENT_WEIGHT) / (경과 시간 + 2) ^ GRAVITY
+# 좋아요/댓글이 바뀔 때 해당 게시글만 다시 계산하고, 시간이 흐르며 떨어지는 점수는
+# redecay_hot_scores 명령(주기 실행)이 HOT_WINDOW_DAYS 이내 게시글을 일괄 재계산한다.
+# 기간이 지난 게시글은 0으로 내려 hot 목록에서 빠지게 한다.
+HOT_GRAVITY = getattr(settings, 'POST_HOT_GRAVITY', 1.5)
+COMMENT_WEIGHT = getattr(settings, 'POST_HOT_COMMENT_WEIGHT', 2)
+HOT_WINDOW_DAYS = getattr(settings, 'POST_HOT_WINDOW_DAYS', 7)
+REDECAY_CHUNK_SIZE = 500
+
+
+def hot_score(likes, comments, created_at, now=None):
+    now = now or timezone.now()
+    age_hours = max((now - created_at).total_seconds() / 3600, 0)
+    if age_hours > HOT_WINDOW_DAYS * 24:
+        return 0.0
+    return (likes + comments * COMMENT_WEIGHT) / (age_hours + 2) ** HOT_GRAVITY
+
+
+def refresh_hot_score(post_id):
+    """게시글 하나의 점수를 현재 좋아요/댓글 수로 다시 계산 (조회 1회 + 갱신 1회)"""
+    row = with_counts(Post.objects.filter(pk=post_id)).values(
+        'created_at', 'like_count', 'num_comments'
+    ).first()
+    if row is None:
+        return
+    Post.objects.filter(pk=post_id).update(
+        hot_score=hot_score(row['like_count'], row['num_comments'], row['created_at'])
+    )
+
+
+def schedule_refresh(post_id):
+    """커밋 후 같은 요청에서 점수 갱신 - 좋아요 트랜잭션과 쓰기 잠금이 겹치지 않도록 커밋 뒤에 실행"""
+    def run():
+        try:
+            refresh_hot_score(post_id)
+        except Exception as e:
+            print(f"❌ hot 점수 갱신 오류 (post_id={post_id}): {str(e)}")
+
+    transaction.on_commit(run)
+
+
+def redecay_hot_scores(chunk_size=REDECAY_CHUNK_SIZE):
+    """
+    기간 내 게시글 점수 일괄 재계산 - 갱신한 게시글 수 반환
+
+    연쇄 삭제처럼 신호로 반영되지 않은 변경도 여기서 보정된다.
+    """
+    now = timezone.now()
+    cutoff = now - timedelta(days=HOT_WINDOW_DAYS)
+
+    # 기간이 지난 게시글은 한 번에 0으로
+    expired = Post.objects.filter(created_at__lt=cutoff, hot_score__gt=0).update(hot_score=0)
+
+    rows = with_counts(Post.objects.filter(created_at__gte=cutoff)).values_list(
+        'id', 'created_at', 'like_count', 'num_comments'
+    ).iterator(chunk_size=chunk_size)
+
+    updated = 0
+    batch = []
+    for pk, created_at, likes, comments in rows:
+        batch.append(Post(id=pk, hot_score=hot_score(likes, comments, created_at, now)))
+        if len(batch) >= chunk_size:
+            Post.objects.bulk_update(batch, ['hot_score'])
+            updated += len(batch)
+            batch = []
+    if batch:
+        Post.objects.bulk_update(batch, ['hot_score'])
+        updated += len(batch)
+    return expired + updated
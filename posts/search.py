@@ -0,0 +1,241 @@
+import html
+import re
+
+from django.db import connection, transaction
+from django.db.models import Q
+
+from cinemamemory.pagination import InvalidCursor, decode_cursor, encode_cursor, paginate_keyset
+from .models import Post, Comment
+
+# 커뮤니티 전문 검색
+# SQLite FTS5 가상 테이블 하나에 게시글(제목/본문)과 댓글(본문)을 함께 색인한다.
+# 한국어는 조사가 붙어 띄어쓰기 단위로는 잘 맞지 않으므로 한글 구간을 2글자(bigram)로
+# 펼쳐 색인하고, 검색어도 같은 방식으로 펼쳐 구(phrase)로 찾는다.
+# 순위는 bm25 (제목 가중치 TITLE_WEIGHT), 하이라이트는 원문에서 직접 만든다.
+# 행 id는 (객체 id, 종류)로 정해져 있어 저장/삭제 시 해당 행만 바꾼다.
+SEARCH_TABLE = 'posts_search'
+TITLE_WEIGHT = 3.0
+SNIPPET_RADIUS = 40
+
+KIND_CODES = {'post': 0, 'comment': 1}
+_TERM_RE = re.compile(r'[가-힣]+|[^\W가-힣]+')
+
+_ready = set()  # 가상 테이블을 확인한 DB alias
+
+
+def is_supported():
+    return connection.vendor == 'sqlite'
+
+
+def ensure_index():
+    if connection.alias in _ready:
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5('
+            'kind UNINDEXED, object_id UNINDEXED, post_id UNINDEXED, title, body, '
+            "tokenize = 'unicode61')"
+        )
+    # 트랜잭션 안에서 만들었다가 롤백되면 테이블도 사라지므로 커밋된 뒤에만 확인 완료로 기록
+    alias = connection.alias
+    transaction.on_commit(lambda: _ready.add(alias))
+
+
+def _terms(text):
+    return _TERM_RE.findall(text or '')
+
+
+def _expand_term(term):
+    """한글 구간은 2글자 단위로 펼치고, 나머지 단어는 그대로"""
+    if len(term) > 1 and '가' <= term[0] <= '힣':
+        return ' '.join(term[i:i + 2] for i in range(len(term) - 1))
+    return term
+
+
+def expand_text(text):
+    return ' '.join(_expand_term(term) for term in _terms(text))
+
+
+def build_match_query(query):
+    """검색어 -> FTS5 MATCH 식 (각 단어를 구로 묶어 AND)"""
+    phrases = [f'"{_expand_term(term)}"' for term in _terms(query)]
+    return ' '.join(phrases)
+
+
+def _rowid(kind, object_id):
+    return object_id * 2 + KIND_CODES[kind]
+
+
+# ---- 색인 동기화 ----
+
+def _write(kind, object_id, post_id, title, body):
+    ensure_index()
+    rowid = _rowid(kind, object_id)
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [rowid])
+        cursor.execute(
+            f'INSERT INTO {SEARCH_TABLE} (rowid, kind, object_id, post_id, title, body) '
+            'VALUES (%s, %s, %s, %s, %s, %s)',
+            [rowid, kind, object_id, post_id, expand_text(title), expand_text(body)],
+        )
+
+
+def index_post(post):
+    if is_supported():
+        _write('post', post.id, post.id, post.title, post.content)
+
+
+def index_comment(comment):
+    if is_supported():
+        _write('comment', comment.id, comment.post_id, '', comment.content)
+
+
+def unindex(kind, object_id):
+    if not is_supported():
+        return
+    ensure_index()
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [_rowid(kind, object_id)]
+        )
+
+
+def rebuild_index(chunk_size=500):
+    """색인 전체 재생성 - 색인한 행 수 반환"""
+    ensure_index()
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {SEARCH_TABLE}')
+    count = 0
+    for post in Post.objects.only('id', 'title', 'content').iterator(chunk_size=chunk_size):
+        _write('post', post.id, post.id, post.title, post.content)
+        count += 1
+    for comment in Comment.objects.only('id', 'post_id', 'content').iterator(chunk_size=chunk_size):
+        _write('comment', comment.id, comment.post_id, '', comment.content)
+        count += 1
+    return count
+
+
+# ---- 검색 ----
+
+def highlight(text, query, radius=SNIPPET_RADIUS):
+    """원문에서 첫 일치 위치 주변을 잘라 일치 부분을 <mark>로 감쌈 (HTML 이스케이프 포함)"""
+    text = text or ''
+    terms = sorted(set(_terms(query)), key=len, reverse=True)
+    if not terms:
+        return html.escape(text[:radius * 2])
+    pattern = re.compile('|'.join(re.escape(term) for term in terms), re.IGNORECASE)
+
+    match = pattern.search(text)
+    start = max(match.start() - radius, 0) if match else 0
+    end = min(start + radius * 2 + (match.end() - match.start() if match else 0), len(text))
+    window = text[start:end]
+
+    parts = []
+    last = 0
+    for found in pattern.finditer(window):
+        parts.append(html.escape(window[last:found.start()]))
+        parts.append(f'<mark>{html.escape(found.group())}</mark>')
+        last = found.end()
+    parts.append(html.escape(window[last:]))
+    prefix = '...' if start > 0 else ''
+    suffix = '...' if end < len(text) else ''
+    return prefix + ''.join(parts) + suffix
+
+
+def _search_fts(match, kind, cursor, limit):
+    ensure_index()
+    position = decode_cursor(cursor)
+    sql = (
+        f'SELECT rowid, kind, object_id, post_id, '
+        f'bm25({SEARCH_TABLE}, 0, 0, 0, {TITLE_WEIGHT}, 1.0) AS score '
+        f'FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s'
+    )
+    params = [match]
+    if kind:
+        sql += ' AND kind = %s'
+        params.append(kind)
+    # bm25는 작을수록 관련도가 높음 - (score, rowid) 오름차순 키셋
+    sql = f'SELECT * FROM ({sql})'
+    if position is not None:
+        try:
+            score, rowid = float(position[0]), int(position[1])
+        except (TypeError, ValueError, IndexError, KeyError):
+            raise InvalidCursor('잘못된 검색 커서입니다.')
+        sql += ' WHERE score > %s OR (score = %s AND rowid > %s)'
+        params += [score, score, rowid]
+    sql += ' ORDER BY score, rowid LIMIT %s'
+    params.append(limit + 1)
+
+    with connection.cursor() as db_cursor:
+        db_cursor.execute(sql, params)
+        rows = db_cursor.fetchall()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor([rows[-1][4], rows[-1][0]])
+    return [(row[1], row[2], row[3]) for row in rows], next_cursor
+
+
+def _search_fallback(query, kind, cursor, limit):
+    """FTS5를 쓸 수 없는 DB - 게시글 제목/본문 부분 일치, 최신순"""
+    if kind == 'comment':
+        return [], None
+    posts = Post.objects.all()
+    for term in _terms(query):
+        posts = posts.filter(Q(title__icontains=term) | Q(content__icontains=term))
+    rows, next_cursor = paginate_keyset(posts.only('id'), ('created_at', 'id'), cursor, limit)
+    return [('post', post.id, post.id) for post in rows], next_cursor
+
+
+def search(query, kind=None, cursor=None, limit=20):
+    """
+    게시글/댓글 검색 한 페이지
+
+    kind: 'post' / 'comment' / None(전체)
+    반환: (결과 리스트, 다음 커서 또는 None) - 잘못된 커서는 InvalidCursor
+    """
+    match = build_match_query(query)
+    if not match:
+        return [], None
+    if is_supported():
+        hits, next_cursor = _search_fts(match, kind, cursor, limit)
+    else:
+        hits, next_cursor = _search_fallback(query, kind, cursor, limit)
+
+    # 원문/작성자는 종류별로 한 번씩 조회
+    comments = Comment.objects.select_related('user').in_bulk(
+        [object_id for hit_kind, object_id, _ in hits if hit_kind == 'comment']
+    )
+    posts = Post.objects.select_related('user').in_bulk(
+        [post_id for _, _, post_id in hits]
+    )
+
+    results = []
+    for hit_kind, object_id, post_id in hits:
+        post = posts.get(post_id)
+        if post is None:
+            continue
+        if hit_kind == 'post':
+            results.append({
+                'type': 'post',
+                'post_id': post.id,
+                'title': highlight(post.title, query),
+                'snippet': highlight(post.content, query),
+                'author': {'id': post.user.id, 'username': post.user.username},
+                'created_at': post.created_at.isoformat(),
+            })
+        else:
+            comment = comments.get(object_id)
+            if comment is None:
+                continue
+            results.append({
+                'type': 'comment',
+                'post_id': post.id,
+                'comment_id': comment.id,
+                'title': html.escape(post.title),
+                'snippet': highlight(comment.content, query),
+                'author': {'id': comment.user.id, 'username': comment.user.username},
+                'created_at': comment.created_at.isoformat(),
+            })
+    return results, next_cursor
@@ -1,5 +1,9 @@
 from rest_framework import serializers
+from cinemamemory.row_serializer import RowSerializer
 from .models import Post, Comment, Tag
+from .comment_tree import build_comment_tree
+from .tags import resolve_tags
+from .view_counter import view_counter
 
 class TagSerializer(serializers.ModelSerializer):
     class Meta:
@@ -11,7 +15,7 @@ class CommentSerializer(serializers.ModelSerializer):
     # user_id = serializers.IntegerField(source='user.id', read_only=True)
     # username = serializers.CharField(source='user.username', read_only=True)
     author = serializers.SerializerMethodField()
-    like_count = serializers.SerializerMethodField()
+    like_count = serializers.IntegerField(read_only=True)
     is_liked = serializers.SerializerMethodField()
     
     class Meta:
@@ -24,9 +28,6 @@ class CommentSerializer(serializers.ModelSerializer):
             'username': obj.user.username
         }
         
-    def get_like_count(self, obj):
-        return obj.like_users.count()
-    
     def get_is_liked(self, obj):
         request = self.context.get('request')
         if request and request.user.is_authenticated:
@@ -39,7 +40,8 @@ class CommentSerializer(serializers.ModelSerializer):
 
 class PostListSerializer(serializers.ModelSerializer):
     tags = TagSerializer(many=True, read_only=True)
-    like_count = serializers.SerializerMethodField()
+    like_count = serializers.IntegerField(read_only=True)
+    view_count = serializers.IntegerField(read_only=True)
     comment_count = serializers.SerializerMethodField()
     # user_id = serializers.IntegerField(source='user.id', read_only=True)
     # username = serializers.CharField(source='user.username', read_only=True)
@@ -47,7 +49,7 @@ class PostListSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Post
-        fields = ('id', 'author', 'title', 'content', 'tags', 'like_count', 'comment_count', 'created_at', 'updated_at')
+        fields = ('id', 'author', 'title', 'content', 'tags', 'like_count', 'view_count', 'comment_count', 'created_at', 'updated_at')
     
     def get_author(self, obj):
       return {
@@ -55,11 +57,36 @@ class PostListSerializer(serializers.ModelSerializer):
         'username': obj.user.username
       }
 
-    def get_like_count(self, obj):
-        return obj.like_users.count()
-    
     def get_comment_count(self, obj):
-        return obj.comment_set.count()
+        if hasattr(obj, 'num_comments'):
+            return obj.num_comments
+        return obj.comment_count
+
+class PostListRowSerializer(RowSerializer):
+    """PostListSerializer와 같은 출력을 values() 행에서 (목록 API용, 쿼리셋은 with_counts 적용)"""
+    serializer_class = PostListSerializer
+    extra_columns = ('user_id', 'user__username', 'num_comments')
+
+    def prefetch(self):
+        # 페이지 전체 게시글의 태그를 한 번에 (prefetch_related('tags')와 같은 쿼리)
+        self.tags = {}
+        post_ids = [row['id'] for row in self.rows]
+        if post_ids:
+            rows = Tag.objects.filter(post__in=post_ids).values_list('post', 'id', 'name')
+            for post_id, tag_id, name in rows:
+                self.tags.setdefault(post_id, []).append({'id': tag_id, 'name': name})
+
+    def get_author(self, row):
+        return {
+            'id': row['user_id'],
+            'username': row['user__username']
+        }
+
+    def get_tags(self, row):
+        return self.tags.get(row['id'], [])
+
+    def get_comment_count(self, row):
+        return row['num_comments']
 
 class PostSerializer(serializers.ModelSerializer):
     tags = TagSerializer(many=True, read_only=True)
@@ -74,7 +101,8 @@ class PostSerializer(serializers.ModelSerializer):
         required=False,
         help_text="새로운 태그를 생성하거나 기존 태그를 이름으로 연결"
     )
-    like_count = serializers.SerializerMethodField()
+    like_count = serializers.IntegerField(read_only=True)
+    view_count = serializers.SerializerMethodField()
     is_liked = serializers.SerializerMethodField()
     comments = serializers.SerializerMethodField()
     comment_count = serializers.SerializerMethodField()
@@ -84,8 +112,8 @@ class PostSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Post
-        fields = ('id', 'author','title', 'content', 'tags', 'tag_ids', 'tag_names', 'like_count', 'is_liked', 'comments', 'comment_count', 'created_at', 'updated_at')
-        read_only_fields = ('author', 'like_count', 'is_liked', 'comments', 'comment_count')
+        fields = ('id', 'author','title', 'content', 'tags', 'tag_ids', 'tag_names', 'like_count', 'view_count', 'is_liked', 'comments', 'comment_count', 'created_at', 'updated_at')
+        read_only_fields = ('author', 'like_count', 'view_count', 'is_liked', 'comments', 'comment_count')
 
     def get_author(self, obj):
       return {
@@ -93,8 +121,9 @@ class PostSerializer(serializers.ModelSerializer):
         'username': obj.user.username
       }
     
-    def get_like_count(self, obj):
-        return obj.like_users.count()
+    def get_view_count(self, obj):
+        # 아직 반영하지 않은 이 프로세스의 조회수까지 포함
+        return obj.view_count + view_counter.pending(obj.id)
     
     def get_is_liked(self, obj):
         request = self.context.get('request')
@@ -103,16 +132,14 @@ class PostSerializer(serializers.ModelSerializer):
         return False
     
     def get_comments(self, obj):
-        # 최상위 댓글들만 가져옴 (parent가 None인 것들)
-        top_level_comments = obj.comment_set.filter(parent=None).order_by('created_at')
-        return CommentSerializer(top_level_comments, many=True).data
+        # 댓글 트리는 한 번에 읽어 메모리에서 조립 (댓글마다 쿼리하지 않음)
+        request = self.context.get('request')
+        return build_comment_tree(obj.id, request.user if request else None)
     
     def get_comment_count(self, obj):
-        return obj.comment_set.count()
+        return obj.comment_count
     
     def create(self, validated_data):
-        from .models import Tag  # Tag 모델 import 추가 필요
-        
         # validated_data.pop()은 딕셔너리에서 해당 키의 값을 가져오고 삭제하는 메서드입니다.
         # 두 번째 인자 []는 키가 없을 경우의 기본값입니다.
         # tag_ids와 tag_names는 Post 모델의 직접적인 필드가 아니므로 
@@ -122,49 +149,27 @@ class PostSerializer(serializers.ModelSerializer):
         
         post = Post.objects.create(**validated_data)
         
-        # 기존 태그 ID로 연결
-        if tag_ids:
-            post.tags.add(*tag_ids)
-        
-        # 태그 이름으로 생성/연결
-        if tag_names:
-            for tag_name in tag_names:
-                tag, created = Tag.objects.get_or_create(
-                    name=tag_name.strip(),
-                    defaults={'name': tag_name.strip()}
-                )
-                post.tags.add(tag)
+        # 기존 태그 ID + 태그 이름(없으면 일괄 생성)을 한 번에 연결
+        tags = list(tag_ids) + resolve_tags(tag_names)
+        if tags:
+            post.tags.add(*tags)
         
         return post
     
     def update(self, instance, validated_data):
-        from .models import Tag
-        
         # 태그 관련 데이터 분리
         tag_ids = validated_data.pop('tag_ids', None)
         tag_names = validated_data.pop('tag_names', None)
         
-        # 기본 필드 업데이트
+        # 기본 필드 업데이트 - 바꾼 필드만 저장 (동시에 증감된 like_count/comment_count를 덮어쓰지 않음)
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
-        instance.save()
+        instance.save(update_fields=[*validated_data, 'updated_at'])
         
         # 태그 업데이트 (tag_ids나 tag_names가 제공된 경우에만)
         if tag_ids is not None or tag_names is not None:
-            # 기존 태그 모두 제거
-            instance.tags.clear()
-            
-            # 새로운 태그 추가
-            if tag_ids:
-                instance.tags.add(*tag_ids)
-            
-            if tag_names:
-                for tag_name in tag_names:
-                    tag, created = Tag.objects.get_or_create(
-                        name=tag_name.strip(),
-                        defaults={'name': tag_name.strip()}
-                    )
-                    instance.tags.add(tag)
+            # 바뀐 연결만 추가/삭제
+            instance.tags.set(list(tag_ids or []) + resolve_tags(tag_names or []))
         
         return instance
     
@@ -0,0 +1,161 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_save, pre_delete, post_delete, m2m_changed
+from django.dispatch import receiver
+
+from cinemamemory.cache import invalidate
+from .models import Post, Comment, Tag
+from .ranking import refresh_hot_score
+from .stats import community_snapshot
+from .tags import recount_tags
+from .likes import recount_likes
+from .querysets import adjust_comment_count
+from . import search
+
+User = get_user_model()
+
+
+# ORM(add/remove/clear)으로 좋아요가 바뀐 경우 - like_count를 다시 세고 hot 점수 갱신
+# (API의 좋아요 토글은 posts.likes에서 직접 처리하며 이 신호를 거치지 않음)
+@receiver(m2m_changed, sender=Post.like_users.through)
+def refresh_on_like(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == 'pre_clear' and reverse:
+        instance._cleared_post_ids = list(instance.liked_posts.values_list('id', flat=True))
+        return
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if reverse:
+        # user.liked_posts 쪽에서 바뀐 것 - pk_set이 게시글 id
+        post_ids = list(pk_set) if pk_set else getattr(instance, '_cleared_post_ids', [])
+    else:
+        post_ids = [instance.pk]
+    recount_likes(Post, post_ids)
+    for post_id in post_ids:
+        refresh_hot_score(post_id)
+    # 통계 스냅샷의 최신 게시글 좋아요 수는 다음 재계산에서 맞춤
+    community_snapshot.invalidate()
+
+
+@receiver(m2m_changed, sender=Comment.like_users.through)
+def recount_comment_likes(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == 'pre_clear' and reverse:
+        instance._cleared_comment_ids = list(instance.liked_comments.values_list('id', flat=True))
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        if reverse:
+            comment_ids = list(pk_set) if pk_set else getattr(instance, '_cleared_comment_ids', [])
+        else:
+            comment_ids = [instance.pk]
+        recount_likes(Comment, comment_ids)
+
+
+@receiver(post_save, sender=Comment)
+def refresh_on_comment(sender, instance, created, **kwargs):
+    if created:
+        adjust_comment_count(instance.post_id, 1)
+        refresh_hot_score(instance.post_id)
+
+
+@receiver(post_delete, sender=Comment)
+def refresh_on_comment_delete(sender, instance, origin=None, **kwargs):
+    # 답글/계정 삭제에 따른 연쇄 삭제도 댓글 수에 반영 (게시글이 함께 지워지면 갱신할 행 없음)
+    adjust_comment_count(instance.post_id, -1)
+    # hot 점수는 댓글을 직접 지운 경우만 (연쇄 삭제는 주기 재계산이 보정)
+    if origin is instance:
+        refresh_hot_score(instance.post_id)
+
+
+# 커뮤니티 통계 스냅샷 갱신
+@receiver(post_save, sender=User)
+def count_user(sender, instance, created, **kwargs):
+    if created:
+        community_snapshot.user_created(instance)
+
+
+@receiver(post_delete, sender=User)
+def uncount_user(sender, instance, **kwargs):
+    community_snapshot.user_deleted(instance)
+
+
+@receiver(post_save, sender=Post)
+def count_post(sender, instance, created, **kwargs):
+    if created:
+        community_snapshot.post_created(instance)
+
+
+@receiver(post_delete, sender=Post)
+def uncount_post(sender, instance, **kwargs):
+    community_snapshot.post_deleted(instance)
+
+
+@receiver(post_save, sender=Comment)
+def count_comment(sender, instance, created, **kwargs):
+    if created:
+        community_snapshot.comment_created(instance)
+
+
+@receiver(post_delete, sender=Comment)
+def uncount_comment(sender, instance, **kwargs):
+    community_snapshot.comment_deleted(instance)
+
+
+# 태그 post_count 동기화 - 바뀐 태그만 연결 테이블 기준으로 다시 셈
+@receiver(m2m_changed, sender=Post.tags.through)
+def sync_tag_counts(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == 'pre_clear' and not reverse:
+        instance._cleared_tag_ids = list(instance.tags.values_list('id', flat=True))
+    elif action in ('post_add', 'post_remove'):
+        recount_tags([instance.pk] if reverse else pk_set)
+    elif action == 'post_clear':
+        recount_tags([instance.pk] if reverse else getattr(instance, '_cleared_tag_ids', []))
+
+
+@receiver(pre_delete, sender=Post)
+def remember_post_tags(sender, instance, **kwargs):
+    # 게시글 삭제 시 연결 행은 신호 없이 지워지므로 미리 태그 id를 기억
+    instance._deleted_tag_ids = list(instance.tags.values_list('id', flat=True))
+
+
+@receiver(post_delete, sender=Post)
+def sync_deleted_post_tags(sender, instance, **kwargs):
+    tag_ids = getattr(instance, '_deleted_tag_ids', None)
+    if tag_ids:
+        recount_tags(tag_ids)
+
+
+# 검색 색인 동기화 - 바뀐 게시글/댓글 행만 갱신
+@receiver(post_save, sender=Post)
+def index_post(sender, instance, **kwargs):
+    search.index_post(instance)
+
+
+@receiver(post_save, sender=Comment)
+def index_comment(sender, instance, **kwargs):
+    search.index_comment(instance)
+
+
+@receiver(post_delete, sender=Post)
+def unindex_post(sender, instance, **kwargs):
+    search.unindex('post', instance.id)
+
+
+@receiver(post_delete, sender=Comment)
+def unindex_comment(sender, instance, **kwargs):
+    search.unindex('comment', instance.id)
+
+
+# 뷰 캐시 무효화 (cinemamemory.cache) - 목록에 쓰이는 댓글 수도 게시글 태그로 무효화
+@receiver(post_save, sender=Post)
+@receiver(post_delete, sender=Post)
+def invalidate_post_cache(sender, instance, **kwargs):
+    invalidate(f'post:{instance.pk}')
+
+
+@receiver(post_save, sender=Comment)
+@receiver(post_delete, sender=Comment)
+def invalidate_comment_post_cache(sender, instance, **kwargs):
+    invalidate(f'post:{instance.post_id}')
+
+
+@receiver(post_save, sender=Tag)
+@receiver(post_delete, sender=Tag)
+def invalidate_tag_cache(sender, instance, **kwargs):
+    invalidate(f'tag:{instance.pk}')
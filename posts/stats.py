@@ -0,0 +1,213 @@
+import threading
+import time
+from collections import deque
+from datetime import datetime
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+
+from .models import Post, Comment, Tag
+from .querysets import with_counts
+
+# 커뮤니티 통계 스냅샷
+# 생성/삭제 신호로 합계와 오늘 카운터, 최신 항목을 프로세스 메모리에서 갱신하고
+# community_snapshot는 스냅샷만 읽는다. 다른 워커 프로세스의 변경이나 신호를 거치지 않는
+# 대량 변경은 MAX_STALENESS(초)마다 DB에서 다시 계산해 보정한다.
+MAX_STALENESS = getattr(settings, 'COMMUNITY_STATS_MAX_STALENESS', 300)
+RECENT_SIZE = 5
+POPULAR_TAG_SIZE = 10
+
+User = get_user_model()
+
+
+def _truncate(text, length):
+    return text[:length] + '...' if len(text) > length else text
+
+
+def _recent_post(post, like_count=0, comment_count=0):
+    return {
+        'id': post.id,
+        'title': _truncate(post.title, 30),
+        'author': post.user.username,
+        'created_at': post.created_at.isoformat(),
+        'comment_count': comment_count,
+        'like_count': like_count,
+    }
+
+
+def _recent_comment(comment):
+    return {
+        'id': comment.id,
+        'content': _truncate(comment.content, 50),
+        'author': comment.user.username,
+        'post_title': _truncate(comment.post.title, 20),
+        'post_id': comment.post_id,
+        'created_at': comment.created_at.isoformat(),
+    }
+
+
+class CommunityStats:
+    KINDS = ('users', 'posts', 'comments')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._built_at = None  # time.monotonic() 기준 - None이면 다시 계산 필요
+        self.day = None
+        self.totals = dict.fromkeys(self.KINDS, 0)
+        self.today = dict.fromkeys(self.KINDS, 0)
+        self.recent_posts = deque(maxlen=RECENT_SIZE)
+        self.recent_comments = deque(maxlen=RECENT_SIZE)
+        self.popular_tags = []
+        self.last_updated = None
+
+    # ---- 재계산 ----
+
+    def _rebuild(self):
+        today = timezone.localdate()
+        totals = {
+            'users': User.objects.count(),
+            'posts': Post.objects.count(),
+            'comments': Comment.objects.count(),
+        }
+        today_counts = {
+            'users': User.objects.filter(date_joined__date=today).count(),
+            'posts': Post.objects.filter(created_at__date=today).count(),
+            'comments': Comment.objects.filter(created_at__date=today).count(),
+        }
+        recent_posts = with_counts(Post.objects.select_related('user')).order_by('-created_at', '-id')[:RECENT_SIZE]
+        recent_comments = Comment.objects.select_related('user', 'post').order_by('-created_at', '-id')[:RECENT_SIZE]
+        popular_tags = Tag.objects.filter(post_count__gt=0).order_by('-post_count', 'name')[:POPULAR_TAG_SIZE]
+
+        self.day = today
+        self.totals = totals
+        self.today = today_counts
+        # deque는 왼쪽이 최신
+        self.recent_posts = deque(
+            (_recent_post(post, post.like_count, post.num_comments) for post in recent_posts),
+            maxlen=RECENT_SIZE,
+        )
+        self.recent_comments = deque(
+            (_recent_comment(comment) for comment in recent_comments), maxlen=RECENT_SIZE
+        )
+        self.popular_tags = [
+            {'id': tag.id, 'name': tag.name, 'post_count': tag.post_count}
+            for tag in popular_tags
+        ]
+        self._built_at = time.monotonic()
+        self.last_updated = datetime.now()
+
+    def _is_stale(self):
+        return self._built_at is None or time.monotonic() - self._built_at > MAX_STALENESS
+
+    def _roll_day(self):
+        today = timezone.localdate()
+        if self.day != today:
+            self.day = today
+            self.today = dict.fromkeys(self.KINDS, 0)
+
+    def _touch(self):
+        self.last_updated = datetime.now()
+
+    def invalidate(self):
+        with self._lock:
+            self._built_at = None
+
+    def snapshot(self):
+        with self._lock:
+            if self._is_stale():
+                self._rebuild()
+            else:
+                self._roll_day()
+            return {
+                'users': {'total': self.totals['users'], 'today': self.today['users']},
+                'posts': {'total': self.totals['posts'], 'today': self.today['posts']},
+                'comments': {'total': self.totals['comments'], 'today': self.today['comments']},
+                'recent_posts': [dict(item) for item in self.recent_posts],
+                'recent_comments': [dict(item) for item in self.recent_comments],
+                'popular_tags': list(self.popular_tags),
+                'last_updated': self.last_updated.isoformat(),
+            }
+
+    # ---- 신호에서 호출 ----
+
+    def _created(self, kind, created_at):
+        self._roll_day()
+        self.totals[kind] += 1
+        if timezone.localdate(created_at) == self.day:
+            self.today[kind] += 1
+
+    def _deleted(self, kind, created_at):
+        self._roll_day()
+        self.totals[kind] = max(self.totals[kind] - 1, 0)
+        if timezone.localdate(created_at) == self.day:
+            self.today[kind] = max(self.today[kind] - 1, 0)
+
+    def user_created(self, user):
+        with self._lock:
+            if self._built_at is None:
+                return
+            self._created('users', user.date_joined)
+            self._touch()
+
+    def user_deleted(self, user):
+        with self._lock:
+            if self._built_at is None:
+                return
+            self._deleted('users', user.date_joined)
+            self._touch()
+
+    def post_created(self, post):
+        with self._lock:
+            if self._built_at is None:
+                return
+            self._created('posts', post.created_at)
+            self.recent_posts.appendleft(_recent_post(post))
+            self._touch()
+
+    def post_deleted(self, post):
+        with self._lock:
+            if self._built_at is None:
+                return
+            self._deleted('posts', post.created_at)
+            if any(item['id'] == post.id for item in self.recent_posts) or any(
+                item['post_id'] == post.id for item in self.recent_comments
+            ):
+                # 최신 목록에서 빠진 자리는 DB에서 다시 채움
+                self._built_at = None
+            self._touch()
+
+    def comment_created(self, comment):
+        with self._lock:
+            if self._built_at is None:
+                return
+            self._created('comments', comment.created_at)
+            self.recent_comments.appendleft(_recent_comment(comment))
+            for item in self.recent_posts:
+                if item['id'] == comment.post_id:
+                    item['comment_count'] += 1
+            self._touch()
+
+    def comment_deleted(self, comment):
+        with self._lock:
+            if self._built_at is None:
+                return
+            self._deleted('comments', comment.created_at)
+            for item in self.recent_posts:
+                if item['id'] == comment.post_id:
+                    item['comment_count'] = max(item['comment_count'] - 1, 0)
+            if any(item['id'] == comment.id for item in self.recent_comments):
+                self._built_at = None
+            self._touch()
+
+    def likes_changed(self, post_id, delta):
+        with self._lock:
+            if self._built_at is None:
+                return
+            for item in self.recent_posts:
+                if item['id'] == post_id:
+                    item['like_count'] = max(item['like_count'] + delta, 0)
+                    self._touch()
+
+
+community_snapshot = CommunityStats()
@@ -0,0 +1,84 @@
+from django.db import transaction
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from cinemamemory.cache import invalidate
+from .models import Post, Tag
+
+
+def normalize_tag_name(name):
+    """앞뒤 공백/'#' 제거, 연속 공백을 하나로, 대소문자 통일"""
+    return ' '.join(str(name).strip().lstrip('#').split()).casefold()
+
+
+def resolve_tags(names):
+    """
+    태그 이름 목록을 Tag 객체로 변환 - 없는 태그는 한 번에 생성
+
+    이름 수와 관계없이 조회 1회 + (새 태그가 있으면) 일괄 생성 1회 + 재조회 1회
+    """
+    normalized = []
+    for name in names:
+        name = normalize_tag_name(name)
+        if name and name not in normalized:
+            normalized.append(name)
+    if not normalized:
+        return []
+
+    tags = {tag.name: tag for tag in Tag.objects.filter(name__in=normalized)}
+    missing = [name for name in normalized if name not in tags]
+    if missing:
+        # 동시에 같은 태그를 만드는 요청이 있어도 unique 제약으로 한 행만 남음
+        Tag.objects.bulk_create([Tag(name=name) for name in missing], ignore_conflicts=True)
+        tags.update({tag.name: tag for tag in Tag.objects.filter(name__in=missing)})
+    return [tags[name] for name in normalized if name in tags]
+
+
+def recount_tags(tag_ids=None):
+    """post_count를 게시글-태그 연결 테이블 기준으로 다시 계산 (tag_ids가 없으면 전체)"""
+    counts = Post.tags.through.objects.filter(
+        tag_id=OuterRef('pk')
+    ).order_by().values('tag_id').annotate(count=Count('*')).values('count')
+    tags = Tag.objects.all() if tag_ids is None else Tag.objects.filter(pk__in=tag_ids)
+    updated = tags.update(post_count=Coalesce(Subquery(counts), 0))
+    invalidate('tag:*')
+    return updated
+
+
+def normalize_existing_tags():
+    """
+    정규화 이전에 저장된 태그 이름을 정규화하고 같은 이름이 되는 태그를 하나로 합침
+
+    ('Action', '#action' -> 'action') 이미 정규화된 이름의 태그가 있으면 그 태그를, 없으면 id가 가장
+    작은 태그를 남기고 나머지 태그의 게시글 연결을 옮긴 뒤 삭제한다. 정규화하면 빈 이름이 되는 태그('#')는 삭제.
+    반환: (이름을 바꾼 태그 수, 합쳐서 삭제한 태그 수, 빈 이름이라 삭제한 태그 수)
+    """
+    groups = {}
+    for tag_id, name in Tag.objects.order_by('id').values_list('id', 'name'):
+        groups.setdefault(normalize_tag_name(name), []).append((tag_id, name))
+
+    through = Post.tags.through
+    renamed = merged = removed = 0
+    with transaction.atomic():
+        empty = groups.pop('', [])
+        if empty:
+            Tag.objects.filter(pk__in=[tag_id for tag_id, _ in empty]).delete()
+            removed = len(empty)
+
+        for normalized, tags in groups.items():
+            if len(tags) == 1 and tags[0][1] == normalized:
+                continue
+            keep_id = next((tag_id for tag_id, name in tags if name == normalized), tags[0][0])
+            duplicate_ids = [tag_id for tag_id, _ in tags if tag_id != keep_id]
+            if duplicate_ids:
+                post_ids = through.objects.filter(tag_id__in=duplicate_ids).values_list('post_id', flat=True)
+                through.objects.bulk_create(
+                    [through(post_id=post_id, tag_id=keep_id) for post_id in set(post_ids)],
+                    ignore_conflicts=True,
+                )
+                # 연결 행은 태그와 함께 삭제된다
+                Tag.objects.filter(pk__in=duplicate_ids).delete()
+                merged += len(duplicate_ids)
+            if Tag.objects.filter(pk=keep_id).exclude(name=normalized).update(name=normalized):
+                renamed += 1
+    return renamed, merged, removed
@@ -1,3 +1,159 @@
+import datetime
+from unittest import mock
+
+from django.core.cache import cache
 from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from accounts.models import User
+from . import search
+from .models import Post, Comment
+from .view_counter import view_counter
+from .views import POST_LIST_ORDERINGS
+
+BASE = '/api/v1/cinememory/community/'
+
+
+def setUpModule():
+    # 검색 가상 테이블은 테스트 트랜잭션 밖에서 한 번 만든다 (롤백되는 트랜잭션 안에서 만들지 않도록)
+    search.ensure_index()
+
+
+def make_user(username):
+    return User.objects.create_user(username=username, password='pw', birth=datetime.date(1995, 1, 1))
+
+
+def client_for(user):
+    client = APIClient()
+    client.force_authenticate(user)
+    return client
+
+
+class LikeToggleTests(TestCase):
+    """좋아요 토글 - like_count가 항상 연결 행 수와 같아야 한다"""
+
+    def setUp(self):
+        cache.clear()
+        self.author = make_user('author')
+        self.users = [make_user(f'user{i}') for i in range(3)]
+        self.post = Post.objects.create(user=self.author, title='t', content='c')
+        self.comment = Comment.objects.create(user=self.author, post=self.post, content='c')
+
+    def assertCounterMatches(self, obj):
+        obj.refresh_from_db()
+        self.assertEqual(obj.like_count, obj.like_users.count())
+
+    def test_post_like_and_unlike(self):
+        for count, user in enumerate(self.users, 1):
+            response = client_for(user).post(f'{BASE}post/{self.post.id}/likes/')
+            self.assertEqual(response.status_code, 200)
+            self.assertTrue(response.data['is_liked'])
+            self.assertEqual(response.data['like_count'], count)
+
+        response = client_for(self.users[0]).post(f'{BASE}post/{self.post.id}/likes/')
+        self.assertFalse(response.data['is_liked'])
+        self.assertEqual(response.data['like_count'], 2)
+        self.assertCounterMatches(self.post)
+
+    def test_repeated_toggle_alternates_and_never_goes_negative(self):
+        client = client_for(self.users[0])
+        states = [client.post(f'{BASE}post/{self.post.id}/likes/').data['is_liked'] for _ in range(4)]
+        self.assertEqual(states, [True, False, True, False])
+        self.assertCounterMatches(self.post)
+        self.assertEqual(self.post.like_count, 0)
+
+    def test_comment_like_and_unlike(self):
+        url = f'{BASE}post/{self.post.id}/comments/{self.comment.id}/likes/'
+        for user in self.users:
+            client_for(user).post(url)
+        response = client_for(self.users[1]).post(url)
+        self.assertFalse(response.data['is_liked'])
+        self.assertEqual(response.data['like_count'], 2)
+        self.assertCounterMatches(self.comment)
+
+    def test_missing_target_leaves_no_link(self):
+        response = client_for(self.users[0]).post(f'{BASE}post/{self.post.id + 100}/likes/')
+        self.assertEqual(response.status_code, 404)
+        other = Post.objects.create(user=self.author, title='o', content='c')
+        # 다른 게시글 경로로 온 댓글 좋아요
+        response = client_for(self.users[0]).post(f'{BASE}post/{other.id}/comments/{self.comment.id}/likes/')
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(Post.like_users.through.objects.count(), 0)
+        self.assertEqual(Comment.like_users.through.objects.count(), 0)
+
+
+class PostListCursorTests(TestCase):
+    """post_list 커서 - 모든 정렬에서 페이지를 이어 읽으면 모든 게시글이 정확히 한 번씩 정렬 순서대로 나온다"""
+
+    def setUp(self):
+        cache.clear()
+        author = make_user('author')
+        self.client = client_for(author)
+        now = timezone.now()
+        for i in range(25):
+            post = Post.objects.create(user=author, title=f'p{i}', content='c')
+            # 정렬 값이 겹치는 행을 일부러 만든다 (id가 마지막 구분 키)
+            Post.objects.filter(pk=post.pk).update(
+                created_at=now - datetime.timedelta(minutes=i // 3),
+                like_count=i % 4,
+                comment_count=i % 3,
+                hot_score=float(i % 5),
+            )
+
+    def walk(self, sort):
+        ids, cursor = [], None
+        for _ in range(10):
+            params = {'sort': sort, 'page_size': 7}
+            if cursor:
+                params['cursor'] = cursor
+            response = self.client.get(BASE, params)
+            self.assertEqual(response.status_code, 200)
+            ids += [post['id'] for post in response.data['posts']]
+            cursor = response.data['next_cursor']
+            if cursor is None:
+                return ids
+        self.fail('커서가 끝나지 않습니다.')
+
+    def test_round_trip_for_every_sort(self):
+        for sort, fields in POST_LIST_ORDERINGS.items():
+            with self.subTest(sort=sort):
+                expected = list(
+                    Post.objects.order_by(*[f'-{field}' for field in fields]).values_list('id', flat=True)
+                )
+                self.assertEqual(self.walk(sort), expected)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(BASE, {'cursor': 'not-a-cursor'})
+        self.assertEqual(response.status_code, 400)
+
+
+class PostConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        # 조회수 반영 스레드가 테스트 트랜잭션 밖에서 같은 DB에 쓰지 않도록
+        patcher = mock.patch.object(view_counter, '_ensure_timer')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(view_counter.flush)  # 쌓인 조회수는 테스트 트랜잭션 안에서 반영
+        self.author = make_user('author')
+        self.client = client_for(self.author)
+        self.post = Post.objects.create(user=self.author, title='t', content='c')
+        self.url = f'{BASE}post/{self.post.id}/'
+
+    def revalidate(self):
+        etag = self.client.get(self.url)['ETag']
+        return lambda: self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+    def test_unchanged_post_returns_304(self):
+        self.assertEqual(self.revalidate()().status_code, 304)
+
+    def test_new_comment_returns_200(self):
+        again = self.revalidate()
+        Comment.objects.create(user=self.author, post=self.post, content='new')
+        self.assertEqual(again().status_code, 200)
 
-# Create your tests here.
+    def test_view_count_flush_keeps_etag(self):
+        again = self.revalidate()
+        Post.objects.filter(pk=self.post.pk).update(view_count=100)
+        self.assertEqual(again().status_code, 304)
@@ -0,0 +1,110 @@
+import atexit
+import threading
+import time
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Case, F, IntegerField, Value, When
+
+from .models import Post
+
+# 게시글 조회수 버퍼
+# 조회마다 UPDATE 하면 SQLite 단일 쓰기 락 뒤로 읽기 요청이 줄을 서므로
+# 프로세스 메모리에서 게시글별 증가분을 모았다가 UPDATE 한 문장으로 반영한다.
+# 반영 시점: 쌓인 조회가 FLUSH_THRESHOLD 이상 / 마지막 반영 후 FLUSH_INTERVAL초 / 프로세스 종료
+# 워커가 비정상 종료되면 최대 FLUSH_THRESHOLD건 또는 FLUSH_INTERVAL초 분량의 조회만 유실된다.
+FLUSH_INTERVAL = getattr(settings, 'POST_VIEW_FLUSH_INTERVAL', 10)
+FLUSH_THRESHOLD = getattr(settings, 'POST_VIEW_FLUSH_THRESHOLD', 500)
+DEDUPE_WINDOW = getattr(settings, 'POST_VIEW_DEDUPE_WINDOW', 1800)  # 같은 사용자의 재조회는 이 시간(초) 동안 한 번만
+
+
+class ViewCounter:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._pending = {}  # post_id -> 아직 반영하지 않은 조회 수
+        self._pending_total = 0
+        self._seen = {}  # (post_id, viewer) -> 중복 무시 만료 시각
+        self._last_flush = time.monotonic()
+        self._timer = None
+
+    def record(self, post_id, viewer=None):
+        """조회 1회 기록 - 중복이면 False"""
+        now = time.monotonic()
+        with self._lock:
+            if viewer is not None:
+                key = (post_id, viewer)
+                if self._seen.get(key, 0) > now:
+                    return False
+                self._seen[key] = now + DEDUPE_WINDOW
+            self._pending[post_id] = self._pending.get(post_id, 0) + 1
+            self._pending_total += 1
+            due = (
+                self._pending_total >= FLUSH_THRESHOLD
+                or now - self._last_flush >= FLUSH_INTERVAL
+            )
+        self._ensure_timer()
+        if due:
+            self.flush()
+        return True
+
+    def pending(self, post_id):
+        with self._lock:
+            return self._pending.get(post_id, 0)
+
+    def flush(self):
+        """모아 둔 증가분을 UPDATE 한 문장으로 반영 - 반영한 조회 수 반환"""
+        with self._flush_lock:
+            with self._lock:
+                deltas, self._pending, self._pending_total = self._pending, {}, 0
+                now = time.monotonic()
+                self._last_flush = now
+                self._seen = {key: expires for key, expires in self._seen.items() if expires > now}
+            if not deltas:
+                return 0
+            try:
+                Post.objects.filter(pk__in=deltas.keys()).update(
+                    view_count=F('view_count') + Case(
+                        *[When(pk=post_id, then=Value(count)) for post_id, count in deltas.items()],
+                        default=Value(0),
+                        output_field=IntegerField(),
+                    )
+                )
+            except Exception as e:
+                # 반영하지 못한 증가분은 다음 반영 때 다시 시도
+                print(f"❌ 조회수 반영 오류: {str(e)}")
+                with self._lock:
+                    for post_id, count in deltas.items():
+                        self._pending[post_id] = self._pending.get(post_id, 0) + count
+                        self._pending_total += count
+                return 0
+            return sum(deltas.values())
+
+    def _ensure_timer(self):
+        # 요청이 끊겨도 FLUSH_INTERVAL마다 반영되도록 백그라운드 스레드 하나를 둠
+        if self._timer is not None:
+            return
+        with self._lock:
+            if self._timer is not None:
+                return
+            self._timer = threading.Thread(target=self._run_timer, daemon=True)
+            self._timer.start()
+
+    def _run_timer(self):
+        while True:
+            time.sleep(FLUSH_INTERVAL)
+            try:
+                self.flush()
+            finally:
+                connection.close()
+
+
+view_counter = ViewCounter()
+atexit.register(view_counter.flush)
+
+
+def viewer_key(request):
+    """중복 조회 판단 기준 - 로그인 사용자는 id, 아니면 IP"""
+    if request.user.is_authenticated:
+        return f'user:{request.user.id}'
+    return f'ip:{request.META.get("REMOTE_ADDR", "")}'
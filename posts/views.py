@@ -1,59 +1,111 @@
 from rest_framework.decorators import api_view
-from .serializer import PostSerializer, PostListSerializer, CommentSerializer
+from .serializer import PostSerializer, PostListRowSerializer, CommentSerializer
 from .models import Tag
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.decorators import permission_classes
 from rest_framework.response import Response
 from rest_framework import status
 from .models import Post, Comment
-from django.db.models import Count, Q
+from django.db.models import Count, Exists, OuterRef, Q
 from django.contrib.auth import get_user_model
 from datetime import datetime, timedelta
+from cinemamemory.pagination import InvalidCursor, get_page_size, paginate_keyset
+from .comment_tree import build_comment_page
+from .querysets import with_counts
+from . import likes
+from .view_counter import view_counter, viewer_key
+from .live import publish_post_event, comment_event_data
+from accounts.notifications import notify
+from cinemamemory.cache import cached_view
+from cinemamemory.conditional import conditional_view, related_count, related_max, related_sum, viewer_id
+from cinemamemory.db_router import read_replica
+from cinemamemory.streaming import STREAM_CHUNK_SIZE, ndjson_response, wants_stream
+from .stats import community_snapshot
+from .tags import normalize_tag_name
+from .search import search
+
+# 정렬 방식별 키셋 기준 (모두 내림차순)
+POST_LIST_ORDERINGS = {
+    'latest': ('created_at', 'id'),
+    'hot': ('hot_score', 'id'),  # 저장된 hot_score 인덱스 범위 조회
+    'popular': ('like_count', 'created_at', 'id'),
+    'comments': ('comment_count', 'created_at', 'id'),  # 저장된 comment_count 인덱스 범위 조회
+}
+
 
-# 페이지네이션 설정 필요 -> 한 번에 몇 개 보일건지
 @api_view(['GET'])
 @permission_classes([])  # 인증 불필요 명시
+@read_replica
 def post_list(request):
     """
-    포스트 목록 조회 API - 최신순 정렬
+    포스트 목록 조회 API - 커서 페이지네이션
+
+    응답 형식 변경(하위 호환 깨짐): 예전에는 게시글 배열을 그대로 돌려줬지만
+    이제는 {'posts': [...], 'next_cursor': ...} 객체이다. 클라이언트는 posts를 읽고
+    next_cursor가 있으면 cursor 파라미터로 다음 페이지를 요청해야 한다.
+
+    쿼리 파라미터:
+    - sort: latest(기본) / hot / popular / comments
+    - cursor: 이전 응답의 next_cursor (첫 페이지는 생략)
+    - page_size: 한 페이지 게시글 수 (기본 20, 최대 100)
     """
-    # 정렬 파라미터 가져오기
+    # 정렬 파라미터 가져오기 (알 수 없는 값은 최신순)
     sort_by = request.GET.get('sort', 'latest')
-    
-    # 기본 쿼리셋
-    posts = Post.objects.select_related('user').prefetch_related('tags')
-    
-    # 정렬 적용
-    if sort_by == 'latest':
-        posts = posts.order_by('-created_at')
-    elif sort_by == 'popular':
-        posts = posts.annotate(
-            like_count_field=Count('like_users')
-        ).order_by('-like_count_field', '-created_at')
-    elif sort_by == 'comments':
-        posts = posts.annotate(
-            comment_count_field=Count('comment')
-        ).order_by('-comment_count_field', '-created_at')
-    else:
-        # 기본값은 최신순
-        posts = posts.order_by('-created_at')
-    
-    serializer = PostListSerializer(posts, many=True)
-    return Response(serializer.data)
+    ordering = POST_LIST_ORDERINGS.get(sort_by, POST_LIST_ORDERINGS['latest'])
+
+    # 기본 쿼리셋 - 좋아요/댓글 수는 페이지 쿼리에서 함께 계산, 정렬 키는 커서용으로 함께 읽음
+    posts = PostListRowSerializer.values(with_counts(Post.objects.all()), *ordering)
+
+    try:
+        page, next_cursor = paginate_keyset(
+            posts, ordering, request.GET.get('cursor'), get_page_size(request)
+        )
+    except InvalidCursor:
+        return Response({'error': '잘못된 커서입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    return Response({
+        'posts': PostListRowSerializer(page).data,
+        'next_cursor': next_cursor,
+    })
+
+def _post_version(request, post_id):
+    """
+    post_detail 응답을 결정하는 값 - 게시글/댓글 변경 시각과 카운터, 요청 사용자의 좋아요
+
+    조회수는 버퍼에서 주기적으로 반영되므로 넣지 않는다 (weak ETag - cinemamemory.conditional)
+    """
+    viewer = viewer_id(request)
+    comments = Comment.objects.all()
+    liked_comments = Comment.like_users.through.objects.filter(user_id=viewer)
+    row = Post.objects.filter(pk=post_id).annotate(
+        comment_total=related_count(comments, 'post_id'),
+        comments_updated=related_max(comments, 'post_id', 'updated_at'),
+        comment_likes=related_sum(comments, 'post_id', 'like_count'),
+        viewer_liked=Exists(Post.like_users.through.objects.filter(post_id=OuterRef('pk'), user_id=viewer)),
+        viewer_comment_likes=related_count(liked_comments, 'comment__post_id'),
+    ).values_list(
+        'updated_at', 'like_count', 'user__username',
+        'comment_total', 'comments_updated', 'comment_likes', 'viewer_liked', 'viewer_comment_likes',
+    ).first()
+    return None if row is None else (viewer, *row)
+
+
+def _record_view(request, post_id):
+    view_counter.record(post_id, viewer_key(request))
+
 
 @api_view(['GET', 'PUT', 'DELETE'])
+@conditional_view(_post_version, on_not_modified=_record_view)
 def post_detail(request, post_id):
     """
     포스트 상세 조회 API
     """
     try:
         if request.method == 'GET':
-            post = Post.objects.select_related('user').prefetch_related(
-                'tags', 
-                'like_users',
-                'comment_set__user',  # 댓글과 댓글 작성자
-                'comment_set__replies__user'  # 대댓글과 대댓글 작성자
-            ).get(id=post_id)
+            # 댓글 트리는 PostSerializer.get_comments에서 한 번에 조회
+            post = Post.objects.select_related('user').prefetch_related('tags').get(id=post_id)
+            # 조회수는 메모리에 모았다가 주기적으로 한 번에 반영
+            view_counter.record(post.id, viewer_key(request))
             serializer = PostSerializer(post, context={'request': request})
             return Response(serializer.data)
         elif request.method == 'PUT':
@@ -126,6 +178,8 @@ def create_comment(request, post_id):
         serializer = CommentSerializer(data=request.data, context={'request': request})
         if serializer.is_valid():
             comment = serializer.save(post=post, user=request.user)
+            publish_post_event(post.id, 'comment_created', comment_event_data(comment, request.user))
+            notify(post.user_id, 'comment', request.user.id, target_id=post.id, post_id=post.id)
             
             # 작성자 정보를 포함한 응답 생성
             response_data = {
@@ -147,6 +201,34 @@ def create_comment(request, post_id):
             status=status.HTTP_404_NOT_FOUND
         )
 
+@api_view(['GET'])
+@permission_classes([])  # 인증 불필요 명시
+def comment_list(request, post_id):
+    """
+    댓글 목록 API - 최상위 댓글 커서 페이지네이션 (긴 스레드용)
+
+    쿼리 파라미터:
+    - cursor: 이전 응답의 next_cursor (첫 페이지는 생략)
+    - page_size: 한 페이지 최상위 댓글 수 (기본 20, 최대 100)
+    """
+    if not Post.objects.filter(id=post_id).exists():
+        return Response(
+            {'error': '포스트를 찾을 수 없습니다.'}, 
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    try:
+        comments, next_cursor = build_comment_page(
+            post_id, request.user, request.GET.get('cursor'), get_page_size(request)
+        )
+    except InvalidCursor:
+        return Response({'error': '잘못된 커서입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    return Response({
+        'comments': comments,
+        'next_cursor': next_cursor,
+    })
+
 @api_view(['GET', 'PUT', 'DELETE'])
 @permission_classes([IsAuthenticated])
 def comment_detail(request, post_id, comment_id):
@@ -216,38 +298,17 @@ def toggle_comment_like(request, post_id, comment_id):
     댓글 좋아요 토글 API
     """
     try:
-        post = Post.objects.get(id=post_id)
-        comment = Comment.objects.get(id=comment_id, post=post)
-        
-        # 좋아요 상태 확인
-        is_liked_before = comment.like_users.filter(id=request.user.id).exists()
-        
-        if is_liked_before:
-            # 좋아요 취소
-            comment.like_users.remove(request.user)
-            is_liked_after = False
-            message = '댓글 좋아요가 취소되었습니다.'
-        else:
-            # 좋아요 추가
-            comment.like_users.add(request.user)
-            is_liked_after = True
-            message = '댓글 좋아요가 추가되었습니다.'
-        
-        # 최신 좋아요 수 계산
-        like_count = comment.like_users.count()
+        # 좋아요 추가/취소와 좋아요 수 갱신을 한 트랜잭션에서 처리
+        is_liked_after, like_count = likes.toggle_comment_like(comment_id, request.user.id, post_id)
+        message = '댓글 좋아요가 추가되었습니다.' if is_liked_after else '댓글 좋아요가 취소되었습니다.'
         
         return Response({
             'message': message,
             'is_liked': is_liked_after,
             'like_count': like_count,
-            'comment_id': comment.id
+            'comment_id': comment_id
         }, status=status.HTTP_200_OK)
         
-    except Post.DoesNotExist:
-        return Response(
-            {'error': '포스트를 찾을 수 없습니다.'}, 
-            status=status.HTTP_404_NOT_FOUND
-        )
     except Comment.DoesNotExist:
         return Response(
             {'error': '댓글을 찾을 수 없습니다.'}, 
@@ -270,6 +331,8 @@ def create_reply(request, post_id, comment_id):
         serializer = CommentSerializer(data=request.data, context={'request': request})
         if serializer.is_valid():
             reply = serializer.save(post=post, user=request.user, parent=parent_comment)
+            publish_post_event(post.id, 'reply_created', comment_event_data(reply, request.user))
+            notify(parent_comment.user_id, 'reply', request.user.id, target_id=parent_comment.id, post_id=post.id)
             
             # 작성자 정보를 포함한 응답 생성
             response_data = {
@@ -353,31 +416,16 @@ def toggle_like(request, post_id):
 
     
     try:
-        post = Post.objects.get(id=post_id)
-        
-        # 좋아요 상태 확인
-        is_liked_before = post.like_users.filter(id=request.user.id).exists()
-        
-        if is_liked_before:
-            # 좋아요 취소
-            post.like_users.remove(request.user)
-            is_liked_after = False
-            message = '좋아요가 취소되었습니다.'
-        else:
-            # 좋아요 추가
-            post.like_users.add(request.user)
-            is_liked_after = True
-            message = '좋아요가 추가되었습니다.'
-        
-        # 최신 좋아요 수 계산
-        like_count = post.like_users.count()
+        # 좋아요 추가/취소와 좋아요 수 갱신을 한 트랜잭션에서 처리
+        is_liked_after, like_count = likes.toggle_post_like(post_id, request.user.id)
+        message = '좋아요가 추가되었습니다.' if is_liked_after else '좋아요가 취소되었습니다.'
         
         # 일관된 응답 구조 반환
         return Response({
             'message': message,
             'is_liked': is_liked_after,
             'like_count': like_count,
-            'post_id': post.id
+            'post_id': post_id
         }, status=status.HTTP_200_OK)
         
     except Post.DoesNotExist:
@@ -388,22 +436,16 @@ def toggle_like(request, post_id):
         
 @api_view(['GET'])
 @permission_classes([])
+@cached_view('tag:*')
+@read_replica
 def tag_list(request):
     try:
-        tags = Tag.objects.annotate(
-            post_count=Count('post')
-        ).filter(
-            post_count__gt=0
-        ).order_by('-post_count', 'name')
-        
-        # 태그 데이터 직렬화
-        tag_data = []
-        for tag in tags:
-            tag_data.append({
-                'id': tag.id,
-                'name': tag.name,
-                'post_count': tag.post_count
-            })
+        # 저장된 post_count 인덱스 순서로 읽음
+        tag_data = list(
+            Tag.objects.filter(post_count__gt=0)
+            .order_by('-post_count', 'name')
+            .values('id', 'name', 'post_count')
+        )
         
         return Response(tag_data, status=status.HTTP_200_OK)
         
@@ -413,9 +455,41 @@ def tag_list(request):
             status=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+@api_view(['GET'])
+@permission_classes([])  # 인증 불필요
+def search_community(request):
+    """
+    게시글/댓글 검색 API - 관련도순 커서 페이지네이션
+
+    쿼리 파라미터:
+    - q: 검색어
+    - type: post / comment (생략 시 전체)
+    - cursor: 이전 응답의 next_cursor (첫 페이지는 생략)
+    - page_size: 한 페이지 결과 수 (기본 20, 최대 100)
+    """
+    query = request.GET.get('q', '').strip()
+    if not query:
+        return Response({'error': '검색어를 입력해주세요.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    kind = request.GET.get('type')
+    if kind not in (None, 'post', 'comment'):
+        return Response({'error': 'type은 post 또는 comment 입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    try:
+        results, next_cursor = search(query, kind, request.GET.get('cursor'), get_page_size(request))
+    except InvalidCursor:
+        return Response({'error': '잘못된 커서입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    return Response({
+        'results': results,
+        'next_cursor': next_cursor,
+    })
+
 # 특정 태그의 게시글 조회
 @api_view(['GET'])
 @permission_classes([])  # 인증 불필요
+@cached_view('tag:*', 'post:*')
+@read_replica
 def posts_by_tag(request, tag_name):
     """
     특정 태그가 포함된 게시글 목록 조회 API
@@ -423,7 +497,7 @@ def posts_by_tag(request, tag_name):
     try:
         # 태그 이름으로 태그 찾기
         try:
-            tag = Tag.objects.get(name=tag_name)
+            tag = Tag.objects.get(name=normalize_tag_name(tag_name))
         except Tag.DoesNotExist:
             return Response(
                 {'error': f'"{tag_name}" 태그를 찾을 수 없습니다.'}, 
@@ -431,18 +505,16 @@ def posts_by_tag(request, tag_name):
             )
         
         # 해당 태그가 포함된 게시글들 조회 (최신순)
-        posts = Post.objects.filter(
-            tags=tag
-        ).select_related('user').prefetch_related('tags', 'like_users').order_by('-created_at')
+        posts = with_counts(Post.objects.filter(tags=tag)).order_by('-created_at')
         
-        # PostListSerializer 사용해서 직렬화
-        serializer = PostListSerializer(posts, many=True)
+        # PostListSerializer와 같은 출력을 values() 행에서 직렬화
+        serializer = PostListRowSerializer(PostListRowSerializer.values(posts))
         
         # 응답 데이터 구성
         response_data = {
             'tag': {
                 'name': tag.name,
-                'post_count': posts.count()
+                'post_count': tag.post_count
             },
             'posts': serializer.data
         }
@@ -459,92 +531,15 @@ User = get_user_model()
 
 @api_view(['GET'])
 @permission_classes([])
+@read_replica
 def community_stats(request):
     """
-    커뮤니티 통계 API
+    커뮤니티 통계 API - 신호로 갱신되는 스냅샷에서 응답 (posts.stats 참고)
     """
     try:
-        # 가입 회원 수
-        total_users = User.objects.count()
-        
-        # 오늘 가입한 회원 수
-        today = datetime.now().date()
-        today_users = User.objects.filter(date_joined__date=today).count()
-        
-        # 전체 게시글 수
-        total_posts = Post.objects.count()
-        
-        # 오늘 작성된 게시글 수
-        today_posts = Post.objects.filter(created_at__date=today).count()
-        
-        # 전체 댓글 수
-        total_comments = Comment.objects.count()
-        
-        # 오늘 작성된 댓글 수
-        today_comments = Comment.objects.filter(created_at__date=today).count()
-        
-        # 최신 게시글 5개
-        recent_posts = Post.objects.select_related('user').order_by('-created_at')[:5]
-        recent_posts_data = []
-        for post in recent_posts:
-            recent_posts_data.append({
-                'id': post.id,
-                'title': post.title[:30] + '...' if len(post.title) > 30 else post.title,
-                'author': post.user.username,
-                'created_at': post.created_at.isoformat(),
-                'comment_count': post.comment_set.count(),
-                'like_count': post.like_users.count()
-            })
-        
-        # 최신 댓글 5개
-        recent_comments = Comment.objects.select_related('user', 'post').order_by('-created_at')[:5]
-        recent_comments_data = []
-        for comment in recent_comments:
-            recent_comments_data.append({
-                'id': comment.id,
-                'content': comment.content[:50] + '...' if len(comment.content) > 50 else comment.content,
-                'author': comment.user.username,
-                'post_title': comment.post.title[:20] + '...' if len(comment.post.title) > 20 else comment.post.title,
-                'post_id': comment.post.id,
-                'created_at': comment.created_at.isoformat()
-            })
-        
-        # 인기 태그 10개 (게시글 수 기준)
-        popular_tags = Tag.objects.annotate(
-            post_count=Count('post')
-        ).filter(post_count__gt=0).order_by('-post_count')[:10]
-        
-        popular_tags_data = []
-        for tag in popular_tags:
-            popular_tags_data.append({
-                'id': tag.id,
-                'name': tag.name,
-                'post_count': tag.post_count
-            })
-        
-        # 응답 데이터 구성
-        stats_data = {
-            'users': {
-                'total': total_users,
-                'today': today_users
-            },
-            'posts': {
-                'total': total_posts,
-                'today': today_posts
-            },
-            'comments': {
-                'total': total_comments,
-                'today': today_comments
-            },
-            'recent_posts': recent_posts_data,
-            'recent_comments': recent_comments_data,
-            'popular_tags': popular_tags_data,
-            'last_updated': datetime.now().isoformat()
-        }
-        
         return Response({
             'status': 'success',
-            'data': stats_data
+            'data': community_snapshot.snapshot()
         }, status=status.HTTP_200_OK)
     
     except Exception as e:
@@ -556,54 +551,91 @@ def community_stats(request):
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def user_posts(request):
-    """사용자가 작성한 게시글 목록"""
+    """
+    사용자가 작성한 게시글 목록 - 커서 페이지네이션
+
+    쿼리 파라미터:
+    - cursor / page_size: 커서 페이지네이션 (기본 20, 최대 100)
+    - stream=ndjson: 전체 목록을 한 줄에 하나씩 스트리밍
+    """
+    posts = PostListRowSerializer.values(with_counts(Post.objects.filter(user=request.user)))
+
+    if wants_stream(request):
+        rows = posts.order_by('-created_at', '-id').iterator(chunk_size=STREAM_CHUNK_SIZE)
+        return ndjson_response(PostListRowSerializer.stream(rows))
+
     try:
-        user_posts = Post.objects.filter(user=request.user).select_related('user').prefetch_related('tags', 'like_users').order_by('-created_at')
-        serializer = PostListSerializer(user_posts, many=True)
-        return Response({
-            'posts': serializer.data,
-            'count': user_posts.count()
-        })
-    except Exception as e:
-        return Response({'error': '데이터를 불러올 수 없습니다.'}, status=500)
+        page, next_cursor = paginate_keyset(
+            posts, ('created_at', 'id'), request.GET.get('cursor'), get_page_size(request)
+        )
+    except InvalidCursor:
+        return Response({'error': '잘못된 커서입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    return Response({
+        'posts': PostListRowSerializer(page).data,
+        'count': Post.objects.filter(user=request.user).count(),
+        'next_cursor': next_cursor,
+    })
+
+def _user_comment_data(comment):
+    return {
+        'id': comment.id,
+        'content': comment.content,
+        'created_at': comment.created_at,
+        'updated_at': comment.updated_at,
+        'like_count': comment.like_count,
+        'post': {
+            'id': comment.post.id,
+            'title': comment.post.title,
+            'created_at': comment.post.created_at
+        },
+        'parent_id': comment.parent_id
+    }
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def user_comments(request):
-    """사용자가 작성한 댓글 목록"""
+    """
+    사용자가 작성한 댓글 목록 - 커서 페이지네이션
+
+    쿼리 파라미터:
+    - cursor / page_size: 커서 페이지네이션 (기본 20, 최대 100)
+    - stream=ndjson: 전체 목록을 한 줄에 하나씩 스트리밍
+    """
+    # 좋아요 수는 like_count 컬럼, 부모 댓글은 parent_id만 사용 (댓글마다 추가 쿼리 없음)
+    comments = (
+        Comment.objects.filter(user=request.user)
+        .select_related('post')
+        .only('id', 'content', 'created_at', 'updated_at', 'parent_id', 'like_count',
+              'post__id', 'post__title', 'post__created_at')
+    )
+
+    if wants_stream(request):
+        rows = comments.order_by('-created_at', '-id').iterator(chunk_size=STREAM_CHUNK_SIZE)
+        return ndjson_response(_user_comment_data(comment) for comment in rows)
+
     try:
-        user_comments = Comment.objects.filter(user=request.user).select_related('user', 'post').order_by('-created_at')
-        
-        comments_data = []
-        for comment in user_comments:
-            comments_data.append({
-                'id': comment.id,
-                'content': comment.content,
-                'created_at': comment.created_at,
-                'updated_at': comment.updated_at,
-                'like_count': comment.like_users.count(),
-                'post': {
-                    'id': comment.post.id,
-                    'title': comment.post.title,
-                    'created_at': comment.post.created_at
-                },
-                'parent_id': comment.parent.id if comment.parent else None
-            })
-            
-        return Response({
-            'comments': comments_data,
-            'count': len(comments_data)
-        })
-    except Exception as e:
-        return Response({'error': '데이터를 불러올 수 없습니다.'}, status=500)
+        page, next_cursor = paginate_keyset(
+            comments, ('created_at', 'id'), request.GET.get('cursor'), get_page_size(request)
+        )
+    except InvalidCursor:
+        return Response({'error': '잘못된 커서입니다.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    return Response({
+        'comments': [_user_comment_data(comment) for comment in page],
+        'count': Comment.objects.filter(user=request.user).count(),
+        'next_cursor': next_cursor,
+    })
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
 def user_liked_posts(request):
     """사용자가 좋아요한 게시글 목록"""
     try:
-        liked_posts = request.user.liked_posts.all().select_related('user').prefetch_related('tags', 'like_users').order_by('-created_at')
-        serializer = PostListSerializer(liked_posts, many=True)
+        liked_posts = PostListRowSerializer.values(
+            with_counts(request.user.liked_posts.all()).order_by('-created_at')
+        )
+        serializer = PostListRowSerializer(liked_posts)
         return Response({
             'liked_posts': serializer.data,
             'count': liked_posts.count()